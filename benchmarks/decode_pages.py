@@ -0,0 +1,66 @@
+"""Measures the time taken to decode a page with all the property types.
+
+Compares the ISO 8601 fast path of `parse_datetime` against decoding with
+the `dateutil` parser that was used previously. The memo cache is cleared
+before every page so that the numbers aren't skewed by every page having
+the same timestamps.
+
+Usage:
+    poetry run python benchmarks/decode_pages.py [number-of-pages]
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from unittest import mock
+
+from dateutil.parser import parse
+
+from nopy.objects.page import Page
+from nopy.timestamps import parse_datetime
+
+PAGE_FP = Path(__file__).parents[1] / "tests" / "data" / "full-page.json"
+PATCH_TARGETS = (
+    "nopy.utils.parse_datetime",
+    "nopy.props.common.parse_datetime",
+    "nopy.props.page_props.parse_datetime",
+)
+
+
+def decode(page: dict[str, Any]):
+
+    parse_datetime.cache_clear()
+    Page.from_dict(page)
+
+
+def per_page(func: Callable[[], Any], number: int) -> float:
+
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main(number: int):
+
+    with open(PAGE_FP, "r") as f:
+        page = json.load(f)
+
+    fast = per_page(lambda: decode(page), number)
+
+    patches = [mock.patch(target, parse) for target in PATCH_TARGETS]
+    for patch in patches:
+        patch.start()
+    try:
+        slow = per_page(lambda: decode(page), number)
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    print(f"dateutil:       {slow * 1e6:8.1f} us/page")
+    print(f"parse_datetime: {fast * 1e6:8.1f} us/page")
+    print(f"speedup:        {slow / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
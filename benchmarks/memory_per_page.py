@@ -0,0 +1,49 @@
+"""Measures the memory retained per decoded page.
+
+Decodes a page with all the property types many times, keeps all the
+pages alive like a large result set held for reporting would, and
+reports the memory retained per page as traced by `tracemalloc`. Each
+page is decoded from its own copy of the JSON, which is dropped right
+after, so that nothing but the interned users and parents is shared
+between the pages.
+
+Usage:
+    poetry run python benchmarks/memory_per_page.py [number-of-pages]
+"""
+
+import copy
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+from nopy.identity import IdentityMap
+from nopy.objects.page import Page
+
+PAGE_FP = Path(__file__).parents[1] / "tests" / "data" / "full-page.json"
+
+
+def main(number: int):
+
+    with open(PAGE_FP, "r") as f:
+        page = json.load(f)
+    identity_map = IdentityMap()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pages = [
+        Page.from_dict(copy.deepcopy(page), identity_map=identity_map)
+        for _ in range(number)
+    ]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"pages:    {len(pages)}")
+    print(f"per page: {(after - before) / number:8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
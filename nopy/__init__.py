@@ -1,5 +1,14 @@
 # flake8: noqa
 
+# The objects have to be imported before anything that imports the props
+# since `nopy.props` depends on `nopy.objects.user` which in turn imports
+# all the objects, which depend on the props.
+from . import objects
+from .async_client import AsyncNotionClient
+from .cache import CachePolicy
+from .cache import QueryCachePolicy
 from .client import ClientConfig
 from .client import NotionClient
+from .json_codec import JSONCodec
 from .properties import Properties
+from .retry import RetryPolicy
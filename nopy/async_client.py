@@ -0,0 +1,817 @@
+import asyncio
+from datetime import datetime
+from datetime import timezone
+from types import TracebackType
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+import httpx
+
+from nopy.batch import BatchResult
+from nopy.batch import PageUpdate
+from nopy.batch import coalesce_updates
+from nopy.batch import run_abatch
+from nopy.client import BaseClient
+from nopy.client import _as_is
+from nopy.columnar import QueryResult
+from nopy.constants import APIEndpoints
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.objects.user import Bot
+from nopy.objects.user import User
+from nopy.query import partition_by_created_time
+from nopy.schema import Schema
+from nopy.streaming import AsyncStreamedResponse
+from nopy.utils import apaginate
+from nopy.utils import apaginate_partitions
+from nopy.values import Row
+
+
+class AsyncNotionClient(BaseClient):
+    """The asynchronous client that can be used to interact with the
+    Notion API from within an event loop.
+
+    It has the same methods as the `NotionClient` except that they
+    have to be awaited and the methods that paginate return asynchronous
+    generators which are to be used with `async for`.
+
+    Notion objects returned by this client are bound to it and so,
+    methods such as `Page.update` or `Database.query` return awaitables
+    and asynchronous generators respectively.
+    """
+
+    # ------ Database related endpoints ------
+
+    async def retrieve_db(self, db_id: str) -> Database:
+        """Retreives the database.
+
+        Attributes:
+            db_id: The id of the database to retrieve.
+
+        Returns:
+            A `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving database {db_id}")
+        endpoint = APIEndpoints.DB_RETRIEVE.value.format(db_id)
+        db_dict = await self._retrieve(endpoint, "database", db_id)
+
+        db = Database.from_dict(
+            db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        db.set_client(self)
+        return db
+
+    async def get_schema(self, db_id: str, refresh: bool = False) -> Schema:
+        """Gets the schema of the database, retrieving the database only if
+        its schema isn't already cached.
+
+        NOTE: The database of the schema is shared by everyone using the
+        schema and so it must NOT be modified.
+
+        Attributes:
+            db_id: The id of the database.
+            refresh:
+                If `True`, the database is retrieved again even if its
+                schema is cached.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        schema = None if refresh else self.schemas.get(db_id)
+        if schema is None:
+            if refresh:
+                self._invalidate("database", db_id)
+            # The database is retrieved for the schema alone so that the
+            # databases returned by `retrieve_db` aren't shared.
+            schema = self.schemas.set(await self.retrieve_db(db_id))
+        return schema
+
+    def query_db(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        as_tuples: bool = False,
+        stream: bool = False,
+        use_schema: bool = False,
+        raw: bool = False,
+        use_cache: bool = True,
+    ) -> AsyncGenerator[Union[Page, Row], None]:
+        """Query a database.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+                If 0, the next batch is only fetched once the current
+                one is consumed.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            fields:
+                The names or the ids of the properties to project the
+                pages onto. If provided, the values of these properties are
+                extracted as plain Python values without creating any
+                `Page` instances. See `nopy.values.extract_value`.
+            as_tuples:
+                If `True`, the projected values are returned as tuples in
+                the order of the `fields` instead of as dictionaries.
+            stream:
+                If `True`, the pages are decoded and yielded as each
+                response is being received instead of after it has been
+                received in full.
+            use_schema:
+                If `True`, the schema of the database is used to resolve
+                the filters of the query by the names of the properties.
+                See `get_schema`.
+            raw:
+                If `True`, the pages are returned as dictionaries in the
+                Notion format without decoding them. The dictionaries
+                shouldn't be modified when the results are cached.
+            use_cache:
+                If `False`, the results are always fetched from Notion, and
+                aren't cached, even if the results of queries are cached.
+
+        If the results of queries are cached with `ClientConfig.query_cache`,
+        the results of an identical query made within the time to live are
+        returned without querying Notion. The queries that are streamed
+        aren't cached.
+
+        Returns:
+            An asynchronous generator that yields a single `Page` instance
+            at a time, or a single projected page if `fields` is provided,
+            or a single page in the Notion format if `raw` is `True`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        kwargs: dict[str, Any] = {
+            "max_pages": max_pages,
+            "page_size": page_size,
+            "prefetch": prefetch,
+            "lazy": lazy,
+            "fields": fields,
+            "as_tuples": as_tuples,
+            "stream": stream,
+            "raw": raw,
+            "use_cache": use_cache,
+        }
+        if use_schema:
+            # The schema can only be awaited once the pages are iterated.
+            return self._query_db_with_schema(db_id, query, kwargs)
+
+        map_func, map_args = self._page_mapper(lazy, fields, as_tuples, raw)
+        if self.query_cache is not None and use_cache and not stream:
+            return self._query_db_cached(
+                db_id,
+                query,
+                map_func,
+                map_args,
+                max_pages=max_pages,
+                page_size=page_size,
+                prefetch=prefetch,
+            )
+
+        return apaginate(
+            self._query_db_raw,  # type: ignore
+            map_func,
+            max_pages=max_pages,
+            db_id=db_id,
+            client=self,
+            query=query,
+            page_size=page_size,
+            prefetch=prefetch,
+            map_args=map_args,
+            stream=stream,
+        )
+
+    async def scan_db(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        partitions: int = 4,
+        max_pages: int = 0,
+        page_size: int = 100,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        as_tuples: bool = False,
+    ) -> AsyncGenerator[Union[Page, Row], None]:
+        """Query a database by splitting it into partitions which are
+        paginated concurrently.
+
+        This works the same as `NotionClient.scan_db` except that the
+        partitions are paginated by tasks instead of threads.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            partitions: The number of partitions to split the database into.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            start:
+                The time from which the partitions are split. If not
+                provided, the time the database was created is used which
+                requires retrieving the database.
+            end:
+                The time up to which the partitions are split. If not
+                provided, the current time is used.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            fields:
+                The names or the ids of the properties to project the
+                pages onto. If provided, the values of these properties are
+                extracted as plain Python values without creating any
+                `Page` instances. See `nopy.values.extract_value`.
+            as_tuples:
+                If `True`, the projected values are returned as tuples in
+                the order of the `fields` instead of as dictionaries.
+
+        Returns:
+            An asynchronous generator that yields a single `Page` instance
+            at a time, or a single projected page if `fields` is provided.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        if start is None:
+            db = await self.retrieve_db(db_id)
+            start = db.created_time or datetime.now(timezone.utc)
+
+        map_func, map_args = self._page_mapper(lazy, fields, as_tuples, False)
+        pages = apaginate_partitions(
+            self._query_db_raw,  # type: ignore
+            map_func,
+            partition_by_created_time(query, partitions, start, end),
+            max_pages=max_pages,
+            map_args=map_args,
+            client=self,
+            db_id=db_id,
+            page_size=page_size,
+        )
+        async for page in pages:
+            yield page
+
+    async def query_db_columns(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        use_numpy: Optional[bool] = None,
+    ) -> QueryResult:
+        """Query a database and store the results as one column per
+        property.
+
+        The pages aren't decoded into `Page` instances. Instead, the values
+        of each property are stored together in a `Column`, where numbers,
+        checkboxes, dates and options are stored in typed arrays.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            fields:
+                The names of the properties to create columns for. If not
+                provided, all the properties are used.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead while the
+                current batch is being consumed.
+            use_numpy:
+                Whether to store the typed columns as NumPy arrays. By
+                default, NumPy is used if it's installed.
+
+        Returns:
+            The `QueryResult` holding the columns.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        pages = apaginate(
+            self._query_db_raw,  # type: ignore
+            _as_is,
+            max_pages=max_pages,
+            db_id=db_id,
+            query=query,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+        return await QueryResult.afrom_pages(pages, fields, use_numpy)
+
+    async def create_db(self, db: dict[str, Any]) -> Database:
+        """Creates a database.
+
+        Attributes:
+            db: The database as a dictionary in the Notion format.
+
+        Returns:
+            The newly created `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        new_db_dict = await self._make_request(APIEndpoints.DB_CREATE.value, "POST", db)
+        new_db = Database.from_dict(
+            new_db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        new_db.set_client(self)
+        return new_db
+
+    async def update_db(self, db_id: str, db: dict[str, Any]) -> Database:
+        """Updates the given database.
+
+        Attributes:
+            db_id: The database id.
+            db: The database as a dictionary in the Notion format.
+
+        Returns:
+            The updated `Database` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Updating '{db_id}' database")
+        endpoint = APIEndpoints.DB_UPDATE.value.format(db_id)
+        updated_db_dict = await self._make_request(endpoint, "PATCH", db)
+        self._invalidate("database", db_id)
+        self.schemas.invalidate(db_id)
+        if self.query_cache is not None:
+            self.query_cache.invalidate(db_id)
+        updated_db = Database.from_dict(
+            updated_db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        updated_db.set_client(self)
+        return updated_db
+
+    # ----- Page related endpoints -----
+
+    async def retrieve_page(self, page_id: str) -> Page:
+        """Retrieves a page.
+
+        Attributes:
+            page_id: The id of the page to retrieve.
+
+        Returns:
+            An instance of `Page`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving page {page_id}")
+        endpoint = APIEndpoints.PAGE_RETRIEVE.value.format(page_id)
+        page_dict = await self._retrieve(endpoint, "page", page_id)
+        page = Page.from_dict(
+            page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        page.set_client(self)
+        return page
+
+    async def retrieve_page_property(self, page_id: str, prop_id: str) -> Any:
+        """Retrieves the page property.
+
+        Attributes:
+            page_id: The page id.
+            prop_id: The property id.
+
+        Returns:
+            The raw dictionary as returned by Notion.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        endpoint = APIEndpoints.PAGE_PROP.value.format(page_id, prop_id)
+        return await self._make_request(endpoint)
+
+    async def create_page(self, page: dict[str, Any]) -> Page:
+        """Creates a new page.
+
+        Attributes:
+            page: The page as a dictionary in the Notion format.
+
+        Returns:
+            The newly created `Page` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        new_page_dict = await self._make_request(
+            APIEndpoints.PAGE_CREATE.value, "post", page
+        )
+        self._invalidate_queries(new_page_dict)
+        new_page = Page.from_dict(
+            new_page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        new_page.set_client(self)
+        return new_page
+
+    async def create_pages(
+        self, pages: Iterable[Union[Page, dict[str, Any]]], concurrency: int = 3
+    ) -> list[BatchResult[Page]]:
+        """Creates many pages concurrently.
+
+        Attributes:
+            pages:
+                The pages to create as `Page` instances or as dictionaries
+                in the Notion format.
+            concurrency: The maximum number of pages created at once.
+
+        Returns:
+            A `BatchResult` for each page in the same order as the input.
+            If creating a page failed, the error is set on its result
+            instead of being raised.
+        """
+
+        async def create(page: Union[Page, dict[str, Any]]) -> Page:
+            if isinstance(page, Page):
+                page = page.serialize()
+            return await self.create_page(page)
+
+        return await run_abatch(create, pages, concurrency)
+
+    async def update_page(self, page_id: str, page: dict[str, Any]) -> Page:
+        """Updates a page.
+
+        Attributes:
+            page_id: The page id.
+            page: The page as a dictionary in the Notion format.
+
+        Returns:
+            The updated `Page` instance.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        endpoint = APIEndpoints.PAGE_UPDATE.value.format(page_id)
+        page_dict = await self._make_request(endpoint, "PATCH", page)
+        self._invalidate("page", page_id)
+        self._invalidate_queries(page_dict)
+        updated_page = Page.from_dict(
+            page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        updated_page.set_client(self)
+        return updated_page
+
+    async def update_pages(
+        self, updates: Iterable[PageUpdate], concurrency: int = 3
+    ) -> dict[str, BatchResult[Page]]:
+        """Updates the properties of many pages concurrently.
+
+        The updates are consumed before any request is made and all the
+        updates to the same page are merged into a single request. If the
+        same property is updated more than once, the last update wins.
+
+        Attributes:
+            updates:
+                Pairs of a page id and the properties to update keyed by
+                their names or ids. The values are either in the Notion
+                format or property objects.
+            concurrency: The maximum number of pages updated at once.
+
+        Returns:
+            A `BatchResult` for each page keyed by the page id, in the order
+            each page was first updated. If updating a page failed, the
+            error is set on its result instead of being raised.
+        """
+
+        coalesced = coalesce_updates(updates)
+
+        async def update(item: tuple[str, dict[str, Any]]) -> Page:
+            page_id, props = item
+            return await self.update_page(page_id, {"properties": props})
+
+        results = await run_abatch(update, coalesced.items(), concurrency)
+        return dict(zip(coalesced, results))
+
+    # ----- User related endpoints -----
+
+    async def retrieve_user(self, user_id: str) -> User:
+        """Retrieves the user with the given id.
+
+        Attributes:
+            user_id: The id of the user being retrieved.
+
+        Returns:
+            An instance of `User` or one of it's subclasses.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info(f"Retrieving user '{user_id}'")
+        endpoint = APIEndpoints.USER_RETRIEVE.value.format(user_id)
+        user_dict = await self._retrieve(endpoint, "user", user_id)
+        return User.from_dict(user_dict)
+
+    def list_users(self) -> AsyncGenerator[User, None]:
+        """Lists all the users.
+
+        Returns:
+            An asynchronous generator that yields an instance of a `User`
+            or one of it's sbuclasses.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info("Listing users...")
+        return apaginate(self._list_users_raw, User.from_dict)
+
+    async def refresh_users(self, force: bool = True):
+        """Loads the users of the workspace into the directory of the users.
+
+        The asynchronous client can't load the users when they're looked up
+        while decoding, so this must be called to warm the directory and
+        to refresh it once it's stale.
+
+        Attributes:
+            force:
+                If `False`, the users are only loaded if they were never
+                loaded or are older than the time to live.
+
+        Raises:
+            NopyError: Raised when the directory of the users isn't enabled.
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        directory = self._user_directory()
+        if force or directory.stale:
+            directory.update([user async for user in self.list_users()])
+
+    async def retrieve_me(self) -> Bot:
+        """Retrieves the user associated with the given `NOTION_TOKEN`.
+
+        Returns:
+            An instance of `Bot`.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._logger.info("Retreiving 'me'")
+        bot_dict = await self._retrieve(APIEndpoints.USER_TOKEN_BOT.value, "me")
+        return Bot.from_dict(bot_dict)
+
+    # ----- Search -----
+
+    async def search(self) -> dict[str, Any]:
+        raise NotImplementedError()
+
+    # ----- Miscellaneous -----
+    async def close(self):
+        """Closes the client and cleans up all the resources."""
+
+        await self._client.aclose()
+
+    # ----- Private Methods -----
+
+    async def _query_db_cached(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]],
+        map_func: Callable[..., Any],
+        map_args: dict[str, Any],
+        max_pages: int = 0,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+
+        results = self._get_cached_results(db_id, query)
+        if results is not None:
+            cached = {"results": results, "has_more": False, "next_cursor": None}
+
+            async def cached_query_db_raw(**_: Any) -> dict[str, Any]:
+                return cached
+
+            pages = apaginate(
+                cached_query_db_raw, map_func, max_pages, map_args, client=self
+            )
+            async for page in pages:
+                yield page
+            return
+
+        responses: list[dict[str, Any]] = []
+
+        async def query_db_raw(**kwargs: Any) -> dict[str, Any]:
+            resp = await self._query_db_raw(**kwargs)
+            responses.append(resp)  # type: ignore
+            return resp  # type: ignore
+
+        pages = apaginate(
+            query_db_raw,
+            map_func,
+            max_pages,
+            map_args,
+            client=self,
+            db_id=db_id,
+            query=query,
+            **kwargs,
+        )
+        async for page in pages:
+            yield page
+        # Only reached once all the results were consumed.
+        self._cache_results(db_id, query, responses)
+
+    async def _query_db_with_schema(
+        self, db_id: str, query: Optional[dict[str, Any]], kwargs: dict[str, Any]
+    ) -> AsyncGenerator[Union[Page, Row], None]:
+
+        schema = await self.get_schema(db_id)
+        pages = self.query_db(db_id, schema.resolve_filters(query), **kwargs)
+        async for page in pages:
+            yield page
+
+    async def _query_db_raw(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+        stream: bool = False,
+    ) -> Union[dict[str, Any], AsyncStreamedResponse]:
+
+        endpoint, query = self._query_db_args(db_id, query, start_cursor, page_size)
+        if stream:
+            return await self._stream_request(endpoint, "post", data=query)
+        return await self._make_request(endpoint, "post", data=query)
+
+    async def _list_users_raw(self, start_cursor: Optional[str] = None):
+
+        query_params = {"start_cursor": start_cursor} if start_cursor else {}
+        return await self._make_request(
+            APIEndpoints.USER_LIST.value, query_params=query_params
+        )
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        data: Optional[dict[Any, Any]] = None,
+        query_params: Optional[dict[str, str]] = None,
+    ):
+
+        request = self._build_request(endpoint, method, data, query_params)
+        return self._parse_response(await self._send(request))
+
+    async def _retrieve(
+        self, endpoint: str, kind: str, obj_id: str = ""
+    ) -> dict[str, Any]:
+        """Retrieves a single object, going through the cache if enabled."""
+
+        cached = self._get_cached(kind, obj_id)
+        if cached is not None:
+            return cached
+
+        request = self._build_request(endpoint)
+        resp = await self._send(request)
+        result = self._parse_response(resp)
+        if self.cache is not None:
+            self.cache.set(kind, obj_id, resp.content)
+        return result
+
+    async def _stream_request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        data: Optional[dict[Any, Any]] = None,
+        query_params: Optional[dict[str, str]] = None,
+    ) -> AsyncStreamedResponse:
+        """Makes a request for a paginated endpoint whose results are decoded
+        while the response is being received."""
+
+        request = self._build_request(endpoint, method, data, query_params)
+        resp = await self._send(request, stream=True)
+        if not resp.is_success:
+            # The error is in the body so it has to be received in full.
+            try:
+                await resp.aread()
+            finally:
+                await resp.aclose()
+            self._parse_response(resp)
+
+        return AsyncStreamedResponse(resp.aiter_bytes(), resp.aclose, self._json.loads)
+
+    async def _send(
+        self, request: httpx.Request, stream: bool = False
+    ) -> httpx.Response:
+        """Sends the request, retrying it as per the retry policy."""
+
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                await asyncio.sleep(self._rate_limiter.reserve())
+            resp = await self._client.send(request, stream=stream)
+
+            delay = self._get_retry_delay(resp, attempt)
+            if delay is None:
+                return resp
+            if stream:
+                await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _configure_client(self):
+
+        transport = httpx.AsyncHTTPTransport(**self._transport_options())
+        self._client = httpx.AsyncClient(transport=transport, **self._client_options())
+
+    # ----- Context Managers -----
+
+    async def __aenter__(self):
+
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_value: BaseException,
+        traceback: TracebackType,
+    ):
+
+        await self._client.__aexit__(exc_type, exc_value, traceback)
@@ -0,0 +1,136 @@
+"""Helpers to run many API calls with bounded concurrency."""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Generic
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+PageUpdate = Tuple[str, dict[str, Any]]
+"""A page id along with the properties to update, keyed by their names
+or ids. The values are either in the Notion format or property objects."""
+
+# The number of items submitted ahead per thread so that the threads are
+# kept busy without submitting every item of large batches at once.
+_ITEMS_PER_WORKER = 4
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    """The result of a single item of a batch.
+
+    Attributes:
+        index: The position of the item within the input.
+        value: The result of the item, if it succeeded.
+        error: The error raised by the item, if it failed.
+    """
+
+    index: int
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded or not."""
+
+        return self.error is None
+
+
+def run_batch(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> list[BatchResult[R]]:
+    """Calls `func` with each of the items using a pool of `concurrency`
+    threads.
+
+    The items are consumed lazily, with at most a few of them per thread
+    submitted to the pool at a time.
+
+    Returns:
+        The results in the same order as the items. Errors raised for an
+        item, such as by the API or when serializing it, are captured in
+        its result instead of being raised.
+    """
+
+    def call(index: int, item: T) -> BatchResult[R]:
+        try:
+            return BatchResult(index, func(item))
+        except Exception as error:
+            return BatchResult(index, error=error)
+
+    workers = max(concurrency, 1)
+    results: list[BatchResult[R]] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: "deque[Future[BatchResult[R]]]" = deque()
+        for index, item in enumerate(items):
+            # Waiting on the oldest item keeps the results in order.
+            if len(pending) >= workers * _ITEMS_PER_WORKER:
+                results.append(pending.popleft().result())
+            pending.append(executor.submit(call, index, item))
+        results.extend(future.result() for future in pending)
+
+    return results
+
+
+async def run_abatch(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> list[BatchResult[R]]:
+    """The asynchronous counterpart of `run_batch` where at most
+    `concurrency` calls are awaited at the same time."""
+
+    results: list[BatchResult[R]] = []
+    # The workers share the iterator so that the items are consumed lazily.
+    enumerated = enumerate(items)
+
+    async def worker():
+        for index, item in enumerated:
+            try:
+                results.append(BatchResult(index, await func(item)))
+            except Exception as error:
+                results.append(BatchResult(index, error=error))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(concurrency, 1))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        # Only consuming the items or being cancelled can fail a worker, in
+        # which case the other workers are stopped instead of being left
+        # running in the background.
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def coalesce_updates(updates: Iterable[PageUpdate]) -> dict[str, dict[str, Any]]:
+    """Merges the updates to the same page into a single update.
+
+    When the same property of a page is updated more than once, the last
+    update wins. Property objects are serialized into the Notion format.
+
+    Returns:
+        The merged properties keyed by the page id, in the order each page
+        was first updated.
+    """
+
+    coalesced: dict[str, dict[str, Any]] = {}
+    for page_id, props in updates:
+        merged = coalesced.setdefault(page_id, {})
+        for key, value in props.items():
+            if hasattr(value, "serialize"):
+                value = value.serialize()
+            merged[key] = value
+
+    return coalesced
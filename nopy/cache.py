@@ -0,0 +1,305 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+
+from nopy.query import fingerprint
+
+DEFAULT_TTLS: dict[str, float] = {
+    "database": 300.0,
+    "page": 30.0,
+    "user": 3600.0,
+    "me": 3600.0,
+}
+"""The default number of seconds the responses of each kind of endpoint
+are cached for. Schemas and users rarely change while pages do."""
+
+
+@dataclass
+class CacheStats:
+    """The metrics of a cache.
+
+    Attributes:
+        hits: The number of lookups that found a fresh entry.
+        misses: The number of lookups that found no entry or a stale one.
+        evictions:
+            The number of entries evicted to stay within the limits of
+            the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class TTLCache:
+    """A thread safe cache whose entries expire after a time to live and
+    which evicts the least recently used entries to stay within a maximum
+    number of entries and a maximum number of bytes.
+
+    Attributes:
+        max_entries: The maximum number of entries. If 0, there's no limit.
+        max_bytes:
+            The maximum total size of the entries in bytes. If 0, there's
+            no limit.
+        stats: The hits, misses and evictions of the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        # The keys mapped to the expiry time, the size and the value, with
+        # the least recently used first.
+        self._entries: "OrderedDict[Hashable, tuple[float, int, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The total size of the entries in bytes."""
+
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Gets the value of the key if it's cached and hasn't expired."""
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[2]
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int = 0):
+        """Caches the value of the key.
+
+        Attributes:
+            key: The key.
+            value: The value.
+            ttl: The number of seconds the value is cached for.
+            size: The size of the value in bytes.
+        """
+
+        if ttl <= 0 or (self.max_bytes and size > self.max_bytes):
+            self.invalidate(key)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock() + ttl, size, value)
+            self._size += size
+            self._evict()
+
+    def invalidate(self, key: Hashable):
+        """Removes the key from the cache, if it's cached."""
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        """Removes all the keys for which the predicate is true."""
+
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._remove(key)
+
+    def clear(self):
+        """Removes all the entries."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+
+        entry = self._entries.get(key, None)  # type: ignore
+        return entry is not None and entry[0] > self._clock()
+
+    def _remove(self, key: Hashable):
+
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def _evict(self):
+
+        while (self.max_entries and len(self._entries) > self.max_entries) or (
+            self.max_bytes and self._size > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+
+
+@dataclass
+class CachePolicy:
+    """The options of the cache of the responses of the endpoints that
+    retrieve a single object.
+
+    Attributes:
+        ttls:
+            The number of seconds the responses are cached for keyed by the
+            kind of endpoint, which is one of "database", "page", "user" or
+            "me". The kinds that aren't given aren't cached.
+        max_entries: The maximum number of responses cached.
+        max_bytes: The maximum total size of the cached responses in bytes.
+    """
+
+    ttls: dict[str, float] = field(default_factory=lambda: DEFAULT_TTLS.copy())
+    max_entries: int = 1024
+    max_bytes: int = 16 * 1024 * 1024
+
+
+class ResponseCache:
+    """Caches the bodies of the responses of the endpoints that retrieve a
+    single object, such as retrieving a database or a page.
+
+    The bodies are cached as received so that every hit is decoded into
+    new objects, which can be modified without affecting the cache.
+
+    Attributes:
+        policy: The options of the cache.
+    """
+
+    def __init__(self, policy: Optional[CachePolicy] = None):
+
+        self.policy = policy or CachePolicy()
+        self._cache = TTLCache(self.policy.max_entries, self.policy.max_bytes)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hits, misses and evictions of the cache."""
+
+        return self._cache.stats
+
+    def get(self, kind: str, obj_id: str = "") -> Optional[bytes]:
+        """Gets the cached body of the response for the object."""
+
+        if kind not in self.policy.ttls:
+            return None
+        return self._cache.get(_key(kind, obj_id))
+
+    def set(self, kind: str, obj_id: str, body: bytes):
+        """Caches the body of the response for the object."""
+
+        ttl = self.policy.ttls.get(kind, 0)
+        self._cache.set(_key(kind, obj_id), body, ttl, len(body))
+
+    def invalidate(self, kind: str, obj_id: str = ""):
+        """Removes the cached response for the object, if any."""
+
+        self._cache.invalidate(_key(kind, obj_id))
+
+    def clear(self):
+        """Removes all the cached responses."""
+
+        self._cache.clear()
+
+    def __len__(self) -> int:
+
+        return len(self._cache)
+
+
+def _key(kind: str, obj_id: str) -> tuple[str, str]:
+
+    # Notion accepts ids both with and without the dashes.
+    return kind, obj_id.replace("-", "")
+
+
+@dataclass
+class QueryCachePolicy:
+    """The options of the cache of the results of the queries of databases.
+
+    Attributes:
+        ttl: The number of seconds the results of a query are cached for.
+        max_entries: The maximum number of queries whose results are cached.
+        max_bytes: The maximum total size of the cached results in bytes.
+    """
+
+    ttl: float = 30.0
+    max_entries: int = 256
+    max_bytes: int = 64 * 1024 * 1024
+
+
+class QueryCache:
+    """Caches all the results of the queries of databases so that identical
+    queries made within the time to live aren't paginated again.
+
+    The queries are keyed by the database and the fingerprint of the query,
+    see `nopy.query.fingerprint`. The results are cached encoded so that
+    every hit is decoded into new objects.
+
+    Attributes:
+        policy: The options of the cache.
+    """
+
+    def __init__(self, policy: Optional[QueryCachePolicy] = None):
+
+        self.policy = policy or QueryCachePolicy()
+        self._cache = TTLCache(self.policy.max_entries, self.policy.max_bytes)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hits, misses and evictions of the cache."""
+
+        return self._cache.stats
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached results in bytes."""
+
+        return self._cache.size
+
+    def get(self, db_id: str, query: Optional[dict[str, Any]]) -> Optional[bytes]:
+        """Gets the cached results of the query on the database, if any."""
+
+        return self._cache.get(_query_key(db_id, query))
+
+    def set(self, db_id: str, query: Optional[dict[str, Any]], results: bytes):
+        """Caches the encoded results of the query on the database."""
+
+        key = _query_key(db_id, query)
+        self._cache.set(key, results, self.policy.ttl, len(results))
+
+    def invalidate(self, db_id: str):
+        """Removes the cached results of all the queries on the database."""
+
+        db_key = db_id.replace("-", "")
+        self._cache.invalidate_where(lambda key: key[0] == db_key)  # type: ignore
+
+    def clear(self):
+        """Removes all the cached results."""
+
+        self._cache.clear()
+
+    def __len__(self) -> int:
+
+        return len(self._cache)
+
+
+def _query_key(db_id: str, query: Optional[dict[str, Any]]) -> tuple[str, str]:
+
+    return db_id.replace("-", ""), fingerprint(query, db_id)
@@ -1,29 +1,57 @@
 import logging
 import os
+import time
 from dataclasses import dataclass
-from json import JSONDecodeError
-from pprint import pprint
+from datetime import datetime
+from datetime import timezone
+from importlib.util import find_spec
 from types import TracebackType
 from typing import Any
+from typing import Callable
 from typing import Generator
+from typing import Iterable
 from typing import Optional
+from typing import Sequence
 from typing import Type
 from typing import Union
 
 import httpx
 
+from nopy.batch import BatchResult
+from nopy.batch import PageUpdate
+from nopy.batch import coalesce_updates
+from nopy.batch import run_batch
+from nopy.cache import CachePolicy
+from nopy.cache import QueryCache
+from nopy.cache import QueryCachePolicy
+from nopy.cache import ResponseCache
+from nopy.columnar import QueryResult
 from nopy.constants import API_BASE_URL
 from nopy.constants import API_VERSION
 from nopy.constants import APIEndpoints
+from nopy.directory import UserDirectory
 from nopy.errors import APIResponseError
 from nopy.errors import HTTPError
+from nopy.errors import NopyError
 from nopy.errors import TokenNotFoundError
+from nopy.identity import IdentityMap
+from nopy.json_codec import JSONCodec
 from nopy.objects.database import Database
 from nopy.objects.page import Page
 from nopy.objects.user import Bot
 from nopy.objects.user import User
+from nopy.query import partition_by_created_time
+from nopy.ratelimit import RateLimiter
+from nopy.retry import RetryPolicy
+from nopy.retry import RetryStats
+from nopy.schema import Schema
+from nopy.schema import SchemaCache
+from nopy.streaming import StreamedResponse
 from nopy.utils import make_logger
 from nopy.utils import paginate
+from nopy.utils import paginate_partitions
+from nopy.values import Projection
+from nopy.values import Row
 
 
 @dataclass
@@ -36,9 +64,60 @@ class ClientConfig:
         timeout:
             The number of seconds to wait before raising an error.
         retries:
-            The number of retries to make before raising an error.
+            The number of retries to make on connection failures
+            before raising an error.
         log_level: The level of the logging.
         logger: The logger to use when logging.
+        rate_limit:
+            The maximum number of requests per second made by the client.
+            Notion allows an average of 3 requests per second per
+            integration. If `None`, the requests aren't rate limited.
+        rate_limit_burst:
+            The number of requests that can be made at once before the
+            rate limit kicks in.
+        retry_policy:
+            The policy used to retry responses with failing status codes
+            such as 429 or 502. If `None`, such responses are not retried.
+        http2:
+            Whether to use HTTP/2 which multiplexes concurrent requests over
+            a single connection. This requires the `h2` package which can be
+            installed with `pip install httpx[http2]`. If `None`, HTTP/2 is
+            used only if `h2` is installed.
+        max_connections:
+            The maximum number of concurrent connections. If `None`, there
+            is no limit.
+        max_keepalive_connections:
+            The maximum number of idle connections kept alive for reuse. If
+            `None`, there is no limit.
+        keepalive_expiry:
+            The number of seconds an idle connection is kept alive for. If
+            `None`, the connections are kept alive indefinitely.
+        json_codec:
+            The codec, or the name of the codec, used to encode the bodies
+            of the requests and decode the bodies of the responses. One of
+            "orjson", "ujson" or "json". If `None`, orjson or ujson is used
+            if installed and the standard library's `json` otherwise.
+        cache:
+            The options of the cache of the responses when retrieving
+            databases, pages, users and the bot of the token. If `None`,
+            the responses aren't cached.
+        schema_ttl:
+            The number of seconds the schemas of the databases are cached
+            for when querying with `use_schema`. If 0, they aren't cached.
+        user_directory_ttl:
+            The number of seconds the users of the workspace are kept for
+            to resolve the partial users of the decoded objects. If `None`,
+            the partial users aren't resolved. See `nopy.directory`.
+        query_cache:
+            The options of the cache of the results of the queries of
+            databases. If `None`, the results aren't cached.
+        track_in_place_changes:
+            Whether the changes made in place to the decoded pages and
+            databases, such as appending to a list, are sent when updating
+            them. This keeps their properties, titles, icons and covers in
+            the Notion format along with them, which takes about twice the
+            memory. If `False`, the properties changed in place have to be
+            marked with `mark_modified()` to be sent.
     """
 
     base_url: str = API_BASE_URL
@@ -47,10 +126,52 @@ class ClientConfig:
     retries: int = 0
     log_level: int = logging.WARNING
     logger: Optional[logging.Logger] = None
+    rate_limit: Optional[float] = None
+    rate_limit_burst: int = 1
+    retry_policy: Optional[RetryPolicy] = None
+    http2: Optional[bool] = None
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 50
+    keepalive_expiry: Optional[float] = 30.0
+    json_codec: Optional[Union[str, JSONCodec]] = None
+    cache: Optional[CachePolicy] = None
+    schema_ttl: float = 300.0
+    user_directory_ttl: Optional[float] = None
+    query_cache: Optional[QueryCachePolicy] = None
+    track_in_place_changes: bool = False
 
 
-class NotionClient:
-    """The client that can be used to interact with the Notion API."""
+def _as_is(result: dict[str, Any]) -> dict[str, Any]:
+    """Used as the mapping function of the paginations which need the
+    results in the Notion format."""
+
+    return result
+
+
+class BaseClient:
+    """The base from which both the synchronous and the asynchronous
+    clients inherit.
+
+    It handles the configuration, the building of the requests and the
+    parsing of the responses. Actually sending the requests is left to
+    the subclasses.
+
+    Attributes:
+        retry_stats: The metrics of the retries made by the client.
+        identity_map:
+            Interns the users and the parents of the objects decoded by the
+            client so that they're shared instead of duplicated.
+        cache:
+            The cache of the responses when retrieving single objects, if
+            enabled with `ClientConfig.cache`.
+        schemas: The cache of the schemas of the databases.
+        users:
+            The directory of the users of the workspace, if enabled with
+            `ClientConfig.user_directory_ttl`.
+        query_cache:
+            The cache of the results of the queries of databases, if
+            enabled with `ClientConfig.query_cache`.
+    """
 
     def __init__(
         self,
@@ -83,7 +204,244 @@ class NotionClient:
         else:
             self._config = config or ClientConfig()
 
+        self._configure_logger()
+        self._configure_json_codec()
+        self._configure_rate_limiter()
         self._configure_client()
+        self.retry_stats = RetryStats()
+        self.users: Optional[UserDirectory] = None
+        if self._config.user_directory_ttl is not None:
+            ttl = self._config.user_directory_ttl
+            self.users = UserDirectory(self._user_loader(), ttl)
+        self.identity_map = IdentityMap(directory=self.users)
+        self.cache: Optional[ResponseCache] = None
+        if self._config.cache is not None:
+            self.cache = ResponseCache(self._config.cache)
+        self.schemas = SchemaCache(self._config.schema_ttl)
+        self.query_cache: Optional[QueryCache] = None
+        if self._config.query_cache is not None:
+            self.query_cache = QueryCache(self._config.query_cache)
+
+    # ----- Private Methods -----
+
+    def _user_loader(self) -> Optional[Callable[[], Iterable[User]]]:
+        """The loader of the directory of the users. Only synchronous
+        clients can load it when a user is looked up."""
+
+        return None
+
+    def _user_directory(self) -> UserDirectory:
+
+        if self.users is None:
+            msg = "the user directory isn't enabled with 'user_directory_ttl'"
+            raise NopyError(msg)
+        return self.users
+
+    def _query_db_args(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> tuple[str, dict[str, Any]]:
+
+        self._logger.info(f" Querying '{db_id}'")
+
+        # Copying so that the query given can be reused.
+        query = dict(query or {})
+        query["page_size"] = page_size
+        if start_cursor:
+            query["start_cursor"] = start_cursor
+
+        return APIEndpoints.DB_QUERY.value.format(db_id), query
+
+    def _page_mapper(
+        self,
+        lazy: bool,
+        fields: Optional[Sequence[str]],
+        as_tuples: bool,
+        raw: bool,
+    ) -> tuple[Callable[..., Any], dict[str, Any]]:
+        """Gets the callable which maps each page of a query along with the
+        keyword arguments to call it with."""
+
+        if raw:
+            return _as_is, {}
+        if fields is not None:
+            return Projection(fields, as_tuples).project, {}
+
+        return Page.from_dict, {
+            "lazy": lazy,
+            "identity_map": self.identity_map,
+            "track_in_place_changes": self._config.track_in_place_changes,
+        }
+
+    def _build_request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        data: Optional[dict[Any, Any]] = None,
+        query_params: Optional[dict[str, str]] = None,
+    ) -> httpx.Request:
+
+        content, headers = None, None
+        if data is not None:
+            content = self._json.dumps(data)
+            headers = {"Content-Type": "application/json"}
+        request = self._client.build_request(
+            method, endpoint, content=content, headers=headers, params=query_params
+        )
+
+        log_msg = f" {request.method} request to {request.url}"
+        self._logger.info(log_msg)
+        self._logger.debug(f" Data: {data}")
+        self._logger.debug(f" Query Params: {query_params}")
+
+        return request
+
+    def _get_cached(self, kind: str, obj_id: str) -> Optional[dict[str, Any]]:
+        """Gets the cached response for the object, if any."""
+
+        if self.cache is None:
+            return None
+
+        body = self.cache.get(kind, obj_id)
+        if body is None:
+            return None
+        self._logger.info(f" Using the cached response for {kind} {obj_id}")
+        return self._json.loads(body)
+
+    def _invalidate(self, kind: str, obj_id: str):
+        """Removes the cached response for the object after it's updated."""
+
+        if self.cache is not None:
+            self.cache.invalidate(kind, obj_id)
+
+    def _get_cached_results(
+        self, db_id: str, query: Optional[dict[str, Any]]
+    ) -> Optional[list[dict[str, Any]]]:
+        """Gets the cached results of the query on the database, if any."""
+
+        if self.query_cache is None:
+            return None
+
+        body = self.query_cache.get(db_id, query)
+        if body is None:
+            return None
+        self._logger.info(f" Using the cached results of the query on {db_id}")
+        return self._json.loads(body)
+
+    def _cache_results(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]],
+        responses: list[dict[str, Any]],
+    ):
+        """Caches the results of the query on the database given all the
+        responses of its pagination."""
+
+        # The results are only cached if all of them were fetched.
+        if self.query_cache is None or not responses or responses[-1]["has_more"]:
+            return
+
+        results = [result for resp in responses for result in resp["results"]]
+        self.query_cache.set(db_id, query, self._json.dumps(results))
+
+    def _invalidate_queries(self, page: dict[str, Any]):
+        """Removes the cached results of the queries on the database of the
+        page after it's created or updated."""
+
+        parent = page.get("parent", None) or {}
+        if self.query_cache is not None and "database_id" in parent:
+            self.query_cache.invalidate(parent["database_id"])
+
+    def _get_retry_delay(self, resp: httpx.Response, attempt: int) -> Optional[float]:
+        """Gets the number of seconds to wait before retrying the request
+        or `None` if it shouldn't be retried."""
+
+        policy = self._config.retry_policy
+        if policy is None or resp.is_success:
+            return None
+
+        if not policy.should_retry(resp, attempt):
+            if resp.status_code in policy.status_codes:
+                self.retry_stats.record_exhausted()
+            return None
+
+        delay = policy.get_delay(resp, attempt)
+        self.retry_stats.record_retry(resp.status_code, delay)
+        msg = f" Request failed with status code {resp.status_code}, retrying in {delay:.2f}s"
+        self._logger.warning(msg)
+        return delay
+
+    def _parse_response(self, resp: httpx.Response) -> dict[str, Any]:
+
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            try:
+                body = self._json.loads(error.response.content)
+            except self._json.errors:
+                raise HTTPError(error.response)
+            raise APIResponseError(error.response, body["code"], body["message"])
+
+        response_dict = self._json.loads(resp.content)
+        self._logger.debug(f" Response: {response_dict}")
+        return response_dict
+
+    def _client_options(self) -> dict[str, Any]:
+        """The options shared by the underlying `httpx` clients."""
+
+        base_headers: dict[str, str] = {
+            "Authorization": f"Bearer {self.token}",
+            "Notion-Version": self._config.api_version,
+        }
+        return {
+            "timeout": self._config.timeout,
+            "headers": base_headers,
+            "base_url": self._config.base_url,
+        }
+
+    def _transport_options(self) -> dict[str, Any]:
+        """The options shared by the underlying `httpx` transports."""
+
+        http2 = self._config.http2
+        if http2 is None:
+            http2 = find_spec("h2") is not None
+
+        limits = httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
+        return {"retries": self._config.retries, "http2": http2, "limits": limits}
+
+    def _configure_logger(self):
+
+        if self._config.logger:
+            self._logger = self._config.logger
+        else:
+            self._logger = make_logger(self._config.log_level)
+
+    def _configure_json_codec(self):
+
+        codec = self._config.json_codec
+        self._json = codec if isinstance(codec, JSONCodec) else JSONCodec.get(codec)
+
+    def _configure_rate_limiter(self):
+
+        self._rate_limiter: Optional[RateLimiter] = None
+        if self._config.rate_limit:
+            self._rate_limiter = RateLimiter(
+                self._config.rate_limit, self._config.rate_limit_burst
+            )
+
+    def _configure_client(self):
+        raise NotImplementedError("to be implemented by subclass")
+
+
+class NotionClient(BaseClient):
+    """The client that can be used to interact with the Notion API."""
 
     # ------ Database related endpoints ------
 
@@ -104,15 +462,59 @@ class NotionClient:
 
         self._logger.info(f"Retrieving database {db_id}")
         endpoint = APIEndpoints.DB_RETRIEVE.value.format(db_id)
-        db_dict = self._make_request(endpoint)
+        db_dict = self._retrieve(endpoint, "database", db_id)
 
-        db = Database.from_dict(db_dict)
-        db._client = self  # type: ignore
+        db = Database.from_dict(
+            db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        db.set_client(self)
         return db
 
+    def get_schema(self, db_id: str, refresh: bool = False) -> Schema:
+        """Gets the schema of the database, retrieving the database only if
+        its schema isn't already cached.
+
+        NOTE: The database of the schema is shared by everyone using the
+        schema and so it must NOT be modified.
+
+        Attributes:
+            db_id: The id of the database.
+            refresh:
+                If `True`, the database is retrieved again even if its
+                schema is cached.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        schema = None if refresh else self.schemas.get(db_id)
+        if schema is None:
+            if refresh:
+                self._invalidate("database", db_id)
+            # The database is retrieved for the schema alone so that the
+            # databases returned by `retrieve_db` aren't shared.
+            schema = self.schemas.set(self.retrieve_db(db_id))
+        return schema
+
     def query_db(
-        self, db_id: str, query: dict[str, Any], max_pages: int = 0
-    ) -> Generator[Page, None, None]:
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        as_tuples: bool = False,
+        stream: bool = False,
+        use_schema: bool = False,
+        raw: bool = False,
+        use_cache: bool = True,
+    ) -> Generator[Union[Page, Row], None, None]:
         """Query a database.
 
         Attributes:
@@ -121,9 +523,50 @@ class NotionClient:
             max_pages:
                 The maximum number of pages to return. If the value is 0,
                 then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+                If 0, the next batch is only fetched once the current
+                one is consumed.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            fields:
+                The names or the ids of the properties to project the
+                pages onto. If provided, the values of these properties are
+                extracted as plain Python values without creating any
+                `Page` instances. See `nopy.values.extract_value`.
+            as_tuples:
+                If `True`, the projected values are returned as tuples in
+                the order of the `fields` instead of as dictionaries.
+            stream:
+                If `True`, the pages are decoded and yielded as each
+                response is being received instead of after it has been
+                received in full.
+            use_schema:
+                If `True`, the schema of the database is used to resolve
+                the filters of the query by the names of the properties.
+                See `get_schema`.
+            raw:
+                If `True`, the pages are returned as dictionaries in the
+                Notion format without decoding them. The dictionaries
+                shouldn't be modified when the results are cached.
+            use_cache:
+                If `False`, the results are always fetched from Notion, and
+                aren't cached, even if the results of queries are cached.
+
+        If the results of queries are cached with `ClientConfig.query_cache`,
+        the results of an identical query made within the time to live are
+        returned without querying Notion. The queries that are streamed
+        aren't cached.
 
         Returns:
-            A generator that yields a single `Page` instance at a time.
+            A generator that yields a single `Page` instance at a time,
+            or a single projected page if `fields` is provided, or a
+            single page in the Notion format if `raw` is `True`.
 
         Raises:
             APIResponseError: Raised when the Notion API returns a status code
@@ -131,15 +574,175 @@ class NotionClient:
             HTTPError: Raised when there's some error when making the API call.
         """
 
+        if use_schema:
+            schema = self.get_schema(db_id)
+            query = schema.resolve_filters(query)
+
+        map_func, map_args = self._page_mapper(lazy, fields, as_tuples, raw)
+        if self.query_cache is not None and use_cache and not stream:
+            return self._query_db_cached(
+                db_id,
+                query,
+                map_func,
+                map_args,
+                max_pages=max_pages,
+                page_size=page_size,
+                prefetch=prefetch,
+            )
+
         return paginate(
             self._query_db_raw,  # type: ignore
-            Page.from_dict,
+            map_func,
             max_pages=max_pages,
             db_id=db_id,
             client=self,
             query=query,
+            page_size=page_size,
+            prefetch=prefetch,
+            map_args=map_args,
+            stream=stream,
         )
 
+    def scan_db(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        partitions: int = 4,
+        max_pages: int = 0,
+        page_size: int = 100,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        as_tuples: bool = False,
+    ) -> Generator[Union[Page, Row], None, None]:
+        """Query a database by splitting it into partitions which are
+        paginated concurrently.
+
+        The database is split into `partitions` disjoint ranges of the time
+        the pages were created, each of which is paginated by its own
+        thread. The pages are yielded in the order they arrive, so any
+        sorts in the query only apply within a partition. Pages that are
+        returned by more than one partition are only yielded once.
+        If the filter of the query is an "or" with compound filters nested
+        in it, then it can't be chained with the ranges of the partitions
+        within the two levels of nesting Notion allows, so the database is
+        queried as a single partition instead.
+
+        NOTE: The rate limit applies to all the partitions together, so
+        configure `ClientConfig.rate_limit` and `ClientConfig.retry_policy`
+        when scanning large databases.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            partitions: The number of partitions to split the database into.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            start:
+                The time from which the partitions are split. If not
+                provided, the time the database was created is used which
+                requires retrieving the database.
+            end:
+                The time up to which the partitions are split. If not
+                provided, the current time is used.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            fields:
+                The names or the ids of the properties to project the
+                pages onto. If provided, the values of these properties are
+                extracted as plain Python values without creating any
+                `Page` instances. See `nopy.values.extract_value`.
+            as_tuples:
+                If `True`, the projected values are returned as tuples in
+                the order of the `fields` instead of as dictionaries.
+
+        Returns:
+            A generator that yields a single `Page` instance at a time,
+            or a single projected page if `fields` is provided.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        if start is None:
+            start = self.retrieve_db(db_id).created_time or datetime.now(timezone.utc)
+
+        map_func, map_args = self._page_mapper(lazy, fields, as_tuples, False)
+        return paginate_partitions(
+            self._query_db_raw,  # type: ignore
+            map_func,
+            partition_by_created_time(query, partitions, start, end),
+            max_pages=max_pages,
+            map_args=map_args,
+            client=self,
+            db_id=db_id,
+            page_size=page_size,
+        )
+
+    def query_db_columns(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        use_numpy: Optional[bool] = None,
+    ) -> QueryResult:
+        """Query a database and store the results as one column per
+        property.
+
+        The pages aren't decoded into `Page` instances. Instead, the values
+        of each property are stored together in a `Column`, where numbers,
+        checkboxes, dates and options are stored in typed arrays.
+
+        Attributes:
+            db_id: The id of the database to query.
+            query: The query in the Notion format.
+            fields:
+                The names of the properties to create columns for. If not
+                provided, all the properties are used.
+            max_pages:
+                The maximum number of pages to return. If the value is 0,
+                then all pages are returned.
+            page_size:
+                The number of pages to get from the Notion API per
+                API call.
+            prefetch:
+                The number of batches of pages to fetch ahead while the
+                current batch is being consumed.
+            use_numpy:
+                Whether to store the typed columns as NumPy arrays. By
+                default, NumPy is used if it's installed.
+
+        Returns:
+            The `QueryResult` holding the columns.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        pages = paginate(
+            self._query_db_raw,  # type: ignore
+            _as_is,
+            max_pages=max_pages,
+            db_id=db_id,
+            query=query,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+        return QueryResult.from_pages(pages, fields, use_numpy)
+
     def create_db(self, db: dict[str, Any]) -> Database:
         """Creates a database.
 
@@ -156,7 +759,11 @@ class NotionClient:
         """
 
         new_db_dict = self._make_request(APIEndpoints.DB_CREATE.value, "POST", db)
-        new_db = Database.from_dict(new_db_dict)
+        new_db = Database.from_dict(
+            new_db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
         new_db.set_client(self)
         return new_db
 
@@ -178,7 +785,15 @@ class NotionClient:
         self._logger.info(f"Updating '{db_id}' database")
         endpoint = APIEndpoints.DB_UPDATE.value.format(db_id)
         updated_db_dict = self._make_request(endpoint, "PATCH", db)
-        updated_db = Database.from_dict(updated_db_dict)
+        self._invalidate("database", db_id)
+        self.schemas.invalidate(db_id)
+        if self.query_cache is not None:
+            self.query_cache.invalidate(db_id)
+        updated_db = Database.from_dict(
+            updated_db_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
         updated_db.set_client(self)
         return updated_db
 
@@ -201,9 +816,12 @@ class NotionClient:
 
         self._logger.info(f"Retrieving page {page_id}")
         endpoint = APIEndpoints.PAGE_RETRIEVE.value.format(page_id)
-        page_dict = self._make_request(endpoint)
-        pprint(page_dict)
-        page = Page.from_dict(page_dict)
+        page_dict = self._retrieve(endpoint, "page", page_id)
+        page = Page.from_dict(
+            page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
         page.set_client(self)
         return page
 
@@ -242,10 +860,43 @@ class NotionClient:
         """
 
         new_page_dict = self._make_request(APIEndpoints.PAGE_CREATE.value, "post", page)
-        new_page = Page.from_dict(new_page_dict)
+        self._invalidate_queries(new_page_dict)
+        new_page = Page.from_dict(
+            new_page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
         new_page.set_client(self)
         return new_page
 
+    def create_pages(
+        self, pages: Iterable[Union[Page, dict[str, Any]]], concurrency: int = 3
+    ) -> list[BatchResult[Page]]:
+        """Creates many pages concurrently.
+
+        The rate limit of Notion applies to all the requests together, so
+        a high concurrency will only lead to 429s unless the client is
+        configured with a `rate_limit` or a `retry_policy`.
+
+        Attributes:
+            pages:
+                The pages to create as `Page` instances or as dictionaries
+                in the Notion format.
+            concurrency: The maximum number of pages created at once.
+
+        Returns:
+            A `BatchResult` for each page in the same order as the input.
+            If creating a page failed, the error is set on its result
+            instead of being raised.
+        """
+
+        def create(page: Union[Page, dict[str, Any]]) -> Page:
+            if isinstance(page, Page):
+                page = page.serialize()
+            return self.create_page(page)
+
+        return run_batch(create, pages, concurrency)
+
     def update_page(self, page_id: str, page: dict[str, Any]) -> Page:
         """Updates a page.
 
@@ -264,7 +915,46 @@ class NotionClient:
 
         endpoint = APIEndpoints.PAGE_UPDATE.value.format(page_id)
         page_dict = self._make_request(endpoint, "PATCH", page)
-        return Page.from_dict(page_dict)
+        self._invalidate("page", page_id)
+        self._invalidate_queries(page_dict)
+        updated_page = Page.from_dict(
+            page_dict,
+            identity_map=self.identity_map,
+            track_in_place_changes=self._config.track_in_place_changes,
+        )
+        updated_page.set_client(self)
+        return updated_page
+
+    def update_pages(
+        self, updates: Iterable[PageUpdate], concurrency: int = 3
+    ) -> dict[str, BatchResult[Page]]:
+        """Updates the properties of many pages concurrently.
+
+        The updates are consumed before any request is made and all the
+        updates to the same page are merged into a single request. If the
+        same property is updated more than once, the last update wins.
+
+        Attributes:
+            updates:
+                Pairs of a page id and the properties to update keyed by
+                their names or ids. The values are either in the Notion
+                format or property objects.
+            concurrency: The maximum number of pages updated at once.
+
+        Returns:
+            A `BatchResult` for each page keyed by the page id, in the order
+            each page was first updated. If updating a page failed, the
+            error is set on its result instead of being raised.
+        """
+
+        coalesced = coalesce_updates(updates)
+
+        def update(item: tuple[str, dict[str, Any]]) -> Page:
+            page_id, props = item
+            return self.update_page(page_id, {"properties": props})
+
+        results = run_batch(update, coalesced.items(), concurrency)
+        return dict(zip(coalesced, results))
 
     # ----- User related endpoints -----
 
@@ -285,7 +975,7 @@ class NotionClient:
 
         self._logger.info(f"Retrieving user '{user_id}'")
         endpoint = APIEndpoints.USER_RETRIEVE.value.format(user_id)
-        user_dict = self._make_request(endpoint)
+        user_dict = self._retrieve(endpoint, "user", user_id)
         return User.from_dict(user_dict)
 
     def list_users(self) -> Generator[User, None, None]:
@@ -304,6 +994,19 @@ class NotionClient:
         self._logger.info("Listing users...")
         return paginate(self._list_users_raw, User.from_dict)
 
+    def refresh_users(self):
+        """Loads the users of the workspace into the directory of the users
+        again, without waiting for them to be older than the time to live.
+
+        Raises:
+            NopyError: Raised when the directory of the users isn't enabled.
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        self._user_directory().refresh()
+
     def retrieve_me(self) -> Bot:
         """Retrieves the user associated with the given `NOTION_TOKEN`.
 
@@ -317,7 +1020,7 @@ class NotionClient:
         """
 
         self._logger.info("Retreiving 'me'")
-        bot_dict = self._make_request(APIEndpoints.USER_TOKEN_BOT.value)
+        bot_dict = self._retrieve(APIEndpoints.USER_TOKEN_BOT.value, "me")
         return Bot.from_dict(bot_dict)
 
     # ----- Search -----
@@ -333,22 +1036,60 @@ class NotionClient:
 
     # ----- Private Methods -----
 
+    def _user_loader(self) -> Optional[Callable[[], Iterable[User]]]:
+
+        return self.list_users
+
+    def _query_db_cached(
+        self,
+        db_id: str,
+        query: Optional[dict[str, Any]],
+        map_func: Callable[..., Any],
+        map_args: dict[str, Any],
+        max_pages: int = 0,
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+
+        results = self._get_cached_results(db_id, query)
+        if results is not None:
+            cached = {"results": results, "has_more": False, "next_cursor": None}
+            yield from paginate(
+                lambda **_: cached, map_func, max_pages, map_args, client=self
+            )
+            return
+
+        responses: list[dict[str, Any]] = []
+
+        def query_db_raw(**kwargs: Any) -> dict[str, Any]:
+            resp = self._query_db_raw(**kwargs)
+            responses.append(resp)  # type: ignore
+            return resp  # type: ignore
+
+        yield from paginate(
+            query_db_raw,
+            map_func,
+            max_pages,
+            map_args,
+            client=self,
+            db_id=db_id,
+            query=query,
+            **kwargs,
+        )
+        # Only reached once all the results were consumed.
+        self._cache_results(db_id, query, responses)
+
     def _query_db_raw(
         self,
         db_id: str,
         query: Optional[dict[str, Any]] = None,
         start_cursor: Optional[str] = None,
         page_size: int = 100,
-    ) -> dict[str, Any]:
-
-        self._logger.info(f" Querying '{db_id}'")
-
-        query = query or {}
-        query["page_size"] = page_size
-        if start_cursor:
-            query["start_cursor"] = start_cursor
+        stream: bool = False,
+    ) -> Union[dict[str, Any], StreamedResponse]:
 
-        endpoint = APIEndpoints.DB_QUERY.value.format(db_id)
+        endpoint, query = self._query_db_args(db_id, query, start_cursor, page_size)
+        if stream:
+            return self._stream_request(endpoint, "post", data=query)
         return self._make_request(endpoint, "post", data=query)
 
     def _list_users_raw(self, start_cursor: Optional[str] = None):
@@ -366,53 +1107,66 @@ class NotionClient:
         query_params: Optional[dict[str, str]] = None,
     ):
 
-        request = self._client.build_request(
-            method, endpoint, json=data, params=query_params
-        )
+        request = self._build_request(endpoint, method, data, query_params)
+        return self._parse_response(self._send(request))
 
-        log_msg = f" {request.method} request to {request.url}"
-        self._logger.info(log_msg)
-        self._logger.debug(f" Data: {data}")
-        self._logger.debug(f" Query Params: {query_params}")
+    def _retrieve(self, endpoint: str, kind: str, obj_id: str = "") -> dict[str, Any]:
+        """Retrieves a single object, going through the cache if enabled."""
 
-        resp = self._client.send(request)
-        return self._parse_response(resp)
+        cached = self._get_cached(kind, obj_id)
+        if cached is not None:
+            return cached
 
-    def _parse_response(self, resp: httpx.Response) -> dict[str, Any]:
+        request = self._build_request(endpoint)
+        resp = self._send(request)
+        result = self._parse_response(resp)
+        if self.cache is not None:
+            self.cache.set(kind, obj_id, resp.content)
+        return result
 
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as error:
+    def _stream_request(
+        self,
+        endpoint: str,
+        method: str = "get",
+        data: Optional[dict[Any, Any]] = None,
+        query_params: Optional[dict[str, str]] = None,
+    ) -> StreamedResponse:
+        """Makes a request for a paginated endpoint whose results are decoded
+        while the response is being received."""
+
+        request = self._build_request(endpoint, method, data, query_params)
+        resp = self._send(request, stream=True)
+        if not resp.is_success:
+            # The error is in the body so it has to be received in full.
             try:
-                body = error.response.json()
-                raise APIResponseError(error.response, body["code"], body["message"])
-            except JSONDecodeError:
-                raise HTTPError(error.response)
-
-        response_dict = resp.json()
-        self._logger.debug(f" Response: {response_dict}")
-        return response_dict
+                resp.read()
+            finally:
+                resp.close()
+            self._parse_response(resp)
+
+        return StreamedResponse(resp.iter_bytes(), resp.close, self._json.loads)
+
+    def _send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """Sends the request, retrying it as per the retry policy."""
+
+        attempt = 0
+        while True:
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            resp = self._client.send(request, stream=stream)
+
+            delay = self._get_retry_delay(resp, attempt)
+            if delay is None:
+                return resp
+            if stream:
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
 
     def _configure_client(self):
 
-        # Configuring the logger
-        if self._config.logger:
-            self._logger = self._config.logger
-        else:
-            self._logger = make_logger(self._config.log_level)
-
-        # Configuring the httpx client
-        base_headers: dict[str, str] = {
-            "Authorization": f"Bearer {self.token}",
-            "Notion-Version": self._config.api_version,
-        }
-        transport = httpx.HTTPTransport(retries=self._config.retries)
-        self._client = httpx.Client(
-            transport=transport,
-            timeout=self._config.timeout,
-            headers=base_headers,
-            base_url=self._config.base_url,
-        )
+        transport = httpx.HTTPTransport(**self._transport_options())
+        self._client = httpx.Client(transport=transport, **self._client_options())
 
     # ----- Context Managers -----
 
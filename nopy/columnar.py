@@ -0,0 +1,271 @@
+from array import array
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from math import isnan
+from math import nan
+from typing import Any
+from typing import AsyncIterable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+
+from nopy.timestamps import parse_datetime
+from nopy.values import extract_value
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# The property types stored in typed arrays mapped to their type codes.
+# The dates are stored as seconds since the epoch and the options as
+# integer codes into the categories of the column.
+_TYPECODES: dict[str, str] = {
+    "number": "d",
+    "checkbox": "b",
+    "date": "d",
+    "created_time": "d",
+    "last_edited_time": "d",
+    "select": "i",
+    "status": "i",
+}
+_NUMPY_DTYPES: dict[str, str] = {"d": "float64", "b": "bool", "i": "intc"}
+_DATE_TYPES = ("date", "created_time", "last_edited_time")
+_CATEGORY_TYPES = ("select", "status")
+
+
+@dataclass
+class Column:
+    """A single property of all the pages of a query.
+
+    Attributes:
+        name: The name of the property.
+        type: The type of the property as given by Notion.
+        values:
+            The values of the property. Numbers are stored as floats with
+            `nan` for empty values, checkboxes as booleans, dates as the
+            seconds since the epoch with `nan` for empty values and options
+            as codes into `categories` with -1 for empty values. These are
+            NumPy arrays if NumPy is available and arrays from the `array`
+            module otherwise. The rest are lists of the values as given by
+            `nopy.values.extract_value`.
+        categories:
+            The names of the options which the codes of select and status
+            columns refer to.
+    """
+
+    name: str
+    type: str
+    values: Any
+    categories: Optional[list[str]] = None
+
+    def to_list(self) -> list[Any]:
+        """Converts the values back into plain Python values.
+
+        Empty values are `None`, dates are timezone aware `datetime`s in
+        UTC and options are their names.
+        """
+
+        values = self.values
+        if not isinstance(values, list):
+            # Both NumPy arrays and arrays convert their items to Python
+            # values with `tolist`.
+            values = values.tolist()
+
+        if self.type == "number":
+            return [None if isnan(value) else value for value in values]
+        if self.type == "checkbox":
+            return [bool(value) for value in values]
+        if self.type in _DATE_TYPES:
+            return [
+                None if isnan(value) else datetime.fromtimestamp(value, timezone.utc)
+                for value in values
+            ]
+        if self.categories is not None:
+            categories = self.categories
+            return [None if code < 0 else categories[code] for code in values]
+        return list(values)
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+
+@dataclass
+class QueryResult:
+    """The pages of a query stored as one column per property.
+
+    Attributes:
+        ids: The ids of the pages in the order they were returned.
+        columns: The columns keyed by the names of the properties.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    columns: dict[str, Column] = field(default_factory=dict)
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[dict[str, Any]],
+        fields: Optional[Sequence[str]] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "QueryResult":
+        """Creates the columns from pages in the Notion format.
+
+        The type of each column is decided by the first page.
+
+        Attributes:
+            pages: The pages in the Notion format.
+            fields:
+                The names of the properties to create columns for. If not
+                provided, all the properties of the first page are used.
+            use_numpy:
+                Whether to store the typed columns as NumPy arrays. By
+                default, NumPy is used if it's installed.
+        """
+
+        builder = _ResultBuilder(fields)
+        for page in pages:
+            builder.append(page)
+        return cls(*builder.build(use_numpy))
+
+    @classmethod
+    async def afrom_pages(
+        cls,
+        pages: AsyncIterable[dict[str, Any]],
+        fields: Optional[Sequence[str]] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "QueryResult":
+        """The asynchronous counterpart of `from_pages` which creates the
+        columns from an asynchronous iterable of pages.
+
+        Each page is added to the columns as soon as it's received, so
+        the pages are never all held in memory at once.
+        """
+
+        builder = _ResultBuilder(fields)
+        async for page in pages:
+            builder.append(page)
+        return cls(*builder.build(use_numpy))
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Converts the columns into lists of plain Python values."""
+
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def __getitem__(self, name: str) -> Column:
+
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+
+        return len(self.ids)
+
+
+class _ResultBuilder:
+    """Accumulates the columns of the pages of a query one page at a time."""
+
+    def __init__(self, fields: Optional[Sequence[str]]):
+
+        self.fields = fields
+        self.ids: list[str] = []
+        self.builders: Optional[list[_ColumnBuilder]] = None
+
+    def append(self, page: dict[str, Any]):
+
+        props: dict[str, dict[str, Any]] = page["properties"]
+        if self.builders is None:
+            names = list(props) if self.fields is None else self.fields
+            self.builders = [_ColumnBuilder(name, props.get(name)) for name in names]
+        self.ids.append(page["id"])
+        for builder in self.builders:
+            builder.append(props.get(builder.name, None))
+
+    def build(self, use_numpy: Optional[bool]) -> tuple[list[str], dict[str, Column]]:
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+
+        columns = [builder.build(use_numpy) for builder in self.builders or ()]
+        return self.ids, {column.name: column for column in columns}
+
+
+class _ColumnBuilder:
+    """Accumulates the values of a single column."""
+
+    def __init__(self, name: str, prop: Optional[dict[str, Any]]):
+
+        self.name = name
+        self.type = prop["type"] if prop else ""
+        self._typecode = _TYPECODES.get(self.type, None)
+        self._values: Any = array(self._typecode) if self._typecode else []
+        # The names of the options mapped to their codes.
+        self._codes: dict[str, int] = {}
+
+    def append(self, prop: Optional[dict[str, Any]]):
+
+        if prop is None or prop["type"] != self.type:
+            self._values.append(self._empty())
+            return
+
+        value = prop[self.type]
+        if self.type in _DATE_TYPES:
+            self._values.append(_epoch(value))
+        elif self.type in _CATEGORY_TYPES:
+            self._values.append(self._code(value))
+        elif self._typecode is not None:
+            self._values.append(self._empty() if value is None else value)
+        else:
+            self._values.append(extract_value(prop))
+
+    def build(self, use_numpy: bool) -> Column:
+
+        values = self._values
+        if use_numpy and self._typecode is not None:
+            dtype = _NUMPY_DTYPES[self._typecode]
+            values = numpy.frombuffer(values, dtype=dtype)  # type: ignore
+
+        categories = list(self._codes) if self.type in _CATEGORY_TYPES else None
+        return Column(self.name, self.type, values, categories)
+
+    def _code(self, option: Optional[dict[str, Any]]) -> int:
+
+        if option is None:
+            return -1
+        return self._codes.setdefault(option["name"], len(self._codes))
+
+    def _empty(self) -> Any:
+
+        if self._typecode == "d":
+            return nan
+        if self._typecode == "b":
+            return False
+        if self._typecode == "i":
+            return -1
+        return None
+
+
+def _epoch(value: Any) -> float:
+    """Converts a date or a time as given by Notion into the seconds since
+    the epoch. Dates without a timezone are taken to be in UTC."""
+
+    if isinstance(value, dict):
+        value = value["start"]
+    if value is None:
+        return nan
+
+    date_time = parse_datetime(value)
+    if date_time.tzinfo is None:
+        date_time = date_time.replace(tzinfo=timezone.utc)
+    return date_time.timestamp()
@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+
+from nopy.objects.user import User
+from nopy.props.base import frozen
+
+_logger = logging.getLogger(__name__)
+
+
+class UserDirectory:
+    """Holds every user of the workspace so that the partial users, which
+    only have an id, can be resolved to the full users without retrieving
+    each of them.
+
+    The users of pages, such as the users who created and last edited them
+    and the users of people properties, are partial. The directory is
+    loaded all at once, by listing the users of the workspace, the first
+    time a user is looked up and is loaded again once it's older than the
+    time to live.
+
+    The directory is safe to share between threads. Only one thread loads
+    the users at a time while the others keep reading the users loaded
+    before, without waiting for it. Only the first load is waited for.
+
+    The users in the directory are shared by all the objects they're
+    resolved for and so they're made read only.
+
+    Attributes:
+        loader:
+            The callable which lists all the users of the workspace. If
+            `None`, the directory is only loaded through `update`.
+        ttl:
+            The number of seconds the users are kept for before being
+            loaded again.
+        retry_delay:
+            The number of seconds before the users are loaded again after
+            loading them failed. It's doubled after every consecutive
+            failure, up to the time to live.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Iterable[User]]] = None,
+        ttl: float = 3600.0,
+        retry_delay: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+
+        self.loader = loader
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+        self._clock = clock
+        # The dictionary is replaced as a whole when the users are loaded
+        # so that it can be read without the lock.
+        self._users: dict[str, User] = {}
+        self._expires: Optional[float] = None
+        # The number of times loading the users failed in a row.
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the users were never loaded or are older than the time
+        to live."""
+
+        return self._expires is None or self._expires <= self._clock()
+
+    def get(self, user_id: str) -> Optional[User]:
+        """Gets the full user with the given id, loading the users first if
+        they're stale."""
+
+        if self.stale and self.loader is not None:
+            self._reload()
+        return self._users.get(_key(user_id), None)
+
+    def resolve(self, user: User) -> User:
+        """Gets the full user for a partial user. Full users, and the
+        partial users that aren't found, are returned as is."""
+
+        if not user.partial:
+            return user
+        return self.get(user.id) or user
+
+    def refresh(self):
+        """Loads the users again with the loader.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        if self.loader is None:
+            raise ValueError("the directory has no loader")
+
+        with self._lock:
+            self.update(self.loader())
+
+    def update(self, users: Iterable[User]):
+        """Replaces the users in the directory with the given users."""
+
+        self._users = {_key(user.id): frozen(user) for user in users}
+        self._expires = self._clock() + self.ttl
+        self._failures = 0
+
+    def clear(self):
+        """Removes all the users so that they're loaded again on the next
+        lookup."""
+
+        self._users = {}
+        self._expires = None
+
+    def __len__(self) -> int:
+
+        return len(self._users)
+
+    def __contains__(self, user_id: object) -> bool:
+
+        return isinstance(user_id, str) and _key(user_id) in self._users
+
+    def _reload(self):
+
+        # While another thread reloads the users, the ones loaded before are
+        # used instead of waiting. There's nothing to use before the first
+        # load though, so then the thread waits for it.
+        if not self._lock.acquire(blocking=not self._users):
+            return
+        try:
+            # Another thread could have loaded the users while this one was
+            # waiting for the lock.
+            if not self.stale:
+                return
+            self.update(self.loader())  # type: ignore
+        except Exception:
+            # The users are looked up while decoding the objects, which
+            # shouldn't fail because of the directory. The users loaded
+            # before, if any, are kept until the next attempt.
+            _logger.warning("Failed to load the users", exc_info=True)
+            delay = min(self.ttl, self.retry_delay * 2**self._failures)
+            self._failures += 1
+            self._expires = self._clock() + delay
+        finally:
+            self._lock.release()
+
+
+def _key(user_id: str) -> str:
+
+    # Notion accepts ids both with and without the dashes.
+    return user_id.replace("-", "")
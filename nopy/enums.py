@@ -1,4 +1,8 @@
 from enum import Enum
+from typing import Type
+from typing import TypeVar
+
+E = TypeVar("E", bound=Enum)
 
 
 class Colors(Enum):
@@ -344,3 +348,25 @@ class RollupFunctions(Enum):
     COUNT_PER_GROUP = "count_per_group"
     PERCENT_PER_GROUP = "percent_per_group"
     SHOW_ORIGINAL = "show_original"
+
+
+# ----- Decode Tables -----
+
+
+def _decode_table(enum: Type[E]) -> dict[str, E]:
+    """Maps the lowercased names of the members of the enum to the members.
+
+    Looking up a key in the table is the same as `enum[key.upper()]`, but
+    without creating a new string or going through the enum's metaclass.
+    """
+
+    return {member.name.lower(): member for member in enum}
+
+
+COLORS: dict[str, Colors] = _decode_table(Colors)
+FILE_TYPES: dict[str, FileTypes] = _decode_table(FileTypes)
+MENTION_TYPES: dict[str, MentionTypes] = _decode_table(MentionTypes)
+RICH_TEXT_TYPES: dict[str, RichTextTypes] = _decode_table(RichTextTypes)
+PARENT_TYPES: dict[str, ParentTypes] = _decode_table(ParentTypes)
+NUMBER_FORMATS: dict[str, NumberFormat] = _decode_table(NumberFormat)
+ROLLUP_FUNCTIONS: dict[str, RollupFunctions] = _decode_table(RollupFunctions)
@@ -238,8 +238,10 @@ class DateFilter(PropFilter):
         "equals",
         "before",
         "after",
+        "on_or_before",
+        "on_or_after",
         "is_empty",
-        "is_not_emtpy",
+        "is_not_empty",
     }
 
     equals: Optional[datetime] = None
@@ -265,12 +267,13 @@ class DateFilter(PropFilter):
 
         filters: dict[str, Any] = {}
         for attr_name, attr_value in self.__dict__.items():
-            if attr_value is not None:
-                filters[attr_name] = (
-                    attr_value if attr_name in self._NORMAL_ATTRS else {}
-                )
-
-        filters.pop("_type")
+            if attr_value is None or attr_name == "_type":
+                continue
+            if attr_name not in self._NORMAL_ATTRS:
+                attr_value = {}
+            elif isinstance(attr_value, datetime):
+                attr_value = attr_value.isoformat()
+            filters[attr_name] = attr_value
 
         return {self._type.value: filters}
 
@@ -326,3 +329,24 @@ class FormulaFilter(PropFilter):
                 filters[attr_name] = attr_value.serialize()
 
         return {self._type.value: filters}
+
+
+@dataclass
+class TimestampFilter:
+    """A filter on the time a page was created or last edited.
+
+    Unlike the other filters, this doesn't require a property and can be
+    used directly within a `Query`.
+
+    Attributes:
+        timestamp: The timestamp to filter by.
+        filter: The date filter to apply on the timestamp.
+    """
+
+    timestamp: Literal["created_time", "last_edited_time"]
+    filter: DateFilter
+
+    def serialize(self) -> dict[str, Any]:
+
+        date_filter = self.filter.serialize()[PropTypes.DATE.value]
+        return {"timestamp": self.timestamp, self.timestamp: date_filter}
@@ -0,0 +1,134 @@
+from typing import Any
+from typing import Hashable
+from typing import Optional
+
+from nopy.directory import UserDirectory
+from nopy.objects.user import User
+from nopy.props.base import ObjectProperty
+from nopy.props.base import frozen
+from nopy.props.common import Parent
+from nopy.props.page_props import PCreatedby
+from nopy.props.page_props import PLastEditedBy
+from nopy.props.page_props import PPeople
+
+
+class IdentityMap:
+    """Interns the users and the parents decoded by a client so that the
+    same user or parent is represented by a single shared instance.
+
+    Every page refers to the users who created and last edited it, and to
+    its parent. Since there are only a handful of distinct users and
+    parents compared to the number of pages, decoding a new instance for
+    each page is wasteful.
+
+    The interned instances are shared between all the objects decoded by
+    the client and so they're made read only, see `nopy.props.base.frozen`.
+    Assigning to one of their attributes raises a `FrozenInstanceError`.
+    Reassigning the attribute of the object instead, such as
+    `page.parent = PageParent(...)` or
+    `page.parent = dataclasses.replace(page.parent, id=...)`, is safe.
+
+    Attributes:
+        max_size:
+            The maximum number of instances interned per kind. The map is
+            cleared once it's reached so that a long lived client doesn't
+            grow without bound.
+        directory:
+            The directory the partial users are resolved to the full users
+            through, if any.
+    """
+
+    def __init__(
+        self, max_size: int = 10_000, directory: Optional[UserDirectory] = None
+    ):
+
+        self.max_size = max_size
+        self.directory = directory
+        # The dictionaries are only read and assigned to, which are atomic
+        # operations, so no lock is needed. In the worst case, two threads
+        # decode the same user at once and one of the instances is dropped.
+        self._users: dict[str, User] = {}
+        self._parents: dict[Hashable, Parent] = {}
+
+    def user(self, args: dict[str, Any]) -> User:
+        """Gets the interned user for the user in the Notion format,
+        decoding and interning it if it's not already interned.
+
+        Partial users, which only have an id, are replaced by the full user
+        once it is decoded or found in the directory.
+        """
+
+        user_id = args["id"]
+        user = self._users.get(user_id, None)
+        # Only partial users, which have no type, are replaced.
+        if user is not None and not user.partial:
+            return user
+        if user is not None and "type" not in args and self.directory is None:
+            return user
+
+        return self._replace_partial(user, User.from_dict(args, self.directory))
+
+    def users_of(self, prop: ObjectProperty) -> ObjectProperty:
+        """Interns the users of a people, created by or last edited by
+        property of a page in place. Other properties are left as is."""
+
+        if isinstance(prop, PPeople):
+            prop.people = [self._intern_user(user) for user in prop.people]
+        elif isinstance(prop, PCreatedby):
+            prop.created_by = self._intern_user(prop.created_by)
+        elif isinstance(prop, PLastEditedBy):
+            prop.last_edited_by = self._intern_user(prop.last_edited_by)
+        return prop
+
+    def parent(self, args: dict[str, Any]) -> Parent:
+        """Gets the interned parent for the parent in the Notion format,
+        decoding and interning it if it's not already interned."""
+
+        parent_type = args.get("type", "")
+        key = (parent_type, args.get(parent_type, None))
+        try:
+            parent = self._parents.get(key, None)
+        except TypeError:
+            # Unsupported parents could have an unhashable id.
+            return Parent.from_dict(args)
+        if parent is not None:
+            return parent
+
+        parent = Parent.from_dict(args)
+        self._intern(self._parents, key, parent)
+        return parent
+
+    def clear(self):
+        """Clears all the interned instances."""
+
+        self._users.clear()
+        self._parents.clear()
+
+    def __len__(self) -> int:
+
+        return len(self._users) + len(self._parents)
+
+    def _intern_user(self, user: User) -> User:
+
+        interned = self._users.get(user.id, None)
+        if interned is not None and not interned.partial:
+            return interned
+
+        if self.directory is not None:
+            user = self.directory.resolve(user)
+        return self._replace_partial(interned, user)
+
+    def _replace_partial(self, interned: Optional[User], user: User) -> User:
+
+        # The interned partial user is kept unless a full user was found.
+        if interned is not None and user.partial:
+            return interned
+
+        self._intern(self._users, user.id, user)
+        return user
+
+    def _intern(self, interned: dict[Any, Any], key: Hashable, value: Any):
+
+        if len(interned) >= self.max_size:
+            interned.clear()
+        interned[key] = frozen(value)
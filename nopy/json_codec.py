@@ -0,0 +1,93 @@
+import json
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+# The codecs tried, in order, when none is chosen explicitly.
+_PREFERRED = ("orjson", "ujson")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Encodes the bodies of the requests and decodes the bodies of the
+    responses.
+
+    Attributes:
+        name: The name of the codec.
+        dumps: Encodes a Python object into UTF-8 encoded JSON.
+        loads: Decodes JSON given as bytes or a string.
+        errors:
+            The exceptions raised by `loads` when the JSON is invalid.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+    errors: tuple[type[Exception], ...] = (ValueError,)
+
+    @classmethod
+    def get(cls, name: Optional[str] = None) -> "JSONCodec":
+        """Gets one of the supported codecs by its name.
+
+        Attributes:
+            name:
+                One of "orjson", "ujson" or "json". If not provided, orjson
+                or ujson is used if installed and the standard library's
+                `json` otherwise.
+
+        Raises:
+            ValueError: Raised if the codec isn't supported.
+            ImportError: Raised if the package of the codec isn't installed.
+        """
+
+        if name is None:
+            name = next((name for name in _PREFERRED if find_spec(name)), "json")
+
+        factory = _FACTORIES.get(name, None)
+        if factory is None:
+            supported = ", ".join(_FACTORIES)
+            raise ValueError(
+                f"unsupported JSON codec '{name}', expected one of {supported}"
+            )
+        return factory()
+
+
+def _json_codec() -> JSONCodec:
+
+    # Compact UTF-8 output keeps the request bodies small, and NaN or
+    # infinite numbers, which aren't valid JSON, are rejected.
+    encoder = json.JSONEncoder(
+        ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    )
+
+    def dumps(obj: Any) -> bytes:
+        return encoder.encode(obj).encode("utf-8")
+
+    return JSONCodec("json", dumps, json.loads, (json.JSONDecodeError,))
+
+
+def _orjson_codec() -> JSONCodec:
+
+    orjson = import_module("orjson")
+    return JSONCodec("orjson", orjson.dumps, orjson.loads, (orjson.JSONDecodeError,))
+
+
+def _ujson_codec() -> JSONCodec:
+
+    ujson = import_module("ujson")
+
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    return JSONCodec("ujson", dumps, ujson.loads, (ujson.JSONDecodeError,))
+
+
+_FACTORIES: dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _json_codec,
+}
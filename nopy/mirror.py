@@ -0,0 +1,302 @@
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from types import TracebackType
+from typing import Any
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+from nopy.client import NotionClient
+from nopy.filters import DateFilter
+from nopy.filters import TimestampFilter
+from nopy.objects.page import Page
+from nopy.query import Query
+from nopy.sorts import TimestampSort
+from nopy.timestamps import parse_datetime
+from nopy.values import Projection
+from nopy.values import Row
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    db_id TEXT NOT NULL,
+    created_time TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_db_id ON pages (db_id, last_edited_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    db_id TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at TEXT NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO pages (id, db_id, created_time, last_edited_time, data)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+
+@dataclass
+class SyncResult:
+    """The outcome of a sync of a `DatabaseMirror`.
+
+    Attributes:
+        full: Whether all the pages were fetched or only the edited ones.
+        fetched: The number of pages fetched from Notion.
+        deleted:
+            The number of pages removed from the mirror since they're no
+            longer in the database. Only full syncs remove pages.
+        watermark:
+            The latest time a page in the mirror was edited at, which the
+            next sync fetches the edited pages from.
+    """
+
+    full: bool
+    fetched: int
+    deleted: int
+    watermark: Optional[datetime]
+
+
+class DatabaseMirror:
+    """Mirrors the pages of a database into a local SQLite database so that
+    they can be read without going through the Notion API.
+
+    The first sync fetches all the pages. The later syncs only fetch the
+    pages that were edited since the latest edit seen so far, the
+    watermark, by querying on the time the pages were last edited. Notion
+    only keeps these times to the minute, so the pages edited within the
+    minute of the watermark are fetched again.
+
+    Pages that are deleted or archived aren't returned by the queries and
+    so they're only removed from the mirror by a full sync.
+
+    The pages are stored as given by Notion in the `data` column of the
+    `pages` table, which can be queried with the JSON functions of SQLite:
+
+    ```py
+    mirror.execute(
+        "SELECT id FROM pages WHERE json_extract(data, '$.properties.Status.status.name') = ?",
+        ("Done",),
+    )
+    ```
+
+    Attributes:
+        client: The client used to sync.
+        db_id: The id of the database to mirror.
+        path:
+            The path of the SQLite database. Defaults to an in memory
+            database. The same file can hold the mirrors of many databases.
+    """
+
+    def __init__(
+        self,
+        client: NotionClient,
+        db_id: str,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+    ):
+
+        self.client = client
+        self.db_id = db_id
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """The latest time a page in the mirror was edited at, or `None` if
+        the mirror was never synced."""
+
+        watermark = self._stored_watermark()
+        return None if watermark is None else parse_datetime(watermark)
+
+    def sync(self, full: bool = False) -> SyncResult:
+        """Fetches the pages that were edited since the last sync, or all
+        the pages if the mirror was never synced.
+
+        The pages are written in a single transaction, so a sync that fails
+        leaves the mirror as it was.
+
+        Attributes:
+            full:
+                If `True`, all the pages are fetched and the pages that are
+                no longer in the database are removed.
+
+        Raises:
+            APIResponseError: Raised when the Notion API returns a status code
+                that's not 2xx.
+            HTTPError: Raised when there's some error when making the API call.
+        """
+
+        watermark = None if full else self.watermark
+        full = watermark is None
+
+        query = Query(sorts=[TimestampSort("last_edited_time")])
+        if watermark is not None:
+            date_filter = DateFilter(on_or_after=watermark)
+            query.and_filters.append(TimestampFilter("last_edited_time", date_filter))
+
+        # Syncing from cached results would miss the latest edits.
+        pages = self.client.query_db(
+            self.db_id, _serialize(query), stream=True, raw=True, use_cache=False
+        )
+
+        fetched = deleted = 0
+        latest = self._stored_watermark()
+        with self._conn:
+            if full:
+                self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT)")
+                self._conn.execute("DELETE FROM seen")
+
+            for page in pages:
+                self._conn.execute(_UPSERT, self._page_row(page))
+                if full:
+                    self._conn.execute("INSERT INTO seen VALUES (?)", (page["id"],))
+                edited = page["last_edited_time"]
+                if latest is None or parse_datetime(edited) > parse_datetime(latest):
+                    latest = edited
+                fetched += 1
+
+            if full:
+                deleted = self._conn.execute(
+                    "DELETE FROM pages WHERE db_id = ? AND id NOT IN (SELECT id FROM seen)",
+                    (self.db_id,),
+                ).rowcount
+
+            synced_at = datetime.now(timezone.utc).isoformat()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (self.db_id, latest, synced_at),
+            )
+
+        return SyncResult(full, fetched, deleted, self.watermark)
+
+    def pages(self, lazy: bool = False) -> Generator[Page, None, None]:
+        """Reads the mirrored pages.
+
+        Attributes:
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+        """
+
+        for (data,) in self._select("data"):
+            page = self._decode_page(data, lazy)
+            page.set_client(self.client)
+            yield page
+
+    def rows(
+        self, fields: Sequence[str], as_tuples: bool = False
+    ) -> Generator[Row, None, None]:
+        """Reads the values of some of the properties of the mirrored pages
+        as plain Python values. See `nopy.values.extract_value`.
+
+        Attributes:
+            fields: The names or the ids of the properties.
+            as_tuples:
+                If `True`, the values are returned as tuples in the order
+                of the `fields` instead of as dictionaries.
+        """
+
+        projection = Projection(fields, as_tuples)
+        for (data,) in self._select("data"):
+            yield projection.project(json.loads(data))
+
+    def get(self, page_id: str) -> Optional[Page]:
+        """Reads the mirrored page with the given id, if any."""
+
+        row = self._conn.execute(
+            "SELECT data FROM pages WHERE db_id = ? AND id = ?", (self.db_id, page_id)
+        ).fetchone()
+        if row is None:
+            return None
+
+        page = self._decode_page(row[0])
+        page.set_client(self.client)
+        return page
+
+    def execute(self, sql: str, parameters: Iterable[Any] = ()) -> list[Any]:
+        """Runs an SQL statement on the SQLite database of the mirror.
+
+        Returns:
+            The rows returned by the statement.
+        """
+
+        return self._conn.execute(sql, tuple(parameters)).fetchall()
+
+    def close(self):
+        """Closes the SQLite database."""
+
+        self._conn.close()
+
+    def _select(self, columns: str) -> sqlite3.Cursor:
+
+        return self._conn.execute(
+            f"SELECT {columns} FROM pages WHERE db_id = ? ORDER BY created_time, id",
+            (self.db_id,),
+        )
+
+    def _decode_page(self, data: str, lazy: bool = False) -> Page:
+
+        return Page.from_dict(
+            json.loads(data),
+            lazy=lazy,
+            identity_map=self.client.identity_map,
+            track_in_place_changes=self.client._config.track_in_place_changes,
+        )
+
+    def _stored_watermark(self) -> Optional[str]:
+
+        row = self._conn.execute(
+            "SELECT watermark FROM sync_state WHERE db_id = ?", (self.db_id,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _page_row(self, page: dict[str, Any]) -> tuple[str, ...]:
+
+        return (
+            page["id"],
+            self.db_id,
+            page["created_time"],
+            page["last_edited_time"],
+            json.dumps(page),
+        )
+
+    # ----- Dunder Methods -----
+
+    def __len__(self) -> int:
+
+        return self._conn.execute(
+            "SELECT count(*) FROM pages WHERE db_id = ?", (self.db_id,)
+        ).fetchone()[0]
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_value: BaseException,
+        traceback: TracebackType,
+    ):
+
+        self.close()
+
+
+def _serialize(query: Query) -> dict[str, Any]:
+
+    serialized = query.serialize()
+    # Notion rejects an empty filter.
+    if not serialized["filter"]:
+        del serialized["filter"]
+    return serialized
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from dataclasses import field
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import ClassVar
 from typing import Generator
+from typing import Iterable
 from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import Type
 from typing import Union
 
 import nopy.props.db_props as dbp
+from nopy.batch import BatchResult
 from nopy.enums import ObjectTypes
 from nopy.errors import NoClientFoundError
 from nopy.objects.notion_object import NotionObject
@@ -22,14 +28,19 @@ from nopy.props.common import Emoji
 from nopy.props.common import File
 from nopy.props.common import RichText
 from nopy.query import Query
+from nopy.query import resolve_filters
 from nopy.types import DBProps
 from nopy.utils import TextDescriptor
 from nopy.utils import base_obj_args
 from nopy.utils import get_cover
 from nopy.utils import get_icon
-from nopy.utils import paginate
 from nopy.utils import rich_text_list
 
+if TYPE_CHECKING:
+    from nopy.columnar import QueryResult
+    from nopy.identity import IdentityMap
+    from nopy.values import Row
+
 
 @dataclass
 class Database(NotionObject):
@@ -94,6 +105,12 @@ class Database(NotionObject):
         "status": dbp.DBStatus,
         "url": dbp.DBUrl,
     }
+    _IN_PLACE_FIELDS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "rich_title": rich_text_list,
+        "rich_description": rich_text_list,
+        "icon": get_icon,
+        "cover": get_cover,
+    }
     title: ClassVar[TextDescriptor] = TextDescriptor("rich_title")
     description: ClassVar[TextDescriptor] = TextDescriptor("rich_description")
 
@@ -112,9 +129,16 @@ class Database(NotionObject):
         # Storing the ids of the original properties to handle
         # deleted properties.
         self._og_props = set(self.properties._ids.keys())  # type: ignore
+        # The name and the id of the title property, which isn't part of
+        # the properties, if the database was retrieved from Notion.
+        self._title_prop: Optional[tuple[str, str]] = None
 
     def get_pages(
-        self, max_pages: int = 0, page_size: int = 100
+        self,
+        max_pages: int = 0,
+        page_size: int = 100,
+        prefetch: int = 0,
+        lazy: bool = False,
     ) -> Generator[Page, None, None]:
         """Returns a generator that yields a single page at a time.
 
@@ -123,20 +147,76 @@ class Database(NotionObject):
             page_size:
                 The number of pages to get from the Notion API per
                 API call.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
 
         Returns:
-            A generator that yields a single page at a time.
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then it's an
+            asynchronous generator.
         """
         if not self._client:
             raise NoClientFoundError("database")
 
-        return paginate(
-            self._client._query_db_raw,  # type: ignore
-            Page.from_dict,
+        return self._client.query_db(  # type: ignore
+            self.id,
+            max_pages=max_pages,
             page_size=page_size,
+            prefetch=prefetch,
+            lazy=lazy,
+        )
+
+    def scan(
+        self,
+        query: Optional[Union[Query, dict[str, Any]]] = None,
+        partitions: int = 4,
+        max_pages: int = 0,
+        lazy: bool = False,
+        use_schema: bool = False,
+    ) -> Generator[Page, None, None]:
+        """Query the database by splitting it into partitions based on the
+        time the pages were created, which are paginated concurrently.
+
+        The pages are yielded in the order they arrive, so the sorts in the
+        query only apply within a partition.
+
+        Attributes:
+            query: The query to apply on the database.
+            partitions: The number of partitions to split the database into.
+            max_pages: The maximum number of pages to return.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            use_schema:
+                If `True`, the filters of the query can refer to the
+                properties by their names and use the filters of a
+                compatible type. See `nopy.query.resolve_filters`.
+
+        Returns:
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then it's an
+            asynchronous generator.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+
+        if isinstance(query, Query):
+            query = query.serialize()
+        if use_schema:
+            query = self._resolve_filters(query)
+
+        return self._client.scan_db(  # type: ignore
+            self.id,
+            query,
+            partitions=partitions,
             max_pages=max_pages,
-            db_id=self.id,
-            client=self._client,
+            start=self.created_time,
+            lazy=lazy,
         )
 
     def create_page(self, page: Union["Page", dict[str, Any]]) -> "Page":
@@ -158,50 +238,117 @@ class Database(NotionObject):
 
         return self._client.create_page(page)
 
+    def create_pages(
+        self, pages: Iterable[Union["Page", dict[str, Any]]], concurrency: int = 3
+    ) -> list[BatchResult[Page]]:
+        """Creates many pages within this database concurrently.
+
+        Attributes:
+            pages (Iterable[Union[Page, dict[str, Any]]]):
+                The pages to be created.
+            concurrency: The maximum number of pages created at once.
+
+        Returns:
+            A `BatchResult` for each page in the same order as the input.
+            If the database is bound to an `AsyncNotionClient`, then an
+            awaitable resolving to the same is returned.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("no client found")
+
+        parent = DatabaseParent(self.id).serialize()
+
+        def with_parent(page: Union["Page", dict[str, Any]]) -> dict[str, Any]:
+            if not isinstance(page, dict):
+                page = page.serialize()
+            page["parent"] = parent
+            return page
+
+        return self._client.create_pages(  # type: ignore
+            (with_parent(page) for page in pages), concurrency
+        )
+
     def update(self, in_place: bool = False) -> Database:
         """Updates the database.
 
+        Only the attributes and the properties that were modified since
+        the database was retrieved are sent. If nothing was modified, then
+        no request is made and the database itself is returned.
+
         Attributes:
             in_place (bool):
                 If `True`, then this instance is updated in place.
 
         Returns:
             The updated Database instance. Returns `self` if `in_place` is
-            `True`.
+            `True`. If the database is bound to an `AsyncNotionClient`,
+            then an awaitable resolving to the same is returned.
         """
 
         if not self._client:
             raise NoClientFoundError("no client is associated with this instance")
 
-        db = self.serialize()
-        # Parent should not be present when updating
-        db.pop("parent")
+        db = self._serialize_modified()
+        deleted_props = self._find_deleted_props()
+
+        if inspect.iscoroutinefunction(self._client.update_db):
+            return self._aupdate(db, deleted_props, in_place)  # type: ignore
+        if not db and not deleted_props:
+            return self
 
-        updated_db = self._client.update_db(self.id, db)
+        if db:
+            updated_db = self._client.update_db(self.id, db)
         # Deleted properties have to be sent as a different update
         # request. Sending the deleted properties in one request does NOT
         # work.
-        deleted_props = self._find_deleted_props()
         if deleted_props:
-            db["properties"] = {prop_id: None for prop_id in deleted_props}
-            updated_db = self._client.update_db(self.id, db)
+            deleted = {prop_id: None for prop_id in deleted_props}
+            updated_db = self._client.update_db(self.id, {"properties": deleted})
 
-        if not in_place:
-            return updated_db
-        self.__dict__.clear()
-        self.__dict__ = updated_db.__dict__
-        return self
+        return self._apply_update(updated_db, in_place)  # type: ignore
 
     def query(
-        self, query: Union[Query, dict[str, Any]], max_pages: int = 0
-    ) -> Generator["Page", None, None]:
+        self,
+        query: Union[Query, dict[str, Any]],
+        max_pages: int = 0,
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        as_tuples: bool = False,
+        stream: bool = False,
+        use_schema: bool = False,
+    ) -> Generator[Union[Page, Row], None, None]:
         """Query a database.
 
         Attributes:
             query: The query to apply on the database.
+            max_pages: The maximum number of pages to return.
+            prefetch:
+                The number of batches of pages to fetch ahead in the
+                background while the current batch is being consumed.
+            lazy:
+                If `True`, then the properties of the pages are decoded
+                only when they are first accessed.
+            fields:
+                The names or the ids of the properties to project the
+                pages onto. If provided, plain values of only these
+                properties are returned instead of `Page` instances.
+            as_tuples:
+                If `True`, the projected values are returned as tuples in
+                the order of the `fields` instead of as dictionaries.
+            stream:
+                If `True`, the pages are decoded and yielded as each
+                response is being received.
+            use_schema:
+                If `True`, the filters of the query can refer to the
+                properties by their names and use the filters of a
+                compatible type. See `nopy.query.resolve_filters`.
 
         Returns:
-            A generator that yields a single page at a time.
+            A generator that yields a single page at a time. If the
+            database is bound to an `AsyncNotionClient`, then it's an
+            asynchronous generator.
         """
 
         if not self._client:
@@ -209,14 +356,61 @@ class Database(NotionObject):
 
         if isinstance(query, Query):
             query = query.serialize()
+        if use_schema:
+            query = self._resolve_filters(query)
 
-        return paginate(
-            self._client._query_db_raw,  # type: ignore
-            Page.from_dict,
+        return self._client.query_db(  # type: ignore
+            self.id,
+            query,
             max_pages=max_pages,
-            db_id=self.id,
-            client=self._client,
-            query=query,
+            prefetch=prefetch,
+            lazy=lazy,
+            fields=fields,
+            as_tuples=as_tuples,
+            stream=stream,
+        )
+
+    def query_columns(
+        self,
+        query: Optional[Union[Query, dict[str, Any]]] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_pages: int = 0,
+        prefetch: int = 0,
+        use_schema: bool = False,
+    ) -> QueryResult:
+        """Query the database and store the results as one column per
+        property.
+
+        Attributes:
+            query: The query to apply on the database.
+            fields:
+                The names of the properties to create columns for. If not
+                provided, all the properties are used.
+            max_pages: The maximum number of pages to return.
+            prefetch:
+                The number of batches of pages to fetch ahead while the
+                current batch is being consumed.
+            use_schema:
+                If `True`, the filters of the query can refer to the
+                properties by their names and use the filters of a
+                compatible type. See `nopy.query.resolve_filters`.
+
+        Returns:
+            The `QueryResult` holding the columns. If the database is bound
+            to an `AsyncNotionClient`, then an awaitable resolving to the
+            same is returned.
+        """
+
+        if not self._client:
+            raise NoClientFoundError("database")
+
+        if isinstance(query, Query):
+            query = query.serialize()
+        if use_schema:
+            query = self._resolve_filters(query)
+
+        return self._client.query_db_columns(  # type: ignore
+            self.id, query, fields, max_pages=max_pages, prefetch=prefetch
         )
 
     def serialize(self) -> dict[str, Any]:
@@ -239,13 +433,65 @@ class Database(NotionObject):
 
         return serialized
 
+    async def _aupdate(
+        self, db: dict[str, Any], deleted_props: Set[str], in_place: bool
+    ) -> Database:
+
+        if not db and not deleted_props:
+            return self
+        if db:
+            updated_db = await self._client.update_db(self.id, db)  # type: ignore
+        if deleted_props:
+            deleted = {prop_id: None for prop_id in deleted_props}
+            updated_db = await self._client.update_db(  # type: ignore
+                self.id, {"properties": deleted}
+            )
+
+        return self._apply_update(updated_db, in_place)
+
+    def _serialize_modified(self) -> dict[str, Any]:
+        """Serializes only what was modified since the database was
+        retrieved."""
+
+        serialized: dict[str, Any] = {}
+        modified = self._changed_fields()
+
+        properties = self.properties.serialize("properties" not in modified)
+        if properties:
+            serialized["properties"] = properties
+
+        if "rich_title" in modified:
+            serialized["title"] = [rt.serialize() for rt in self.rich_title]
+        if "rich_description" in modified:
+            serialized["description"] = [rt.serialize() for rt in self.rich_description]
+        for attr in ("is_inline", "archived"):
+            if attr in modified:
+                serialized[attr] = getattr(self, attr)
+        for attr in ("icon", "cover"):
+            if attr in modified:
+                value = getattr(self, attr)
+                serialized[attr] = value if value is None else value.serialize()
+
+        return serialized
+
+    def _resolve_filters(self, query: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Resolves the filters of the query in the Notion format against
+        the properties of the database, including its title."""
+
+        return resolve_filters(query, self.properties, self._title_prop)
+
     def _find_deleted_props(self) -> Set[str]:
 
         curr_props = set(self.properties._ids.keys())  # type: ignore
         return self._og_props.difference(curr_props)
 
     @classmethod
-    def from_dict(cls: Type[Database], args: dict[str, Any]) -> Database:
+    def from_dict(
+        cls: Type[Database],
+        args: dict[str, Any],
+        identity_map: Optional[IdentityMap] = None,
+        track_in_place_changes: bool = False,
+    ) -> Database:
 
         new_args: dict[str, Any] = {
             "rich_title": rich_text_list(args["title"]),
@@ -257,18 +503,33 @@ class Database(NotionObject):
         }
 
         # Getting the database properties
+        title_prop: Optional[tuple[str, str]] = None
         properties = Properties()
         for prop in args["properties"].values():
 
             prop_type = prop["type"]
             if prop_type == "title":
+                title_prop = (prop["name"], prop["id"])
                 continue
 
             prop_class = cls._REVERSE_MAP.get(prop_type, ObjectProperty)
             prop_instance = prop_class.from_dict(prop)
+            prop_instance._mark_clean(prop if track_in_place_changes else None)
             properties.add(prop_instance)
 
         new_args["properties"] = properties
-        new_args.update(base_obj_args(args))
-
-        return Database(**new_args)
+        new_args.update(base_obj_args(args, identity_map))
+
+        db = Database(**new_args)
+        db._title_prop = title_prop
+        if track_in_place_changes:
+            raw_in_place = {
+                "rich_title": args["title"],
+                "rich_description": args["description"],
+                "icon": args["icon"],
+                "cover": args["cover"],
+            }
+            db._mark_clean(raw_in_place)
+        else:
+            db._mark_clean()
+        return db
@@ -4,12 +4,19 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import ClassVar
 from typing import Optional
+from typing import Set
 from typing import Type
+from typing import TypeVar
+from typing import Union
 
 from nopy.enums import ObjectTypes
 
 if TYPE_CHECKING:
+    from nopy.async_client import AsyncNotionClient
     from nopy.client import NotionClient
     from nopy.objects.user import User
     from nopy.props.common import Parent
@@ -33,9 +40,9 @@ class BaseObject:
     def __post_init__(self):
 
         self._type = ObjectTypes.UNSUPPORTED
-        self._client: Optional["NotionClient"] = None
+        self._client: Optional[Union["NotionClient", "AsyncNotionClient"]] = None
 
-    def set_client(self, client: "NotionClient"):
+    def set_client(self, client: Union["NotionClient", "AsyncNotionClient"]):
         """Sets the client."""
 
         self._client = client
@@ -61,3 +68,74 @@ class NotionObject(BaseObject):
     created_by: Optional[User] = None
     last_edited_by: Optional[User] = None
     parent: Optional[Parent] = None
+
+    # The attributes that can be modified in place, such as by appending to
+    # a list, mapped to the functions decoding them from the Notion format.
+    _IN_PLACE_FIELDS: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
+    def __post_init__(self):
+
+        super().__post_init__()
+        # The names of the attributes that were reassigned since the
+        # object was retrieved from Notion.
+        self._modified_fields: Set[str] = set()
+        # The attributes in `_IN_PLACE_FIELDS` in the Notion format, if
+        # the changes made in place are tracked.
+        self._raw_in_place: Optional[dict[str, Any]] = None
+
+    def __setattr__(self, name: str, value: Any):
+
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and "_modified_fields" in self.__dict__:
+            self._modified_fields.add(name)
+
+    def _mark_clean(self, raw_in_place: Optional[dict[str, Any]] = None):
+        """Marks the object as unmodified since it was retrieved from Notion.
+
+        Attributes:
+            raw_in_place:
+                The attributes in `_IN_PLACE_FIELDS` in the Notion format,
+                against which the changes made in place are detected. If
+                `None`, only the reassigned attributes are detected.
+        """
+
+        self._modified_fields.clear()
+        self._raw_in_place = raw_in_place
+
+    def _changed_fields(self) -> Set[str]:
+        """The names of the attributes that were reassigned or modified in
+        place since the object was retrieved from Notion."""
+
+        changed = set(self._modified_fields)
+        if self._raw_in_place is None:
+            return changed
+
+        # The attributes are decoded again only now, since the changes
+        # made in place are only needed when updating.
+        for name, decode in self._IN_PLACE_FIELDS.items():
+            if name in changed:
+                continue
+            if getattr(self, name) != decode(self._raw_in_place[name]):
+                changed.add(name)
+        return changed
+
+    def _apply_update(self: N, updated: N, in_place: bool) -> N:
+
+        if not in_place:
+            return updated
+        self.__dict__.clear()
+        self.__dict__ = updated.__dict__
+        return self
+
+    async def _unchanged(self: N) -> N:
+        """Used in place of an update by objects bound to an
+        `AsyncNotionClient` when there is nothing to update."""
+
+        return self
+
+    async def _await_update(self: N, updated: Awaitable[N], in_place: bool) -> N:
+
+        return self._apply_update(await updated, in_place)
+
+
+N = TypeVar("N", bound=NotionObject)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import ClassVar
 from typing import Optional
 from typing import Type
@@ -13,6 +16,7 @@ import nopy.props.page_props as pgp
 from nopy.enums import ObjectTypes
 from nopy.errors import NoClientFoundError
 from nopy.objects.notion_object import NotionObject
+from nopy.properties import LazyProperties
 from nopy.properties import Properties
 from nopy.props.base import ObjectProperty
 from nopy.props.common import Emoji
@@ -26,7 +30,7 @@ from nopy.utils import get_icon
 from nopy.utils import rich_text_list
 
 if TYPE_CHECKING:
-    pass
+    from nopy.identity import IdentityMap
 
 
 @dataclass
@@ -85,6 +89,11 @@ class Page(NotionObject):
         "status": pgp.PStatus,
         "url": pgp.PUrl,
     }
+    _IN_PLACE_FIELDS: ClassVar[dict[str, Callable[[Any], Any]]] = {
+        "rich_title": rich_text_list,
+        "icon": get_icon,
+        "cover": get_cover,
+    }
     title: ClassVar[TextDescriptor] = TextDescriptor("rich_title")
 
     rich_title: list[RichText] = field(default_factory=list)
@@ -103,29 +112,34 @@ class Page(NotionObject):
     def update(self, in_place: bool = False) -> Page:
         """Updates the page.
 
+        Only the attributes and the properties that were modified since
+        the page was retrieved are sent. If nothing was modified, then no
+        request is made and the page itself is returned.
+
         Attributes:
             in_place (bool):
                 If `True`, then this instance is updated in place.
 
         Returns:
             The updated Page instance. Returns `self` if `in_place` is
-                `True`.
+                `True`. If the page is bound to an `AsyncNotionClient`,
+                then an awaitable resolving to the same is returned.
         """
 
         if not self._client:
             raise NoClientFoundError("no client is associated with this instance")
 
-        page = self.serialize()
-        # Parent should not be present when updating
-        page.pop("parent")
+        page = self._serialize_modified()
+        if not page:
+            if inspect.iscoroutinefunction(self._client.update_page):
+                return self._unchanged()  # type: ignore
+            return self
 
         updated_page = self._client.update_page(self.id, page)
 
-        if not in_place:
-            return updated_page
-        self.__dict__.clear()
-        self.__dict__ = updated_page.__dict__
-        return self
+        if inspect.isawaitable(updated_page):
+            return self._await_update(updated_page, in_place)  # type: ignore
+        return self._apply_update(updated_page, in_place)
 
     def serialize(self) -> dict[str, Any]:
 
@@ -144,38 +158,115 @@ class Page(NotionObject):
 
         return serialized
 
+    def _serialize_modified(self) -> dict[str, Any]:
+        """Serializes only what was modified since the page was retrieved."""
+
+        serialized: dict[str, Any] = {}
+        modified = self._changed_fields()
+
+        properties = self.properties.serialize("properties" not in modified)
+        if "rich_title" in modified:
+            properties["title"] = {"title": [rt.serialize() for rt in self.rich_title]}
+        if properties:
+            serialized["properties"] = properties
+
+        if "archived" in modified:
+            serialized["archived"] = self.archived
+        for attr in ("icon", "cover"):
+            if attr in modified:
+                value = getattr(self, attr)
+                serialized[attr] = value if value is None else value.serialize()
+
+        return serialized
+
     @classmethod
-    def from_dict(cls: Type[Page], args: dict[str, Any]) -> Page:
+    def from_dict(
+        cls: Type[Page],
+        args: dict[str, Any],
+        lazy: bool = False,
+        identity_map: Optional[IdentityMap] = None,
+        track_in_place_changes: bool = False,
+    ) -> Page:
+        """Creates a page from the Notion format.
+
+        Attributes:
+            args: The page in the Notion format.
+            lazy:
+                If `True`, then the properties are decoded only when they
+                are first accessed through `page.properties`.
+            identity_map:
+                The identity map through which the users and the parent of
+                the page are interned, if any.
+            track_in_place_changes:
+                If `True`, then the changes made in place to the page and
+                its properties, such as appending to a list, are sent when
+                updating. This keeps the title, the icon, the cover and the
+                properties in the Notion format along with the page.
+        """
 
         # This is needed because a Page object returned by Notion
         # doesn't have the page title directly accessible like in a
         # Database. The title has to be accessed from the `properties`.
         # Also if the page is part of a database, then the keys of the
         # properties are not the ids, but rather the name of the property.
-        props = args["properties"].values()
-        title_gen = (prop for prop in props if prop["id"] == "title")
-        title_list: list[dict[str, Any]] = next(title_gen)["title"]
+        decode_prop: Callable[[str, dict[str, Any]], PageProps] = cls._decode_prop
+        if identity_map is not None:
+            decode_prop = partial(_decode_interned, decode_prop, identity_map)
+
+        title_list: list[dict[str, Any]] = []
+        raw_props: dict[str, dict[str, Any]] = {}
+        properties = Properties()
+        for name, prop in args["properties"].items():
+
+            if prop["type"] == "title":
+                title_list = prop["title"]
+            elif lazy:
+                raw_props[name] = prop
+            else:
+                prop_instance = decode_prop(name, prop)
+                prop_instance._mark_clean(prop if track_in_place_changes else None)
+                properties.add(prop_instance)
+
+        if lazy:
+            properties = LazyProperties(raw_props, decode_prop, track_in_place_changes)
 
         new_args: dict[str, Any] = {
             "rich_title": rich_text_list(title_list),
             "icon": get_icon(args["icon"]),
             "cover": get_cover(args["cover"]),
             "url": args["url"],
+            "properties": properties,
         }
-        # Getting the database properties
-        properties = Properties()
-        for name, prop in args["properties"].items():
+        new_args.update(base_obj_args(args, identity_map))
+
+        page = Page(**new_args)
+        if track_in_place_changes:
+            raw_in_place = {
+                "rich_title": title_list,
+                "icon": args["icon"],
+                "cover": args["cover"],
+            }
+            page._mark_clean(raw_in_place)
+        else:
+            page._mark_clean()
+        return page
+
+    @classmethod
+    def _decode_prop(cls, name: str, prop: dict[str, Any]) -> PageProps:
 
-            prop_type = prop["type"]
-            if prop_type == "title":
-                continue
+        prop_class = cls._REVERSE_MAP.get(prop["type"], ObjectProperty)
+        prop_instance = prop_class.from_dict(prop)
+        # The name is set on the instance instead of the dictionary so that
+        # the page in the Notion format is left untouched.
+        prop_instance.name = name
+        return prop_instance  # type: ignore
 
-            prop_class = cls._REVERSE_MAP.get(prop_type, ObjectProperty)
-            prop["name"] = name
-            prop_instance = prop_class.from_dict(prop)
-            properties.add(prop_instance)
 
-        new_args["properties"] = properties
-        new_args.update(base_obj_args(args))
+def _decode_interned(
+    decode_prop: Callable[[str, dict[str, Any]], PageProps],
+    identity_map: IdentityMap,
+    name: str,
+    prop: dict[str, Any],
+) -> PageProps:
 
-        return Page(**new_args)
+    return identity_map.users_of(decode_prop(name, prop))  # type: ignore
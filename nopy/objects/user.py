@@ -12,7 +12,7 @@ from nopy.enums import UserTypes
 from nopy.objects.notion_object import BaseObject
 
 if TYPE_CHECKING:
-    pass
+    from nopy.directory import UserDirectory
 
 
 @dataclass
@@ -31,13 +31,30 @@ class User(BaseObject):
     def user_type(self):
         return self._user_type
 
+    @property
+    def partial(self) -> bool:
+        """Whether only the id of the user is known, as for the users
+        returned in `created_by` etc."""
+
+        return self._user_type is UserTypes.UNSPPORTED
+
     @classmethod
-    def from_dict(cls: Type[User], args: dict[str, Any]) -> User:
+    def from_dict(
+        cls: Type[User],
+        args: dict[str, Any],
+        directory: Optional[UserDirectory] = None,
+    ) -> User:
+        """Creates a user from the Notion format.
+
+        Partial users, as returned in `created_by` etc., are resolved to the
+        full users through the `directory`, if one is given.
+        """
 
         # This means it's a partial user as returned
         # in `created_by` etc.
         if "type" not in args:
-            return User(args["id"])
+            user = directory.get(args["id"]) if directory is not None else None
+            return user or User(args["id"])
 
         if args["type"] == "person":
             return Person.from_dict(args)
@@ -1,28 +1,38 @@
 from collections.abc import Collection
 from typing import Any
+from typing import Callable
 from typing import Iterable
 from typing import Iterator
 from typing import Optional
-from typing import Set
 from typing import Union
 
 from nopy.errors import PropertyExistsError
 from nopy.errors import PropertyNotFoundError
 from nopy.errors import UnuspportedError
+from nopy.props.base import ObjectProperty
 from nopy.types import Props
 
 
 class Properties(Collection[Props]):
-    """Holds the properties of a database/page."""
+    """Holds the properties of a database/page.
+
+    The properties are kept in the order they were added, which is also
+    the order in which they're iterated over and serialized.
+    """
 
     def __init__(self, props: Optional[Iterable[Props]] = None):
 
-        # The property names mapped to the corresponding property.
-        self._names: dict[str, Props] = {}
-        # The property ids mapped to the corresponding property.
-        self._ids: dict[str, Props] = {}
-        # Keeping this set makes handling __len__ and __iter__ easier.
-        self._props: Set[Props] = set()
+        # The properties in the order they were added. Popped properties
+        # leave a `None` behind until the store is compacted.
+        self._props: list[Optional[Props]] = []
+        # The property names mapped to the position of the property.
+        self._names: dict[str, int] = {}
+        # The property ids mapped to the position of the property.
+        self._ids: dict[str, int] = {}
+        # The identities of the properties mapped to their position, which
+        # still finds the properties whose name or id changed since.
+        self._positions: dict[int, int] = {}
+        self._count = 0
 
         if props is not None:
             for prop in props:
@@ -42,14 +52,21 @@ class Properties(Collection[Props]):
 
         if not prop.name and not prop.id:
             raise ValueError("either id or name must be provided")
-        if prop.name in self._names or prop.id in self._ids or prop in self._props:
+        if (
+            prop.name in self._names
+            or prop.id in self._ids
+            or id(prop) in self._positions
+        ):
             raise PropertyExistsError("'prop' already exists")
 
+        position = len(self._props)
         if prop.name:
-            self._names[prop.name] = prop
+            self._names[prop.name] = position
         if prop.id:
-            self._ids[prop.id] = prop
-        self._props.add(prop)
+            self._ids[prop.id] = position
+        self._positions[id(prop)] = position
+        self._props.append(prop)
+        self._count += 1
 
     def get(self, prop_identifier: str) -> Props:
         """Gets the property based on the given identifier.
@@ -73,23 +90,41 @@ class Properties(Collection[Props]):
             KeyError: Raised if the property isn't found.
         """
 
-        try:
-            if isinstance(prop, str):
-                prop = self.__getitem__(prop)
-
-            self._props.remove(prop)
-            self._names.pop(prop.name, None)
-            self._ids.pop(prop.id, None)
-            return prop
-        except (KeyError, PropertyNotFoundError):
+        if isinstance(prop, str):
+            position = self._find(prop)
+        else:
+            position = self._position(prop)
+        if position is None:
             msg = f"'{prop}' not found"
             raise PropertyNotFoundError(msg)
 
-    def serialize(self) -> dict[str, Optional[dict[str, Any]]]:
+        popped: Props = self._props[position]  # type: ignore
+        self._props[position] = None
+        self._unindex(self._names, popped.name, position)
+        self._unindex(self._ids, popped.id, position)
+        del self._positions[id(popped)]
+        self._count -= 1
+
+        if len(self._props) > 2 * self._count:
+            self._compact()
+        return popped
+
+    def serialize(
+        self, only_modified: bool = False
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Serializes the properties.
+
+        Attributes:
+            only_modified (bool):
+                If `True`, only the properties that were modified since they
+                were retrieved from Notion are serialized.
+        """
 
         serialized: dict[str, Optional[dict[str, Any]]] = {}
 
-        for prop in self._props:
+        for prop in self._iter_props():
+            if only_modified and not prop.modified:
+                continue
             if prop.id:
                 try:
                     serialized[prop.id] = prop.serialize()
@@ -100,30 +135,196 @@ class Properties(Collection[Props]):
 
         return serialized
 
+    def _find(self, prop_identifier: str) -> Optional[int]:
+        """Finds the position of the property with the given name or id."""
+
+        position = self._names.get(prop_identifier, None)
+        if position is None:
+            position = self._ids.get(prop_identifier, None)
+        return position
+
+    def _position(self, prop: Props) -> Optional[int]:
+        """Finds the position of the given property."""
+
+        return self._positions.get(id(prop), None)
+
+    def _unindex(self, index: dict[str, int], key: str, position: int):
+        """Removes the position of a popped property from the index."""
+
+        if index.get(key, None) == position:
+            del index[key]
+            return
+
+        # The property was indexed under a name or an id it no longer has.
+        for stale_key in [k for k, p in index.items() if p == position]:
+            del index[stale_key]
+
+    def _compact(self):
+        """Drops the popped properties from the store and rebuilds the
+        indices."""
+
+        props = list(self._iter_props())
+        self._props = []
+        self._names = {}
+        self._ids = {}
+        self._positions = {}
+        self._count = 0
+        for prop in props:
+            self.add(prop)
+
+    def _iter_props(self) -> Iterator[Props]:
+
+        return (prop for prop in self._props if prop is not None)
+
     # ----- Dunder Methods -----
 
     def __getitem__(self, prop_identifier: str):
 
-        if prop := self._names.get(prop_identifier, None):
-            return prop
-        if prop := self._ids.get(prop_identifier, None):
-            return prop
+        position = self._find(prop_identifier)
+        if position is not None:
+            return self._props[position]
 
         msg = f"property with name or id '{prop_identifier}' not found"
         raise PropertyNotFoundError(msg)
 
     def __contains__(self, __x: object) -> bool:
 
-        return __x in self._names or __x in self._ids or __x in self._props
+        if isinstance(__x, str):
+            return __x in self._names or __x in self._ids
+        if isinstance(__x, ObjectProperty):
+            return self._position(__x) is not None  # type: ignore
+        return False
+
+    def __len__(self) -> int:
+
+        return self._count
+
+    def __iter__(self) -> Iterator[Props]:
+
+        return self._iter_props()
+
+    def __getstate__(self) -> dict[str, Any]:
+
+        # The identities of the properties don't survive copying or
+        # pickling, so the positions are rebuilt from the properties.
+        state = self.__dict__.copy()
+        del state["_positions"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+
+        self.__dict__.update(state)
+        self._positions = {
+            id(prop): position
+            for position, prop in enumerate(self._props)
+            if prop is not None
+        }
+
+    def __str__(self) -> str:
+
+        return str(list(self._iter_props()))
+
+
+class LazyProperties(Properties):
+    """Holds the properties of a page in the Notion format and decodes each
+    property only when it's first accessed.
+
+    Decoding every property of every page is wasteful when only a few of
+    them are read, which is common when querying wide databases. The raw
+    properties are kept as is and are decoded one at a time when they are
+    accessed by their name or id. Iterating over the properties or
+    serializing all of them decodes the rest.
+
+    Attributes:
+        raw_props:
+            The properties in the Notion format keyed by their names.
+        decode:
+            The callable which decodes a single property given its name and
+            the property in the Notion format.
+        track_in_place_changes:
+            If `True`, then the decoded properties keep the property in the
+            Notion format so that the changes made to them in place are
+            detected.
+    """
+
+    def __init__(
+        self,
+        raw_props: dict[str, dict[str, Any]],
+        decode: Callable[[str, dict[str, Any]], Props],
+        track_in_place_changes: bool = False,
+    ):
+
+        super().__init__()
+        # The names of the properties that are yet to be decoded mapped to
+        # the corresponding property in the Notion format.
+        self._raw = raw_props
+        # The ids of the properties that are yet to be decoded mapped to
+        # the corresponding names.
+        self._raw_ids = {prop["id"]: name for name, prop in raw_props.items()}
+        self._decode = decode
+        self._track_in_place_changes = track_in_place_changes
+
+    def add(self, prop: Props):
+
+        if prop.name in self._raw or prop.id in self._raw_ids:
+            raise PropertyExistsError("'prop' already exists")
+        super().add(prop)
+
+    def pop(self, prop: Union[str, Props]) -> Props:
+
+        if isinstance(prop, str):
+            self._materialize(prop)
+        return super().pop(prop)
+
+    def serialize(
+        self, only_modified: bool = False
+    ) -> dict[str, Optional[dict[str, Any]]]:
+
+        # The properties that weren't decoded can't have been modified.
+        if not only_modified:
+            self._materialize_all()
+        return super().serialize(only_modified)
+
+    def _materialize(self, prop_identifier: str):
+        """Decodes the property with the given name or id, if it wasn't
+        already decoded."""
+
+        name = self._raw_ids.get(prop_identifier, prop_identifier)
+        raw_prop = self._raw.pop(name, None)
+        if raw_prop is None:
+            return
+
+        self._raw_ids.pop(raw_prop["id"], None)
+        prop = self._decode(name, raw_prop)
+        prop._mark_clean(raw_prop if self._track_in_place_changes else None)
+        super().add(prop)
+
+    def _materialize_all(self):
+
+        for name in list(self._raw):
+            self._materialize(name)
+
+    # ----- Dunder Methods -----
+
+    def __getitem__(self, prop_identifier: str):
+
+        self._materialize(prop_identifier)
+        return super().__getitem__(prop_identifier)
+
+    def __contains__(self, __x: object) -> bool:
+
+        return __x in self._raw or __x in self._raw_ids or super().__contains__(__x)
 
     def __len__(self) -> int:
 
-        return len(self._props)
+        return super().__len__() + len(self._raw)
 
     def __iter__(self) -> Iterator[Props]:
 
-        return iter(self._props)
+        self._materialize_all()
+        return super().__iter__()
 
     def __str__(self) -> str:
 
-        return str(self._props)
+        self._materialize_all()
+        return super().__str__()
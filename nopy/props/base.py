@@ -1,17 +1,168 @@
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from dataclasses import dataclass
+from dataclasses import fields
 from typing import Any
 from typing import ClassVar
+from typing import Optional
 from typing import Type
+from typing import TypeVar
 
 from nopy.enums import PropTypes
 from nopy.errors import UnsupportedByLibraryError
+from nopy.errors import UnuspportedError
+
+T = TypeVar("T")
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Recreates the given dataclass with `__slots__` for all of its fields
+    so that its instances don't carry a `__dict__`.
+
+    This is the same as `dataclass(slots=True)` which is only available
+    from Python 3.10 onwards. It must be applied on top of `@dataclass`.
+    Attributes that aren't fields, such as those set in `__post_init__`,
+    have to be declared in the `__slots__` of the class itself. All the
+    bases must be slotted as well for the `__dict__` to be dropped.
+    """
+
+    cls_dict = dict(cls.__dict__)
+    extra_slots = cls_dict.pop("__slots__", ())
+    if isinstance(extra_slots, str):
+        extra_slots = (extra_slots,)
+
+    inherited_slots: set[str] = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(base.__dict__.get("__slots__", ()))
+
+    names = [f.name for f in fields(cls)] + list(extra_slots)  # type: ignore
+    for name in names:
+        # Removing the defaults and the descriptors of the old slots since
+        # they would conflict with the new slots.
+        cls_dict.pop(name, None)
+    cls_dict["__slots__"] = tuple(
+        name for name in dict.fromkeys(names) if name not in inherited_slots
+    )
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # Methods using `super()` without arguments hold a reference to the old
+    # class which has to be pointed to the new one.
+    for value in cls_dict.values():
+        funcs = [getattr(value, "__func__", value)]
+        if isinstance(value, property):
+            funcs = [value.fget, value.fset, value.fdel]
+        for func in funcs:
+            for cell in getattr(func, "__closure__", None) or ():
+                if cell.cell_contents is cls:
+                    cell.cell_contents = slotted_cls
+
+    return slotted_cls
+
+
+# The frozen counterparts of the classes keyed by the classes.
+_FROZEN_CLASSES: dict[type, type] = {}
+
+
+def frozen(obj: T) -> T:
+    """Makes the given dataclass instance read only, in place, by changing
+    its class to the frozen variant of its class.
+
+    This is used for the instances that are shared, such as the users and
+    the parents interned by an `IdentityMap`, so that modifying one of them
+    doesn't silently modify all the objects sharing it.
+
+    The frozen variant is a subclass of the original class whose attributes
+    can't be assigned to, like a frozen dataclass. Instantiating it, which
+    `dataclasses.replace` does, creates a new read only instance. Instances
+    of the two classes with the same fields compare equal.
+    """
+
+    cls = type(obj)
+    if "__frozen_base__" not in cls.__dict__:
+        object.__setattr__(obj, "__class__", _frozen_class(cls))
+    return obj
+
+
+def _frozen_class(cls: Type[T]) -> Type[T]:
+
+    frozen_cls = _FROZEN_CLASSES.get(cls, None)
+    if frozen_cls is not None:
+        return frozen_cls
+
+    def __new__(_: type, *args: Any, **kwargs: Any):
+
+        # The instance is created by the original class, since its
+        # `__init__` assigns to the attributes, and then frozen.
+        return frozen(cls(*args, **kwargs))
+
+    def __init__(self: Any, *args: Any, **kwargs: Any):
+
+        # Already initialized by `__new__`.
+        pass
+
+    def __setattr__(self: Any, name: str, value: Any = None):
+
+        msg = (
+            f"the {cls.__name__} is shared and can't be modified, "
+            "assign a new one or use dataclasses.replace instead"
+        )
+        raise FrozenInstanceError(msg)
+
+    def __reduce__(self: Any):
+
+        init_args = {f.name: getattr(self, f.name) for f in fields(cls) if f.init}
+        return _make_frozen, (cls, init_args)
+
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": f"Frozen{cls.__qualname__}",
+        "__frozen_base__": cls,
+        "__new__": __new__,
+        "__init__": __init__,
+        "__setattr__": __setattr__,
+        "__delattr__": __setattr__,
+        "__reduce__": __reduce__,
+        # Read only instances can be shared by the copies.
+        "__copy__": lambda self: self,
+        "__deepcopy__": lambda self, memo: self,
+    }
+    if cls.__dataclass_params__.eq:  # type: ignore
+
+        def __eq__(self: Any, other: Any) -> Any:
+
+            if type(other) not in (cls, frozen_cls):
+                return NotImplemented
+            return _compared_fields(self, cls) == _compared_fields(other, cls)
+
+        namespace["__eq__"] = __eq__
+        namespace["__hash__"] = cls.__hash__
+
+    frozen_cls = type(f"Frozen{cls.__name__}", (cls,), namespace)
+    _FROZEN_CLASSES[cls] = frozen_cls
+    return frozen_cls  # type: ignore
+
+
+def _compared_fields(obj: Any, cls: type) -> tuple[Any, ...]:
+
+    return tuple(getattr(obj, f.name) for f in fields(cls) if f.compare)
+
+
+def _make_frozen(cls: type, init_args: dict[str, Any]) -> Any:
+
+    return frozen(cls(**init_args))
 
 
 class BaseProperty:
     """The base class from which all properties inherit."""
 
+    __slots__ = ()
+
     def serialize(self) -> dict[str, Any]:
 
         msg = f"serialization of '{self.__class__.__name__}' type properties"
@@ -26,21 +177,76 @@ class BaseProperty:
         raise NotImplementedError("to be implemented by subclass")
 
 
+@slotted
 @dataclass(eq=False)
 class ObjectProperty(BaseProperty):
     """The base class from which all properties directly available
     on databases and pages inherit."""
 
+    # The property in the Notion format it was decoded from, which changes
+    # made in place are detected against if they're tracked.
+    __slots__ = ("_modified", "_raw")
+
     _type: ClassVar[PropTypes] = PropTypes.UNSUPPORTED
 
     id: str = ""
     name: str = ""
 
+    def __setattr__(self, name: str, value: Any):
+
+        object.__setattr__(self, name, value)
+        # Properties are marked as modified on any change to their public
+        # attributes, including when they are first created.
+        if name[0] != "_":
+            object.__setattr__(self, "_modified", True)
+
     @property
     def type(self) -> PropTypes:
         return self._type
 
+    @property
+    def modified(self) -> bool:
+        """Whether the property was modified since it was retrieved from
+        Notion. Properties that were created locally are always modified.
+
+        Changes made in place, like appending to a list, are detected only
+        if the property was decoded with `track_in_place_changes`, by
+        decoding it again from the Notion format and comparing the two.
+        Otherwise, such changes have to be marked with `mark_modified`.
+        """
+
+        if getattr(self, "_modified", True):
+            return True
+        raw = getattr(self, "_raw", None)
+        if raw is None:
+            return False
+
+        original = self.from_dict(raw)
+        object.__setattr__(original, "name", self.name)
+        return _serialize(self) != _serialize(original)
+
+    def mark_modified(self):
+        """Marks the property as modified so that it's sent on update."""
+
+        self._modified = True
+
+    def _mark_clean(self, raw: Optional[dict[str, Any]] = None):
+        """Marks the property as unmodified since it was decoded from `raw`,
+        the property in the Notion format, if given."""
+
+        self._modified = False
+        self._raw = raw
+
     @classmethod
     def from_dict(cls: Type[ObjectProperty], args: dict[str, Any]) -> ObjectProperty:
 
         return cls(name=args.get("name", ""), id=args["id"])
+
+
+def _serialize(prop: BaseProperty) -> Optional[dict[str, Any]]:
+
+    try:
+        return prop.serialize()
+    except (UnuspportedError, NotImplementedError):
+        # Properties that can't be serialized can't be sent either.
+        return None
@@ -8,8 +8,11 @@ from typing import Optional
 from typing import Type
 from zoneinfo import ZoneInfo
 
-from dateutil.parser import parse
-
+from nopy.enums import COLORS
+from nopy.enums import FILE_TYPES
+from nopy.enums import MENTION_TYPES
+from nopy.enums import PARENT_TYPES
+from nopy.enums import RICH_TEXT_TYPES
 from nopy.enums import Colors
 from nopy.enums import FileTypes
 from nopy.enums import MentionTypes
@@ -18,8 +21,12 @@ from nopy.enums import RichTextTypes
 from nopy.errors import UnsupportedByNotion
 from nopy.objects.user import User
 from nopy.props.base import BaseProperty
+from nopy.props.base import frozen
+from nopy.props.base import slotted
+from nopy.timestamps import parse_datetime
 
 
+@slotted
 @dataclass
 class Annotations(BaseProperty):
     """A representation of the annotations.
@@ -43,17 +50,32 @@ class Annotations(BaseProperty):
     @classmethod
     def from_dict(cls: Type[Annotations], args: dict[str, Any]) -> Annotations:
 
+        if args == _DEFAULT_ANNOTATIONS_ARGS:
+            return DEFAULT_ANNOTATIONS
+
         new_args: dict[str, Any] = args.copy()
-        new_args["color"] = Colors[new_args["color"].upper()]
+        new_args["color"] = COLORS[new_args["color"]]
         return Annotations(**new_args)
 
     def serialize(self) -> dict[str, Any]:
 
-        serialized = self.__dict__.copy()
-        serialized["color"] = self.color.value
-        return serialized
+        return {
+            "bold": self.bold,
+            "italic": self.italic,
+            "strikethrough": self.strikethrough,
+            "underline": self.underline,
+            "code": self.code,
+            "color": self.color.value,
+        }
+
 
+DEFAULT_ANNOTATIONS = frozen(Annotations())
+"""The annotations shared by all the decoded text that's unstyled. It
+can't be modified, so assign new annotations to restyle such text."""
+_DEFAULT_ANNOTATIONS_ARGS = DEFAULT_ANNOTATIONS.serialize()
 
+
+@slotted
 @dataclass
 class Date(BaseProperty):
     """A representation of a date in Notion.
@@ -79,17 +101,18 @@ class Date(BaseProperty):
     @classmethod
     def from_dict(cls: Type[Date], args: dict[str, Any]) -> Date:
 
-        start = parse(args["start"])
+        start = parse_datetime(args["start"])
         end = None
         time_zone = None
         if end_str := args["end"]:
-            end = parse(end_str)
+            end = parse_datetime(end_str)
         if tz := args["time_zone"]:
             time_zone = ZoneInfo(tz)
 
         return Date(start, end, time_zone)
 
 
+@slotted
 @dataclass
 class Link(BaseProperty):
     """A representation of a link object.
@@ -108,6 +131,7 @@ class Link(BaseProperty):
         return {"url": self.url}
 
 
+@slotted
 @dataclass
 class RichText(BaseProperty):
     """A represenation of a rich text property.
@@ -121,6 +145,8 @@ class RichText(BaseProperty):
             `RichText.UNSUPPORTED`.
     """
 
+    __slots__ = ("_type",)
+
     plain_text: str = ""
     href: str = ""
     annotations: Annotations = field(default_factory=Annotations)
@@ -138,10 +164,7 @@ class RichText(BaseProperty):
     @classmethod
     def from_dict(cls: Type[RichText], args: dict[str, Any]) -> RichText:
 
-        try:
-            rich_text_type = RichTextTypes[args["type"].upper()]
-        except KeyError:
-            rich_text_type = RichTextTypes.UNSUPPORTED
+        rich_text_type = RICH_TEXT_TYPES.get(args["type"], RichTextTypes.UNSUPPORTED)
 
         if rich_text_type == RichTextTypes.TEXT:
             return Text.from_dict(args)
@@ -154,6 +177,7 @@ class RichText(BaseProperty):
         return RichText(**base)
 
 
+@slotted
 @dataclass
 class Text(RichText):
     """A represenation of a text type of rich text.
@@ -198,6 +222,7 @@ class Text(RichText):
         return serialized
 
 
+@slotted
 @dataclass
 class Mention(RichText):
     """A represenation of a mention type of rich text.
@@ -233,9 +258,8 @@ class Mention(RichText):
     def from_dict(cls: Type[Mention], args: dict[str, Any]) -> Mention:
 
         new_args: dict[str, Any] = _rich_text_base_args(args)
-        try:
-            mention_type = MentionTypes[args["mention"]["type"].upper()]
-        except KeyError:
+        mention_type = MENTION_TYPES.get(args["mention"]["type"], None)
+        if mention_type is None:
             mention_type = MentionTypes.UNSUPPORTED
             new_args["mention_type"] = mention_type
             return Mention(**new_args)
@@ -254,6 +278,7 @@ class Mention(RichText):
         return Mention(**new_args)
 
 
+@slotted
 @dataclass
 class Equation(RichText):
     """A represenation of an equation type of rich text.
@@ -283,6 +308,7 @@ class Equation(RichText):
         return Equation(**new_args)
 
 
+@slotted
 @dataclass
 class File(BaseProperty):
     """A representation of a File object.
@@ -303,7 +329,7 @@ class File(BaseProperty):
     @classmethod
     def from_dict(cls: Type[File], args: dict[str, Any]) -> File:
 
-        file_type = FileTypes[args["type"].upper()]
+        file_type = FILE_TYPES[args["type"]]
         file_details = args[file_type.value]
 
         new_args: dict[str, Any] = {
@@ -313,7 +339,7 @@ class File(BaseProperty):
 
         # Only files hosted by Notion have expiry dates
         if file_type == FileTypes.FILE:
-            new_args["expiry_time"] = parse(file_details["expiry_time"])
+            new_args["expiry_time"] = parse_datetime(file_details["expiry_time"])
 
         return File(**new_args)
 
@@ -331,6 +357,7 @@ class File(BaseProperty):
         }
 
 
+@slotted
 @dataclass
 class Option(BaseProperty):
     """A representation of an Option.
@@ -350,13 +377,15 @@ class Option(BaseProperty):
 
     @classmethod
     def from_dict(cls: Type[Option], args: dict[str, Any]) -> Option:
-        args["color"] = Colors[args["color"].upper()]
-        return Option(**args)
+        new_args: dict[str, Any] = args.copy()
+        new_args["color"] = COLORS[new_args["color"]]
+        return Option(**new_args)
 
     def serialize(self) -> dict[str, Any]:
         return {"name": self.name, "color": self.color.value}
 
 
+@slotted
 @dataclass
 class StatusGroup(BaseProperty):
     """A representation of a Status Group.
@@ -376,11 +405,13 @@ class StatusGroup(BaseProperty):
     @classmethod
     def from_dict(cls: Type[StatusGroup], args: dict[str, Any]) -> StatusGroup:
 
-        args["color"] = Colors[args["color"].upper()]
+        new_args: dict[str, Any] = args.copy()
+        new_args["color"] = COLORS[new_args["color"]]
 
-        return StatusGroup(**args)
+        return StatusGroup(**new_args)
 
 
+@slotted
 @dataclass
 class Emoji(BaseProperty):
     """A representation of the Emoji object.
@@ -399,6 +430,7 @@ class Emoji(BaseProperty):
         return {"emoji": self.emoji, "type": "emoji"}
 
 
+@slotted
 @dataclass
 class Parent(BaseProperty):
     """A representation of a parent of a Notion object.
@@ -412,6 +444,8 @@ class Parent(BaseProperty):
             `ParentTypes.UNSUPPORTED`.
     """
 
+    __slots__ = ("_type",)
+
     id: str = ""
 
     def __post_init__(self):
@@ -420,11 +454,8 @@ class Parent(BaseProperty):
     @classmethod
     def from_dict(cls: Type[Parent], args: dict[str, Any]) -> Parent:
 
-        try:
-            type_key = args["type"].split("_")[0]
-            parent_type = ParentTypes[type_key.upper()]
-        except KeyError:
-            parent_type = ParentTypes.UNSUPPORTED
+        type_key = args["type"].split("_")[0]
+        parent_type = PARENT_TYPES.get(type_key, ParentTypes.UNSUPPORTED)
 
         if parent_type == ParentTypes.DATABASE:
             return DatabaseParent.from_dict(args)
@@ -448,6 +479,7 @@ class Parent(BaseProperty):
         }
 
 
+@slotted
 @dataclass
 class DatabaseParent(Parent):
     """A representation of a database parent of a Notion object.
@@ -467,6 +499,7 @@ class DatabaseParent(Parent):
         return DatabaseParent(args[ParentTypes.DATABASE.value])
 
 
+@slotted
 @dataclass
 class PageParent(Parent):
     """A representation of a page parent of a Notion object.
@@ -486,6 +519,7 @@ class PageParent(Parent):
         return PageParent(args[ParentTypes.PAGE.value])
 
 
+@slotted
 @dataclass
 class WorkspaceParent(Parent):
     """A representation of a workspace parent of a Notion object.
@@ -508,6 +542,7 @@ class WorkspaceParent(Parent):
         return WorkspaceParent(args[ParentTypes.WORKSPACE.value])
 
 
+@slotted
 @dataclass
 class BlockParent(Parent):
     """A representation of a block parent of a Notion object.
@@ -9,6 +9,8 @@ from typing import Literal
 from typing import Optional
 from typing import Type
 
+from nopy.enums import NUMBER_FORMATS
+from nopy.enums import ROLLUP_FUNCTIONS
 from nopy.enums import NumberFormat
 from nopy.enums import PropTypes
 from nopy.enums import RollupFunctions
@@ -65,9 +67,7 @@ class DBNumber(DBProp):
     def from_dict(cls: Type[DBNumber], args: dict[str, Any]) -> DBNumber:
 
         format = args[DBNumber._type.value]["format"]
-        return DBNumber(
-            id=args["id"], name=args["name"], format=NumberFormat[format.upper()]
-        )
+        return DBNumber(id=args["id"], name=args["name"], format=NUMBER_FORMATS[format])
 
 
 @dataclass(eq=False)
@@ -337,7 +337,7 @@ class DBRelation(DBProp):
     def from_dict(cls: Type[DBRelation], args: dict[str, Any]) -> DBRelation:
 
         # This is some trash code, but it works.
-        relation = args[DBRelation._type.value]
+        relation = args[DBRelation._type.value].copy()
         relation_type = relation.pop("type")
         details = relation.pop(relation_type)
         relation.update(details)
@@ -399,8 +399,8 @@ class DBRollup(DBProp):
     @classmethod
     def from_dict(cls: Type[DBRollup], args: dict[str, Any]) -> DBRollup:
 
-        rollup_details = args[DBRollup._type.value]
-        rollup_details["function"] = RollupFunctions[rollup_details["function"].upper()]
+        rollup_details = args[DBRollup._type.value].copy()
+        rollup_details["function"] = ROLLUP_FUNCTIONS[rollup_details["function"]]
         return DBRollup(id=args["id"], name=args["name"], **rollup_details)
 
     def serialize(self) -> dict[str, Any]:
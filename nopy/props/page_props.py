@@ -10,20 +10,22 @@ from typing import Optional
 from typing import Type
 from typing import Union
 
-from dateutil.parser import parse
-
+from nopy.enums import ROLLUP_FUNCTIONS
 from nopy.enums import PropTypes
 from nopy.enums import RollupFunctions
 from nopy.errors import UnsupportedByNotion
 from nopy.objects.user import User
 from nopy.props.base import ObjectProperty
+from nopy.props.base import slotted
 from nopy.props.common import Date
 from nopy.props.common import File
 from nopy.props.common import Option
 from nopy.props.common import RichText
+from nopy.timestamps import parse_datetime
 from nopy.utils import TextDescriptor
 
 
+@slotted
 @dataclass(eq=False)
 class PCheckbox(ObjectProperty):
     """A representation of a checkbox property of a page.
@@ -53,6 +55,7 @@ class PCheckbox(ObjectProperty):
         )
 
 
+@slotted
 @dataclass(eq=False)
 class PCreatedby(ObjectProperty):
     """A representation of a created by property of a page.
@@ -84,6 +87,7 @@ class PCreatedby(ObjectProperty):
         return PCreatedby(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PCreatedTime(ObjectProperty):
     """A representation of a created time property of a page.
@@ -110,11 +114,12 @@ class PCreatedTime(ObjectProperty):
     def from_dict(cls: Type[PCreatedTime], args: dict[str, Any]) -> PCreatedTime:
 
         new_args = _get_base_page_args(args)
-        new_args["created_time"] = parse(args[cls._type.value])
+        new_args["created_time"] = parse_datetime(args[cls._type.value])
 
         return PCreatedTime(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PDate(ObjectProperty):
     """A representation of a date property of a page.
@@ -148,6 +153,7 @@ class PDate(ObjectProperty):
         return PDate(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PEmail(ObjectProperty):
     """A representation of a email property of a page.
@@ -178,6 +184,7 @@ class PEmail(ObjectProperty):
         return PEmail(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PFiles(ObjectProperty):
     """A representation of a files property of a page.
@@ -208,6 +215,7 @@ class PFiles(ObjectProperty):
         return PFiles(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PFormula(ObjectProperty):
     """A representation of a formula property of a page.
@@ -245,6 +253,7 @@ class PFormula(ObjectProperty):
         return PFormula(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PLastEditedBy(ObjectProperty):
     """A representation of a last edited by property of a page.
@@ -276,6 +285,7 @@ class PLastEditedBy(ObjectProperty):
         return PLastEditedBy(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PLastEditedTime(ObjectProperty):
     """A representation of a last edited time property of a page.
@@ -302,11 +312,12 @@ class PLastEditedTime(ObjectProperty):
     def from_dict(cls: Type[PLastEditedTime], args: dict[str, Any]) -> PLastEditedTime:
 
         new_args = _get_base_page_args(args)
-        new_args["last_edited_time"] = parse(args[cls._type.value])
+        new_args["last_edited_time"] = parse_datetime(args[cls._type.value])
 
         return PLastEditedTime(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PMultiselect(ObjectProperty):
     """A representation of a multi select property of a page.
@@ -337,6 +348,7 @@ class PMultiselect(ObjectProperty):
         return PMultiselect(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PNumber(ObjectProperty):
     """A representation of a number property of a page.
@@ -367,6 +379,7 @@ class PNumber(ObjectProperty):
         return PNumber(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PPeople(ObjectProperty):
     """A representation of a people property of a page.
@@ -397,6 +410,7 @@ class PPeople(ObjectProperty):
         return PPeople(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PPhonenumber(ObjectProperty):
     """A representation of a phone number property of a page.
@@ -426,6 +440,7 @@ class PPhonenumber(ObjectProperty):
         return PPhonenumber(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PRelation(ObjectProperty):
     """A representation of a relation property of a page.
@@ -463,6 +478,7 @@ class PRelation(ObjectProperty):
         return PRelation(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PRollup(ObjectProperty):
     """A representation of a rollup property of a page.
@@ -498,12 +514,13 @@ class PRollup(ObjectProperty):
         rollup = {
             "value_type": rollup_details["type"],
             "value": rollup_details[rollup_details["type"]],
-            "function": RollupFunctions[rollup_details["function"].upper()],
+            "function": ROLLUP_FUNCTIONS[rollup_details["function"]],
         }
 
         return PRollup(**new_args, **rollup)
 
 
+@slotted
 @dataclass(eq=False)
 class PRichtext(ObjectProperty):
     """A representation of a rich text property of a page.
@@ -536,6 +553,7 @@ class PRichtext(ObjectProperty):
         return PRichtext(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PSelect(ObjectProperty):
     """A representation of a select property of a page.
@@ -569,6 +587,7 @@ class PSelect(ObjectProperty):
         return PSelect(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PStatus(ObjectProperty):
     """A representation of a status property of a page.
@@ -600,6 +619,7 @@ class PStatus(ObjectProperty):
         return PStatus(**new_args)
 
 
+@slotted
 @dataclass(eq=False)
 class PUrl(ObjectProperty):
     """A representation of a url property of a page.
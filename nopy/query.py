@@ -1,11 +1,33 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from dataclasses import field
+from datetime import datetime
+from datetime import timezone
 from typing import Any
+from typing import Iterable
+from typing import Optional
 from typing import Union
 
+from nopy.enums import PropTypes
+from nopy.filters import DateFilter
 from nopy.filters import Filter
+from nopy.filters import TimestampFilter
 from nopy.sorts import PropertySort
 from nopy.sorts import TimestampSort
+from nopy.types import DBProps
+
+# The property types whose filters have the same conditions. A filter
+# written for one of the types is valid for the others once its key is
+# changed to the actual type of the property.
+_COMPATIBLE_TYPES: tuple[frozenset[str], ...] = (
+    frozenset({"title", "rich_text", "url", "email", "phone_number"}),
+    frozenset({"date", "created_time", "last_edited_time"}),
+    frozenset({"people", "created_by", "last_edited_by"}),
+)
+
+# The number of levels compound filters can be nested in Notion.
+_MAX_FILTER_DEPTH = 2
 
 
 @dataclass
@@ -18,8 +40,8 @@ class Query:
         sorts: The sorts to be applied to the results.
     """
 
-    and_filters: list[Filter] = field(default_factory=list)
-    or_filters: list[Filter] = field(default_factory=list)
+    and_filters: list[Union[Filter, TimestampFilter]] = field(default_factory=list)
+    or_filters: list[Union[Filter, TimestampFilter]] = field(default_factory=list)
     sorts: list[Union[TimestampSort, PropertySort]] = field(default_factory=list)
 
     def serialize(self):
@@ -38,3 +60,210 @@ class Query:
             serialized["sorts"] = [sort.serialize() for sort in self.sorts]
 
         return serialized
+
+    def fingerprint(self, db_id: str = "") -> str:
+        """A hash of the query on the database which is the same for all the
+        equivalent queries. See `nopy.query.fingerprint`."""
+
+        return fingerprint(self.serialize(), db_id)
+
+
+def fingerprint(query: Optional[dict[str, Any]], db_id: str = "") -> str:
+    """Hashes the query in the Notion format on the database.
+
+    The hash doesn't depend on the order of the keys, on empty filters and
+    sorts, or on the pagination arguments, so equivalent queries have the
+    same fingerprint.
+
+    Attributes:
+        query: The query in the Notion format.
+        db_id: The id of the database being queried, if any.
+    """
+
+    canonical: dict[str, Any] = {"database": db_id.replace("-", "")}
+    for key in ("filter", "sorts"):
+        if query and query.get(key, None):
+            canonical[key] = query[key]
+
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def partition_by_created_time(
+    query: Optional[dict[str, Any]],
+    partitions: int,
+    start: datetime,
+    end: Optional[datetime] = None,
+) -> list[dict[str, Any]]:
+    """Splits the query into queries over disjoint ranges of the time the
+    pages were created between `start` and `end`.
+
+    The first and the last ranges are left open so that no pages are missed
+    if `start` is later than the oldest page or if pages are created after
+    `end`. The boundaries are rounded down to the minute since that's the
+    precision of the timestamps in Notion.
+
+    Attributes:
+        query: The query in the Notion format.
+        partitions: The number of partitions.
+        start: The time from which the ranges are split.
+        end: The time up to which the ranges are split. Defaults to now.
+
+    If the filter of the query is nested too deeply to be chained with
+    the ranges, then a single partition with the whole query is returned.
+
+    Returns:
+        A list of keyword arguments with the partitioned `query` for each
+        partition.
+    """
+
+    query = query or {}
+    base_filter = query.get("filter")
+    if base_filter and list(base_filter) != ["and"]:
+        if _filter_depth(base_filter) >= _MAX_FILTER_DEPTH:
+            return [{"query": and_filters(query, [])}]
+    end = end or datetime.now(timezone.utc)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+
+    step = (end - start) / max(partitions, 1)
+    boundaries = {
+        (start + step * i).replace(second=0, microsecond=0)
+        for i in range(1, partitions)
+    }
+    edges: list[Optional[datetime]] = [None, *sorted(boundaries), None]
+
+    partition_queries: list[dict[str, Any]] = []
+    for lower, upper in zip(edges, edges[1:]):
+        filters: list[dict[str, Any]] = []
+        if lower is not None:
+            date_filter = DateFilter(on_or_after=lower)
+            filters.append(TimestampFilter("created_time", date_filter).serialize())
+        if upper is not None:
+            date_filter = DateFilter(before=upper)
+            filters.append(TimestampFilter("created_time", date_filter).serialize())
+        partition_queries.append({"query": and_filters(query, filters)})
+
+    return partition_queries
+
+
+def and_filters(query: dict[str, Any], filters: list[dict[str, Any]]) -> dict[str, Any]:
+    """Creates a copy of the query where its filter is chained with the
+    given filters by "and".
+
+    Attributes:
+        query: The query in the Notion format.
+        filters: The filters in the Notion format.
+
+    Raises:
+        ValueError: Raised if chaining the filters would nest the filter of
+            the query deeper than Notion allows.
+    """
+
+    new_query = {
+        key: value
+        for key, value in query.items()
+        if key not in ("filter", "start_cursor", "page_size")
+    }
+
+    filters = list(filters)
+    if base_filter := query.get("filter"):
+        if list(base_filter) == ["and"]:
+            filters = base_filter["and"] + filters
+        elif filters and _filter_depth(base_filter) >= _MAX_FILTER_DEPTH:
+            msg = (
+                "can't chain filters with a filter which is already nested "
+                f"{_MAX_FILTER_DEPTH} levels deep, the most Notion allows"
+            )
+            raise ValueError(msg)
+        else:
+            filters.insert(0, base_filter)
+
+    if len(filters) == 1:
+        new_query["filter"] = filters[0]
+    elif filters:
+        new_query["filter"] = {"and": filters}
+    return new_query
+
+
+def _filter_depth(filter: dict[str, Any]) -> int:
+    """The number of levels of compound filters in the filter."""
+
+    for key in ("and", "or"):
+        if key in filter:
+            return 1 + max((_filter_depth(f) for f in filter[key]), default=0)
+    return 0
+
+
+def resolve_filters(
+    query: Optional[dict[str, Any]],
+    props: Iterable[DBProps],
+    title: Optional[tuple[str, str]] = None,
+) -> dict[str, Any]:
+    """Creates a copy of the query where the filters on properties refer
+    to the properties by their ids and use the types of the properties.
+
+    This lets filters be written with the names of the properties and with
+    the filters of a compatible type, such as a `TextFilter` on a title or
+    a `DateFilter` on the time a page was created. The filters on the
+    properties that aren't found are left as is.
+
+    Attributes:
+        query: The query in the Notion format.
+        props: The properties of the database being queried.
+        title:
+            The name and the id of the title property of the database,
+            which isn't part of its properties.
+    """
+
+    query = dict(query or {})
+    if not query.get("filter"):
+        return query
+
+    # The identifiers of the properties mapped to the identifier the
+    # property is referred to by and the type of the property.
+    by_identifier: dict[str, tuple[str, str]] = {}
+    for prop in props:
+        resolved = (prop.id or prop.name, prop.type.value)
+        if prop.name:
+            by_identifier[prop.name] = resolved
+        if prop.id:
+            by_identifier[prop.id] = resolved
+    if title is not None:
+        name, id = title
+        for identifier in title:
+            if identifier:
+                by_identifier[identifier] = (id or name, PropTypes.TITLE.value)
+
+    query["filter"] = _resolve_filter(query["filter"], by_identifier)
+    return query
+
+
+def _resolve_filter(
+    filter: dict[str, Any], props: dict[str, tuple[str, str]]
+) -> dict[str, Any]:
+
+    for compound in ("and", "or"):
+        if compound in filter:
+            return {compound: [_resolve_filter(sub, props) for sub in filter[compound]]}
+
+    prop = props.get(filter.get("property", None), None)  # type: ignore
+    if prop is None:
+        return filter
+
+    identifier, prop_type = prop
+    resolved: dict[str, Any] = {"property": identifier}
+    for key, condition in filter.items():
+        if key != "property":
+            resolved[_compatible_type(key, prop_type)] = condition
+    return resolved
+
+
+def _compatible_type(filter_type: str, prop_type: str) -> str:
+
+    for types in _COMPATIBLE_TYPES:
+        if filter_type in types and prop_type in types:
+            return prop_type
+    return filter_type
@@ -0,0 +1,59 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """A thread safe token bucket rate limiter.
+
+    The bucket holds up to `burst` tokens and is refilled at `rate` tokens
+    per second. Every request consumes a single token. When the bucket is
+    empty, the request reserves a token from the future and has to wait
+    until that token would have been added to the bucket. Since the
+    reservations are made under a lock, all the threads sharing the limiter
+    are spaced out evenly instead of bursting together.
+
+    Attributes:
+        rate: The number of requests allowed per second.
+        burst: The maximum number of requests that can be made at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+
+        if rate <= 0:
+            raise ValueError("'rate' must be greater than 0")
+        if burst < 1:
+            raise ValueError("'burst' must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserves a token.
+
+        Returns:
+            The number of seconds to wait before the request can be made.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last
+            self._last = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            # A negative number of tokens means the token was borrowed from
+            # the future, so the wait is the time taken to repay it.
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Blocks the current thread until a request can be made."""
+
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
@@ -0,0 +1,139 @@
+import random
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet
+from typing import Optional
+
+import httpx
+
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({409, 429, 500, 502, 503, 504})
+"""The status codes that are retried by default. Notion returns 409 for
+conflicting concurrent writes and 429 when the rate limit is exceeded."""
+
+
+@dataclass
+class RetryPolicy:
+    """The policy that decides whether a response with a failing status
+    code should be retried and how long to wait before doing so.
+
+    The wait before the nth retry is a random value between 0 and
+    `backoff_factor * 2 ** n` capped at `max_backoff` ("full jitter").
+    If the response has a `Retry-After` header, then that is waited for
+    instead, up to `max_retry_after`.
+
+    NOTE: Requests that create objects are retried as well, which can
+    lead to duplicates if Notion failed after creating the object.
+
+    Attributes:
+        max_retries: The maximum number of times a request is retried.
+        status_codes: The status codes that are retried.
+        backoff_factor: The base of the exponential backoff in seconds.
+        max_backoff: The maximum number of seconds to wait between retries.
+        jitter: Whether the backoff is randomized or not.
+        respect_retry_after:
+            Whether to use the `Retry-After` header, if present, as the
+            wait instead of the backoff.
+        max_retry_after:
+            The maximum number of seconds to wait for as asked by the
+            `Retry-After` header. This is separate from `max_backoff` since
+            retrying sooner than Notion asked only leads to more 429s.
+    """
+
+    max_retries: int = 5
+    status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 300.0
+
+    def should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        """Checks if the request should be retried.
+
+        Attributes:
+            response: The response to the request.
+            attempt: The number of retries already made.
+        """
+
+        return response.status_code in self.status_codes and (
+            attempt < self.max_retries
+        )
+
+    def get_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Gets the number of seconds to wait before the next retry.
+
+        Attributes:
+            response: The response to the request.
+            attempt: The number of retries already made.
+        """
+
+        if self.respect_retry_after:
+            retry_after = _parse_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+@dataclass
+class RetryStats:
+    """The metrics of the retries made by a client.
+
+    Attributes:
+        retries: The total number of retries made.
+        retries_by_status: The number of retries made per status code.
+        exhausted:
+            The number of requests that failed with a retryable status
+            code once all the retries, if any were allowed, were used up.
+        total_delay: The total number of seconds spent waiting to retry.
+    """
+
+    retries: int = 0
+    retries_by_status: dict[int, int] = field(default_factory=dict)
+    exhausted: int = 0
+    total_delay: float = 0.0
+
+    def __post_init__(self):
+
+        self._lock = threading.Lock()
+
+    def record_retry(self, status_code: int, delay: float):
+
+        with self._lock:
+            self.retries += 1
+            self.total_delay += delay
+            count = self.retries_by_status.get(status_code, 0)
+            self.retries_by_status[status_code] = count + 1
+
+    def record_exhausted(self):
+
+        with self._lock:
+            self.exhausted += 1
+
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # The header can also be a HTTP date.
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
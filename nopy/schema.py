@@ -0,0 +1,86 @@
+import time
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from nopy.cache import CacheStats
+from nopy.cache import TTLCache
+from nopy.objects.database import Database
+
+
+class Schema:
+    """The schema of a database as used when querying it.
+
+    Attributes:
+        database: The database.
+    """
+
+    def __init__(self, database: Database):
+
+        self.database = database
+
+    def resolve_filters(self, query: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Resolves the filters of the query in the Notion format. See
+        `nopy.query.resolve_filters`."""
+
+        return self.database._resolve_filters(query)
+
+
+class SchemaCache:
+    """Caches the schemas of the databases queried by a client so that
+    they're retrieved once instead of before every query.
+
+    Attributes:
+        ttl:
+            The number of seconds a schema is cached for. If 0, schemas
+            aren't cached.
+        max_entries: The maximum number of schemas cached.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+
+        self.ttl = ttl
+        self._cache = TTLCache(max_entries, clock=clock)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hits, misses and evictions of the cache."""
+
+        return self._cache.stats
+
+    def get(self, db_id: str) -> Optional[Schema]:
+        """Gets the cached schema of the database, if any."""
+
+        return self._cache.get(_key(db_id))
+
+    def set(self, database: Database) -> Schema:
+        """Caches the schema of the database."""
+
+        schema = Schema(database)
+        self._cache.set(_key(database.id), schema, self.ttl)
+        return schema
+
+    def invalidate(self, db_id: str):
+        """Removes the cached schema of the database, if any."""
+
+        self._cache.invalidate(_key(db_id))
+
+    def clear(self):
+        """Removes all the cached schemas."""
+
+        self._cache.clear()
+
+    def __len__(self) -> int:
+
+        return len(self._cache)
+
+
+def _key(db_id: str) -> str:
+
+    # Notion accepts ids both with and without the dashes.
+    return db_id.replace("-", "")
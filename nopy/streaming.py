@@ -0,0 +1,337 @@
+import codecs
+import json
+import re
+from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Generator
+from typing import Iterator
+from typing import Optional
+
+# The characters that matter when looking for the start of the results.
+_TOKENS = re.compile(r'[{}\[\]"]')
+_STRING_TOKENS = re.compile(r'["\\]')
+_SEPARATORS = re.compile(r"[\s,]*")
+# The end of a result that's a number, a boolean or null.
+_SCALAR_END = re.compile(r"[\s,\]]")
+
+
+class ResultsDecoder:
+    """Incrementally decodes the results of a paginated response as the
+    response is received in chunks.
+
+    The response is scanned until the array holding the results starts,
+    after which each result is decoded as soon as it's received in full.
+    The rest of the response, such as `has_more` and `next_cursor`, is
+    decoded once the response ends.
+
+    Attributes:
+        key: The key of the array holding the results.
+        loads:
+            Decodes each result and the rest of the response. Defaults to
+            the standard library's `json.loads`.
+    """
+
+    def __init__(self, key: str = "results", loads: Callable[[str], Any] = json.loads):
+
+        self.key = key
+        self.loads = loads
+
+        # The text of the response that's yet to be decoded.
+        self._buffer = ""
+        # The text of the response before the results, including the
+        # opening bracket of the results.
+        self._head = ""
+        self._in_results = False
+        self._results_done = False
+        # The position in the buffer where the result being received
+        # starts, if one is being received.
+        self._result_start: Optional[int] = None
+
+        # The state of the scan for the start of the results and then for
+        # the end of each result.
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+
+    def feed(self, text: str) -> list[Any]:
+        """Feeds the next chunk of the response.
+
+        Returns:
+            The results that were completed by the chunk.
+        """
+
+        self._buffer += text
+        if not self._in_results and not self._results_done:
+            self._scan_head()
+        if self._in_results:
+            return self._decode_results()
+        return []
+
+    def close(self) -> dict[str, Any]:
+        """Decodes the rest of the response once it has been fed in full.
+
+        Returns:
+            The response without the results that were already decoded.
+
+        Raises:
+            ValueError: Raised if the response is incomplete or isn't valid
+                JSON.
+        """
+
+        return self.loads(self._head + self._buffer)
+
+    def _scan_head(self):
+        """Scans the response for the opening bracket of the results, which
+        is the first array of the top level object following the key."""
+
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_TOKENS.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == "\\":
+                    # Skipping the escaped character, if it has arrived.
+                    if match.end() >= len(buffer):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    start, end = self._string_start, match.start()
+                    self._last_string = buffer[start:end]
+                pos = match.end()
+                continue
+
+            match = _TOKENS.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+
+            token = match.group()
+            pos = match.end()
+            if token == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif token == "[" and self._depth == 1 and self._last_string == self.key:
+                self._in_results = True
+                self._head = buffer[:pos]
+                self._buffer = buffer[pos:]
+                self._pos = 0
+                self._depth = 0
+                return
+            elif token in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+
+        self._pos = pos
+
+    def _decode_results(self) -> list[Any]:
+        """Decodes the results that were received in full.
+
+        The scan for the end of the result being received resumes from
+        where the previous chunk left it, so a large result is scanned
+        only once however many chunks it arrives in.
+        """
+
+        results: list[Any] = []
+        buffer = self._buffer
+        pos = self._pos
+        start = self._result_start
+        while True:
+            if start is None:
+                pos = _SEPARATORS.match(buffer, pos).end()  # type: ignore
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == "]":
+                    self._in_results = False
+                    self._results_done = True
+                    break
+                start = pos
+
+            end = self._scan_result(buffer, start, pos)
+            if end is None:
+                pos = self._pos
+                break
+            results.append(self.loads(buffer[start:end]))
+            start = None
+            pos = end
+
+        # Dropping the text of the decoded results.
+        offset = pos if start is None else start
+        self._buffer = buffer[offset:]
+        self._pos = pos - offset
+        self._result_start = None if start is None else 0
+        return results
+
+    def _scan_result(self, buffer: str, start: int, pos: int) -> Optional[int]:
+        """Scans the result starting at `start` from `pos` onwards.
+
+        Returns:
+            The end of the result, or `None` if it hasn't been received in
+            full, in which case the position to resume from is kept.
+        """
+
+        if buffer[start] not in '{["':
+            match = _SCALAR_END.search(buffer, pos)
+            if match is None:
+                self._pos = len(buffer)
+                return None
+            return match.start()
+
+        while True:
+            if self._in_string:
+                match = _STRING_TOKENS.search(buffer, pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return None
+                if match.group() == "\\":
+                    # Skipping the escaped character, if it has arrived.
+                    if match.end() >= len(buffer):
+                        self._pos = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    return pos
+                continue
+
+            match = _TOKENS.search(buffer, pos)
+            if match is None:
+                self._pos = len(buffer)
+                return None
+
+            token = match.group()
+            pos = match.end()
+            if token == '"':
+                self._in_string = True
+            elif token in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+
+class StreamedResponse:
+    """A paginated response whose results are decoded while the response
+    is being received.
+
+    The results are available as an iterator under the key `results` like
+    in a regular response. The rest of the keys, like `has_more`, are only
+    available once the response is received in full, which happens when
+    they're first accessed.
+
+    Attributes:
+        chunks: The chunks of the body of the response.
+        close: Closes the response.
+        loads: Decodes the results and the rest of the response.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        close: Callable[[], None],
+        loads: Callable[[str], Any] = json.loads,
+    ):
+
+        self._chunks = chunks
+        self._close = close
+        self._loads = loads
+        self._rest: Optional[dict[str, Any]] = None
+        self._results = self._decode()
+
+    def __getitem__(self, key: str) -> Any:
+
+        if key == "results":
+            return self._results
+
+        if self._rest is None:
+            # Draining the results so that the rest of the response arrives.
+            for _ in self._results:
+                pass
+        return self._rest[key]  # type: ignore
+
+    def close(self):
+        """Stops receiving the response."""
+
+        self._results.close()
+
+    def _decode(self) -> Generator[Any, None, None]:
+
+        decoder = ResultsDecoder(loads=self._loads)
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            for chunk in self._chunks:
+                yield from decoder.feed(text_decoder.decode(chunk))
+            yield from decoder.feed(text_decoder.decode(b"", final=True))
+            self._rest = decoder.close()
+        finally:
+            self._close()
+
+
+class AsyncStreamedResponse:
+    """The asynchronous counterpart of `StreamedResponse` where the results
+    are an asynchronous iterator.
+
+    The rest of the keys are only available after all the results have
+    been iterated over.
+
+    Attributes:
+        chunks: The chunks of the body of the response.
+        close: Closes the response.
+        loads: Decodes the results and the rest of the response.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        close: Callable[[], Awaitable[None]],
+        loads: Callable[[str], Any] = json.loads,
+    ):
+
+        self._chunks = chunks
+        self._close = close
+        self._loads = loads
+        self._rest: Optional[dict[str, Any]] = None
+        self._results = self._decode()
+
+    def __getitem__(self, key: str) -> Any:
+
+        if key == "results":
+            return self._results
+
+        if self._rest is None:
+            msg = f"'{key}' is only available after iterating over the results"
+            raise RuntimeError(msg)
+        return self._rest[key]
+
+    async def close(self):
+        """Stops receiving the response."""
+
+        await self._results.aclose()
+
+    async def _decode(self) -> AsyncGenerator[Any, None]:
+
+        decoder = ResultsDecoder(loads=self._loads)
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            async for chunk in self._chunks:
+                for result in decoder.feed(text_decoder.decode(chunk)):
+                    yield result
+            for result in decoder.feed(text_decoder.decode(b"", final=True)):
+                yield result
+            self._rest = decoder.close()
+        finally:
+            await self._close()
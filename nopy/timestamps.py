@@ -0,0 +1,39 @@
+from datetime import datetime
+from functools import lru_cache
+
+from dateutil.parser import parse
+
+# Notion sends timestamps in UTC with a trailing 'Z', which
+# `datetime.fromisoformat` only understands from Python 3.11 onwards.
+_UTC_SUFFIX = "Z"
+_UTC_OFFSET = "+00:00"
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime:
+    """Parses a date or a date time in the formats used by Notion.
+
+    Notion always uses ISO 8601 such as `2022-12-03`,
+    `2022-12-03T04:10:00.000Z` or `2022-12-03T04:10:00.000+05:30`, which
+    are parsed by `datetime.fromisoformat` instead of the much slower
+    `dateutil` parser. Anything else is handed over to `dateutil`.
+
+    The results are cached since the same timestamps, like the times at
+    which pages were created or edited, tend to repeat.
+
+    Attributes:
+        value: The date or the date time as a string.
+
+    Raises:
+        ValueError: Raised if the string could not be parsed.
+    """
+
+    if value.endswith(_UTC_SUFFIX):
+        iso_value = value[:-1] + _UTC_OFFSET
+    else:
+        iso_value = value
+
+    try:
+        return datetime.fromisoformat(iso_value)
+    except ValueError:
+        return parse(value)
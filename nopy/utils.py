@@ -1,15 +1,21 @@
+import asyncio
 import logging
+import threading
 from logging import getLogger
+from queue import Full
+from queue import Queue
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterator
+from typing import Awaitable
 from typing import Callable
 from typing import Generator
+from typing import Iterable
 from typing import Optional
 from typing import TypeVar
 from typing import Union
 
-from dateutil.parser import parse
-
 # from nopy.constants import DB_PROPS_REVERSE_MAP
 from nopy.objects.user import User
 from nopy.props.common import Emoji
@@ -17,13 +23,17 @@ from nopy.props.common import File
 from nopy.props.common import Parent
 from nopy.props.common import RichText
 from nopy.props.common import Text
+from nopy.timestamps import parse_datetime
 
 if TYPE_CHECKING:
+    from nopy.async_client import AsyncNotionClient
     from nopy.client import NotionClient
+    from nopy.identity import IdentityMap
 
 
 # ----- TYPES ------
 API_CALL = Callable[..., dict[str, Any]]
+ASYNC_API_CALL = Callable[..., Awaitable[dict[str, Any]]]
 T = TypeVar("T")
 
 
@@ -45,6 +55,7 @@ def paginate(
     max_pages: int = 0,
     map_args: Optional[dict[str, Any]] = None,
     client: Optional["NotionClient"] = None,
+    prefetch: int = 0,
     **kwargs: Any,
 ) -> Generator[T, None, None]:
     """Handles calls that require pagination to get the full results.
@@ -54,17 +65,164 @@ def paginate(
 
     All `map_args` are passed to the `map_func` when calling it along with the
     result. The result is the first argument that's passed in.
+
+    If `prefetch` is greater than 0, then the following batches of results
+    are fetched by a background thread while the current batch is being
+    consumed. At most `prefetch` batches are buffered.
+    """
+
+    if prefetch > 0:
+        batches = _threaded_batches(api_call, [kwargs], prefetch)
+    else:
+        batches = _fetch_batches(api_call, kwargs)
+
+    return _map_results(batches, map_func, max_pages, map_args, client)
+
+
+def paginate_partitions(
+    api_call: API_CALL,
+    map_func: Callable[..., T],
+    partitions: list[dict[str, Any]],
+    max_pages: int = 0,
+    map_args: Optional[dict[str, Any]] = None,
+    client: Optional["NotionClient"] = None,
+    buffer_size: int = 0,
+    **kwargs: Any,
+) -> Generator[T, None, None]:
+    """Paginates through multiple partitions of the results concurrently
+    and merges them into a single stream.
+
+    Every partition is a dictionary of keyword arguments which is passed to
+    the `api_call` along with the rest of the keyword arguments. Each one is
+    paginated by its own thread and the results are yielded in the order
+    they arrive. Results with an `id` that was already yielded are skipped.
+
+    At most `buffer_size` batches are buffered. It defaults to two batches
+    per partition.
+    """
+
+    kwargs_list = [{**kwargs, **partition} for partition in partitions]
+    buffer_size = buffer_size or 2 * len(kwargs_list)
+    batches = _threaded_batches(api_call, kwargs_list, buffer_size)
+
+    return _map_results(batches, map_func, max_pages, map_args, client, True)
+
+
+def apaginate(
+    api_call: ASYNC_API_CALL,
+    map_func: Callable[..., T],
+    max_pages: int = 0,
+    map_args: Optional[dict[str, Any]] = None,
+    client: Optional["AsyncNotionClient"] = None,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> AsyncGenerator[T, None]:
+    """The asynchronous counterpart of `paginate` which is to be used
+    with `async for`.
+
+    The `api_call` must be a coroutine function and the batches are
+    prefetched by a task instead of a thread. Everything else behaves
+    the same as in `paginate`.
     """
 
+    if prefetch > 0:
+        batches = _task_batches(api_call, [kwargs], prefetch)
+    else:
+        batches = _afetch_batches(api_call, kwargs)
+
+    return _amap_results(batches, map_func, max_pages, map_args, client)
+
+
+def apaginate_partitions(
+    api_call: ASYNC_API_CALL,
+    map_func: Callable[..., T],
+    partitions: list[dict[str, Any]],
+    max_pages: int = 0,
+    map_args: Optional[dict[str, Any]] = None,
+    client: Optional["AsyncNotionClient"] = None,
+    buffer_size: int = 0,
+    **kwargs: Any,
+) -> AsyncGenerator[T, None]:
+    """The asynchronous counterpart of `paginate_partitions` where each
+    partition is paginated by its own task."""
+
+    kwargs_list = [{**kwargs, **partition} for partition in partitions]
+    buffer_size = buffer_size or 2 * len(kwargs_list)
+    batches = _task_batches(api_call, kwargs_list, buffer_size)
+
+    return _amap_results(batches, map_func, max_pages, map_args, client, True)
+
+
+# ----- Pagination Helpers -----
+
+# Marks the end of the batches of a single pagination in the buffer.
+_DONE = object()
+
+
+class _Failure:
+    """Wraps an error raised while fetching in the background so that it's
+    raised to the consumer."""
+
+    def __init__(self, error: Exception):
+
+        self.error = error
+
+
+def _map_results(
+    batches: Generator[Iterable[dict[str, Any]], None, None],
+    map_func: Callable[..., T],
+    max_pages: int,
+    map_args: Optional[dict[str, Any]],
+    client: Any,
+    unique: bool = False,
+) -> Generator[T, None, None]:
+
     pages = 0
-    next_cursor = None
     map_args = map_args or {}
+    seen: set[str] = set()
 
-    while True:
+    for batch in batches:
+        for res in batch:
+            if unique:
+                if res["id"] in seen:
+                    continue
+                seen.add(res["id"])
 
-        results = api_call(**kwargs, start_cursor=next_cursor)
+            notion_obj = map_func(res, **map_args)
+            if hasattr(notion_obj, "set_client"):
+                notion_obj.set_client(client)  # type: ignore
+            yield notion_obj
+            pages += 1
+            # Early exit if specified.
+            if max_pages and pages > max_pages:
+                # Streamed batches hold on to the response until closed.
+                if hasattr(batch, "close"):
+                    batch.close()  # type: ignore
+                batches.close()
+                return
+
+
+async def _amap_results(
+    batches: AsyncGenerator[Iterable[dict[str, Any]], None],
+    map_func: Callable[..., T],
+    max_pages: int,
+    map_args: Optional[dict[str, Any]],
+    client: Any,
+    unique: bool = False,
+) -> AsyncGenerator[T, None]:
+
+    pages = 0
+    map_args = map_args or {}
+    seen: set[str] = set()
+
+    async for batch in batches:
+        results = _aiter_batch(batch)
+        async for res in results:
+            if unique:
+                if res["id"] in seen:
+                    continue
+                seen.add(res["id"])
 
-        for res in results["results"]:
             notion_obj = map_func(res, **map_args)
             if hasattr(notion_obj, "set_client"):
                 notion_obj.set_client(client)  # type: ignore
@@ -72,19 +230,153 @@ def paginate(
             pages += 1
             # Early exit if specified.
             if max_pages and pages > max_pages:
+                await results.aclose()
+                await batches.aclose()
                 return
 
+
+async def _aiter_batch(
+    batch: Union[Iterable[dict[str, Any]], AsyncIterator[dict[str, Any]]]
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Iterates over a batch that's either a list of results or the results
+    of a streamed response, which are an asynchronous iterator."""
+
+    if not hasattr(batch, "__aiter__"):
+        for res in batch:  # type: ignore
+            yield res
+        return
+
+    try:
+        async for res in batch:  # type: ignore
+            yield res
+    finally:
+        if hasattr(batch, "aclose"):
+            await batch.aclose()  # type: ignore
+
+
+def _fetch_batches(
+    api_call: API_CALL, kwargs: dict[str, Any]
+) -> Generator[Iterable[dict[str, Any]], None, None]:
+
+    next_cursor = None
+    while True:
+
+        results = api_call(**kwargs, start_cursor=next_cursor)
+        yield results["results"]
+
+        if not results["has_more"]:
+            return
+        next_cursor = results["next_cursor"]
+
+
+def _threaded_batches(
+    api_call: API_CALL, kwargs_list: list[dict[str, Any]], buffer_size: int
+) -> Generator[Iterable[dict[str, Any]], None, None]:
+    """Paginates with each of the keyword arguments in a background thread
+    and yields the batches as they arrive."""
+
+    buffer: "Queue[Any]" = Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Waiting with a timeout so that the thread notices when the
+        # consumer stops early instead of blocking forever on a full buffer.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def fetch(kwargs: dict[str, Any]):
+        try:
+            for batch in _fetch_batches(api_call, kwargs):
+                if not put(list(batch)):
+                    return
+            put(_DONE)
+        except Exception as error:
+            put(_Failure(error))
+
+    for kwargs in kwargs_list:
+        thread = threading.Thread(
+            target=fetch, args=(kwargs,), name="nopy-prefetch", daemon=True
+        )
+        thread.start()
+
+    try:
+        remaining = len(kwargs_list)
+        while remaining:
+            item = buffer.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        stop.set()
+
+
+async def _afetch_batches(
+    api_call: ASYNC_API_CALL, kwargs: dict[str, Any]
+) -> AsyncGenerator[Iterable[dict[str, Any]], None]:
+
+    next_cursor = None
+    while True:
+
+        results = await api_call(**kwargs, start_cursor=next_cursor)
+        yield results["results"]
+
         if not results["has_more"]:
             return
         next_cursor = results["next_cursor"]
 
 
+async def _task_batches(
+    api_call: ASYNC_API_CALL, kwargs_list: list[dict[str, Any]], buffer_size: int
+) -> AsyncGenerator[Iterable[dict[str, Any]], None]:
+    """Paginates with each of the keyword arguments in a background task
+    and yields the batches as they arrive."""
+
+    buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=buffer_size)
+
+    async def fetch(kwargs: dict[str, Any]):
+        try:
+            async for batch in _afetch_batches(api_call, kwargs):
+                await buffer.put([res async for res in _aiter_batch(batch)])
+            await buffer.put(_DONE)
+        except Exception as error:
+            await buffer.put(_Failure(error))
+
+    tasks = [asyncio.ensure_future(fetch(kwargs)) for kwargs in kwargs_list]
+
+    try:
+        remaining = len(kwargs_list)
+        while remaining:
+            item = await buffer.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 # ----- Mapping Utilities -----
 
 
-def base_obj_args(args: dict[str, Any]) -> dict[str, Any]:
+def base_obj_args(
+    args: dict[str, Any], identity_map: Optional["IdentityMap"] = None
+) -> dict[str, Any]:
     """Parses the common arguments found in all Notion objects
-    and converts them to the required data type."""
+    and converts them to the required data type.
+
+    If an `identity_map` is provided, the users and the parent are
+    interned through it."""
 
     new_args: dict[str, Any] = {
         "id": args["id"],
@@ -93,17 +385,23 @@ def base_obj_args(args: dict[str, Any]) -> dict[str, Any]:
 
     # Getting the parent
     if parent := args.get("parent", None):
-        new_args["parent"] = Parent.from_dict(parent)
+        if identity_map is not None:
+            new_args["parent"] = identity_map.parent(parent)
+        else:
+            new_args["parent"] = Parent.from_dict(parent)
 
     # Getting users
     for key in ("created_by", "last_edited_by"):
         if value := args.get(key, None):
-            new_args[key] = User.from_dict(value)
+            if identity_map is not None:
+                new_args[key] = identity_map.user(value)
+            else:
+                new_args[key] = User.from_dict(value)
 
     # Getting time
     for key in ("created_time", "last_edited_time"):
         if value := args.get(key, None):
-            new_args[key] = parse(value)
+            new_args[key] = parse_datetime(value)
 
     return new_args
 
@@ -114,6 +412,14 @@ def rich_text_list(rich_texts: list[dict[str, Any]]) -> list[RichText]:
     return [RichText.from_dict(rt) for rt in rich_texts]
 
 
+def join_plain_text(texts: Iterable[str]) -> str:
+    """Combines the plain text of the spans of a rich text. Like the
+    decoded `Text`s, each span is stripped and they're joined with a
+    space."""
+
+    return " ".join(text.strip() for text in texts)
+
+
 def get_icon(icon: Optional[dict[str, Any]]) -> Optional[Union[File, Emoji]]:
 
     if not icon:
@@ -155,12 +461,13 @@ class TextDescriptor:
     def __get__(self, instance: object, _):
         """Gets the combined plain text from a list of rich text."""
 
-        rich_text: list[RichText] = instance.__dict__[self.storage_name]
-        return " ".join(rt.plain_text for rt in rich_text)
+        rich_text: list[RichText] = getattr(instance, self.storage_name)
+        return join_plain_text(rt.plain_text for rt in rich_text)
 
     def __set__(self, instance: object, value: str):
 
         msg = f"value must be a string, use '{self.storage_name}' for adding text with style information"
         assert isinstance(value, str), msg
 
-        instance.__dict__[self.storage_name] = [Text(value)]
+        # Going through `setattr` so that the change is tracked.
+        setattr(instance, self.storage_name, [Text(value)])
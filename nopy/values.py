@@ -0,0 +1,153 @@
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from nopy.props.common import Date
+from nopy.timestamps import parse_datetime
+from nopy.utils import join_plain_text
+
+Row = Union[dict[str, Any], tuple[Any, ...]]
+"""A page projected onto some of its properties."""
+
+
+def extract_value(prop: dict[str, Any]) -> Any:
+    """Extracts the value of a property of a page in the Notion format as a
+    plain Python value without creating any property objects.
+
+    The values are:
+
+    - `title` and `rich_text`: The plain text as a string.
+    - `number`, `checkbox`, `url`, `email` and `phone_number`: As is.
+    - `select` and `status`: The name of the option or `None`.
+    - `multi_select`: The list of the names of the options.
+    - `date`: A `Date` or `None`.
+    - `created_time` and `last_edited_time`: A `datetime`.
+    - `people`, `created_by` and `last_edited_by`: The id(s) of the users.
+    - `relation`: The list of the ids of the related pages.
+    - `files`: The list of the URLs of the files.
+    - `formula` and `rollup`: The value of the result.
+
+    Any other type of property is returned as given by Notion.
+    """
+
+    prop_type = prop["type"]
+    extractor = _EXTRACTORS.get(prop_type, None)
+    if extractor is None:
+        return prop.get(prop_type, None)
+    return extractor(prop[prop_type])
+
+
+class Projection:
+    """Projects pages in the Notion format onto some of their properties.
+
+    Attributes:
+        fields:
+            The names or the ids of the properties to project onto. The
+            properties that aren't found are `None`.
+        as_tuples:
+            If `True`, the values are returned as tuples in the order of
+            the fields. Otherwise, dictionaries keyed by the fields are
+            returned.
+    """
+
+    def __init__(self, fields: Sequence[str], as_tuples: bool = False):
+
+        self.fields = tuple(fields)
+        self.as_tuples = as_tuples
+        # The fields mapped to the names of the properties. This is filled
+        # in while projecting since the ids are only known from the pages.
+        self._names: dict[str, str] = {}
+
+    def project(self, page: dict[str, Any]) -> Row:
+        """Projects the page in the Notion format."""
+
+        props: dict[str, dict[str, Any]] = page["properties"]
+        values = tuple(self._get_value(props, field_name) for field_name in self.fields)
+        if self.as_tuples:
+            return values
+        return dict(zip(self.fields, values))
+
+    def _get_value(self, props: dict[str, dict[str, Any]], field_name: str) -> Any:
+
+        prop = props.get(self._names.get(field_name, field_name), None)
+        if prop is None:
+            prop = self._find_by_id(props, field_name)
+            if prop is None:
+                return None
+        return extract_value(prop)
+
+    def _find_by_id(
+        self, props: dict[str, dict[str, Any]], prop_id: str
+    ) -> Optional[dict[str, Any]]:
+
+        for name, prop in props.items():
+            if prop["id"] == prop_id:
+                self._names[prop_id] = name
+                return prop
+        return None
+
+
+# ----- Extractors -----
+
+
+def _plain_text(rich_texts: list[dict[str, Any]]) -> str:
+
+    return join_plain_text(rt["plain_text"] for rt in rich_texts)
+
+
+def _option_name(option: Optional[dict[str, Any]]) -> Optional[str]:
+
+    return None if option is None else option["name"]
+
+
+def _date(date: Optional[dict[str, Any]]) -> Optional[Date]:
+
+    return None if date is None else Date.from_dict(date)
+
+
+def _file_url(file: dict[str, Any]) -> str:
+
+    return file[file["type"]]["url"]
+
+
+def _result(result: dict[str, Any]) -> Any:
+
+    # Formulas and rollups hold their result under the key of its type.
+    result_type = result["type"]
+    value = result.get(result_type, None)
+    if result_type == "date":
+        return _date(value)
+    if result_type == "array":
+        return [extract_value(item) for item in value]
+    return value
+
+
+def _identity(value: Any) -> Any:
+
+    return value
+
+
+_EXTRACTORS: dict[str, Callable[[Any], Any]] = {
+    "title": _plain_text,
+    "rich_text": _plain_text,
+    "number": _identity,
+    "checkbox": _identity,
+    "url": _identity,
+    "email": _identity,
+    "phone_number": _identity,
+    "select": _option_name,
+    "status": _option_name,
+    "multi_select": lambda options: [option["name"] for option in options],
+    "date": _date,
+    "created_time": parse_datetime,
+    "last_edited_time": parse_datetime,
+    "people": lambda users: [user["id"] for user in users],
+    "created_by": lambda user: user["id"],
+    "last_edited_by": lambda user: user["id"],
+    "relation": lambda relations: [relation["id"] for relation in relations],
+    "files": lambda files: [_file_url(file) for file in files],
+    "formula": _result,
+    "rollup": _result,
+}
@@ -1,11 +1,16 @@
+import asyncio
 import json
 import socket
 from pathlib import Path
 from typing import Any
+from typing import Callable
 
+import httpx
 import pytest
 from dotenv import load_dotenv  # type: ignore
 
+from nopy.async_client import AsyncNotionClient
+from nopy.client import ClientConfig
 from nopy.client import NotionClient
 
 ENV_PATH = Path(__file__).parent / "../.env"
@@ -14,12 +19,28 @@ load_dotenv(ENV_PATH)
 DATA_DIR = Path(__file__).parent / "data"
 
 
-# Disabling network access
+# Disabling network access. Only the connections are blocked since
+# asyncio needs sockets internally to run the event loop.
 def block_network(*args: Any):
     raise Exception("no network access allowed")
 
 
-socket.socket = block_network
+socket.socket.connect = block_network  # type: ignore
+socket.socket.connect_ex = block_network  # type: ignore
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeClock:
+    """A clock which only moves when `now` is changed."""
+
+    def __init__(self):
+
+        self.now = 0.0
+
+    def __call__(self) -> float:
+
+        return self.now
 
 
 # ----- FIXTURES -----
@@ -31,6 +52,60 @@ def client():
     client.close()
 
 
+@pytest.fixture
+def clock() -> FakeClock:
+    """A fake clock to be passed in place of `time.monotonic`."""
+
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client():
+    """Makes clients whose requests are handled by the given handler instead
+    of being sent to Notion. The options are passed to `ClientConfig`."""
+
+    clients: list[NotionClient] = []
+
+    def make(handler: Handler, **config: Any) -> NotionClient:
+
+        client = NotionClient("token", ClientConfig(**config))
+        # Closing the client that would connect to Notion before replacing
+        # it so that its connection pool isn't left open.
+        client._client.close()
+        client._client = httpx.Client(  # type: ignore
+            transport=httpx.MockTransport(handler), **client._client_options()
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client():
+    """The asynchronous counterpart of `make_client`. The clients are to be
+    used with `async with` so that they're closed in their event loop."""
+
+    replaced: list[httpx.AsyncClient] = []
+
+    def make(handler: Handler, **config: Any) -> AsyncNotionClient:
+
+        client = AsyncNotionClient("token", ClientConfig(**config))
+        # The replaced clients can only be closed in an event loop, which
+        # may already be running here, so they're closed after the test.
+        replaced.append(client._client)
+        client._client = httpx.AsyncClient(  # type: ignore
+            transport=httpx.MockTransport(handler), **client._client_options()
+        )
+        return client
+
+    yield make
+    for replaced_client in replaced:
+        asyncio.run(replaced_client.aclose())
+
+
 @pytest.fixture
 def full_db():
 
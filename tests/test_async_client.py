@@ -0,0 +1,215 @@
+import asyncio
+import io
+import json
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from nopy.async_client import AsyncNotionClient
+from nopy.cache import QueryCachePolicy
+from nopy.errors import APIResponseError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+
+
+def test_retrieve_db(
+    full_db: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/databases/db-id"
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(200, json=full_db)
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.retrieve_db("db-id")
+
+    db = asyncio.run(run())
+
+    assert isinstance(db, Database)
+    assert db.title == "Database Example"
+
+
+def test_query_db_paginates(
+    normal_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+
+    cursors: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = httpx.Response(200, content=request.content).json()
+        cursors.append(body.get("start_cursor"))
+        has_more = len(cursors) < 3
+        return httpx.Response(
+            200,
+            json={
+                "results": [normal_page],
+                "has_more": has_more,
+                "next_cursor": f"cursor-{len(cursors)}" if has_more else None,
+            },
+        )
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return [page async for page in client.query_db("db-id")]
+
+    pages = asyncio.run(run())
+
+    assert len(pages) == 3
+    assert all(isinstance(page, Page) for page in pages)
+    assert cursors == [None, "cursor-1", "cursor-2"]
+
+
+def test_query_db_stream(
+    normal_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+
+    cursors: list[Any] = []
+
+    async def chunks(raw: bytes):
+        body = io.BytesIO(raw)
+        while chunk := body.read(100):
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursors.append(json.loads(request.content).get("start_cursor"))
+        has_more = len(cursors) < 2
+        body = {
+            "results": [
+                {**normal_page, "id": f"page-{len(cursors)}-{i}"} for i in range(3)
+            ],
+            "has_more": has_more,
+            "next_cursor": "cursor" if has_more else None,
+        }
+        return httpx.Response(200, content=chunks(json.dumps(body).encode()))
+
+    async def run(**kwargs: Any):
+        async with make_async_client(handler) as client:
+            return [
+                page async for page in client.query_db("db-id", stream=True, **kwargs)
+            ]
+
+    pages = asyncio.run(run())
+
+    assert cursors == [None, "cursor"]
+    assert [page.id for page in pages] == [
+        f"page-{j}-{i}" for j in (1, 2) for i in range(3)
+    ]
+
+    cursors.clear()
+    pages = asyncio.run(run(prefetch=1))
+
+    assert len(pages) == 6
+
+
+def test_query_db_use_schema(
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+    make_async_client: Callable[..., AsyncNotionClient],
+):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json=full_db)
+        return httpx.Response(200, json={"results": [normal_page], "has_more": False})
+
+    async def run():
+        query = {"filter": {"property": "URL", "rich_text": {"contains": "a"}}}
+        async with make_async_client(handler) as client:
+            for _ in range(2):
+                pages = client.query_db("db-id", query, use_schema=True)
+                assert [page.id async for page in pages] == ["page-id"]
+            schema = await client.get_schema("db-id")
+            assert schema is await client.get_schema("db-id")
+            assert schema.database is not await client.retrieve_db("db-id")
+
+    asyncio.run(run())
+
+    assert [request.method for request in requests] == ["GET", "POST", "POST", "GET"]
+    assert json.loads(requests[2].content)["filter"] == {
+        "property": "%3BIa%40",
+        "url": {"contains": "a"},
+    }
+
+
+def test_query_db_cached(
+    normal_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [normal_page], "has_more": False})
+
+    async def run():
+        async with make_async_client(handler, query_cache=QueryCachePolicy()) as client:
+            results = []
+            for _ in range(2):
+                results.append([page.id async for page in client.query_db("db-id")])
+            return results
+
+    first, second = asyncio.run(run())
+
+    assert first == second == ["page-id"]
+    assert len(requests) == 1
+
+
+def test_page_update_is_awaitable(
+    normal_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "PATCH"
+        return httpx.Response(200, json=normal_page)
+
+    async def run():
+        async with make_async_client(handler) as client:
+            page = Page.from_dict(normal_page)
+            page.set_client(client)
+            return page, await page.update(in_place=True)
+
+    page, updated = asyncio.run(run())
+
+    assert updated is page
+    assert page.title == "Trial Root Page"
+
+
+def test_error_response(make_async_client: Callable[..., AsyncNotionClient]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            404, json={"code": "object_not_found", "message": "not found"}
+        )
+
+    async def run():
+        async with make_async_client(handler) as client:
+            await client.retrieve_page("page-id")
+
+    with pytest.raises(APIResponseError):
+        asyncio.run(run())
+
+
+def test_create_pages(
+    normal_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+
+    created: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        created.append(json.loads(request.content))
+        return httpx.Response(200, json=normal_page)
+
+    async def run():
+        async with make_async_client(handler) as client:
+            pages = [{"properties": {}} for _ in range(5)]
+            return await client.create_pages(pages, concurrency=2)
+
+    results = asyncio.run(run())
+
+    assert len(created) == 5
+    assert all(result.ok for result in results)
+    assert [result.index for result in results] == list(range(5))
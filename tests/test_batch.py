@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from typing import Iterator
+
+import pytest
+
+from nopy.batch import BatchResult
+from nopy.batch import coalesce_updates
+from nopy.batch import run_abatch
+from nopy.batch import run_batch
+from nopy.errors import NopyError
+from nopy.props.page_props import PCheckbox
+
+
+def test_run_batch_keeps_order_and_captures_errors():
+    def func(item: int) -> int:
+        if item == 3:
+            raise NopyError("failed")
+        return item * 2
+
+    results = run_batch(func, range(6), concurrency=3)
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.value for result in results] == [0, 2, 4, None, 8, 10]
+    assert not results[3].ok
+    assert isinstance(results[3].error, NopyError)
+
+
+def test_run_batch_bounds_items_in_flight():
+
+    lock = threading.Lock()
+    counts = {"pulled": 0, "done": 0, "max_in_flight": 0}
+
+    def items() -> Iterator[int]:
+        for item in range(200):
+            with lock:
+                counts["pulled"] += 1
+                in_flight = counts["pulled"] - counts["done"]
+                counts["max_in_flight"] = max(counts["max_in_flight"], in_flight)
+            yield item
+
+    def func(item: int) -> int:
+        with lock:
+            counts["done"] += 1
+        return item
+
+    results = run_batch(func, items(), concurrency=2)
+
+    assert [result.value for result in results] == list(range(200))
+    # Two threads with four items submitted ahead each, plus the item pulled.
+    assert counts["max_in_flight"] <= 9
+
+
+def test_run_abatch_keeps_order():
+    async def func(item: int) -> int:
+        await asyncio.sleep(0.001 * (item % 3))
+        if item == 4:
+            raise NopyError("failed")
+        return item
+
+    results = asyncio.run(run_abatch(func, range(10), concurrency=3))
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.value for result in results][3:6] == [3, None, 5]
+
+
+def test_any_item_error_is_captured():
+    def func(item: int) -> int:
+        return {1: 1}[item]
+
+    async def afunc(item: int) -> int:
+        return func(item)
+
+    results = run_batch(func, range(3), concurrency=2)
+    aresults = asyncio.run(run_abatch(afunc, range(3), concurrency=2))
+
+    for batch in (results, aresults):
+        assert [result.ok for result in batch] == [False, True, False]
+        assert isinstance(batch[0].error, KeyError)
+
+
+def test_run_abatch_stops_workers_on_failure():
+
+    finished: list[int] = []
+
+    def items() -> Iterator[int]:
+        yield from range(3)
+        raise RuntimeError("failed")
+
+    async def func(item: int) -> int:
+        await asyncio.sleep(0.01 * item)
+        finished.append(item)
+        return item
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await run_abatch(func, items(), concurrency=3)
+        # The other workers would have finished by now if left running.
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    assert finished == [0]
+
+
+def test_batch_result_ok():
+
+    assert BatchResult(0, value=1).ok
+    assert not BatchResult(0, error=NopyError("failed")).ok
+
+
+def test_coalesce_updates():
+
+    updates = [
+        ("page-1", {"Status": {"status": {"name": "Todo"}}}),
+        ("page-2", {"Estimate": {"number": 1}}),
+        ("page-1", {"Estimate": {"number": 5}}),
+        ("page-1", {"Status": {"status": {"name": "Done"}}}),
+        ("page-2", {"Done": PCheckbox(checked=True)}),
+    ]
+
+    assert coalesce_updates(updates) == {
+        "page-1": {
+            "Status": {"status": {"name": "Done"}},
+            "Estimate": {"number": 5},
+        },
+        "page-2": {"Estimate": {"number": 1}, "Done": {"checkbox": True}},
+    }
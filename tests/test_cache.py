@@ -0,0 +1,180 @@
+import json
+from typing import Any
+from typing import Callable
+
+import httpx
+
+from nopy.cache import CachePolicy
+from nopy.cache import QueryCache
+from nopy.cache import QueryCachePolicy
+from nopy.cache import TTLCache
+from nopy.client import NotionClient
+from tests.conftest import FakeClock
+
+
+def test_ttl(clock: FakeClock):
+
+    cache = TTLCache(clock=clock)
+    cache.set("key", "value", ttl=10)
+
+    assert cache.get("key") == "value"
+    clock.now = 10
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_lru_eviction():
+
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    # Using "a" makes "b" the least recently used.
+    cache.get("a")
+    cache.set("c", 3, ttl=10)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_byte_limit():
+
+    cache = TTLCache(max_bytes=10)
+    cache.set("a", b"12345", ttl=10, size=5)
+    cache.set("b", b"123456", ttl=10, size=6)
+
+    assert "a" not in cache
+    assert cache.size == 6
+
+    # Values larger than the cache are never cached.
+    cache.set("c", b"x" * 11, ttl=10, size=11)
+    assert "c" not in cache
+    assert cache.size == 6
+
+
+def test_client_cache(
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+    make_client: Callable[..., NotionClient],
+):
+
+    requests: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.url.path.startswith("/v1/databases"):
+            return httpx.Response(200, json=full_db)
+        return httpx.Response(200, json=normal_page)
+
+    policy = CachePolicy(ttls={"database": 60})
+    client = make_client(handler, cache=policy)
+
+    db = client.retrieve_db("db-id")
+    db.title = "Changed"
+    cached_db = client.retrieve_db("db-id")
+    # Pages aren't cached by this policy.
+    client.retrieve_page("page-id")
+    client.retrieve_page("page-id")
+
+    assert cached_db is not db
+    assert cached_db.title == "Database Example"
+    assert requests == [
+        ("GET", "/v1/databases/db-id"),
+        ("GET", "/v1/pages/page-id"),
+        ("GET", "/v1/pages/page-id"),
+    ]
+    assert client.cache is not None
+    assert client.cache.stats.hits == 1
+
+    # Updating the database invalidates it.
+    client.update_db("db-id", {"title": []})
+    client.retrieve_db("db-id")
+
+    assert requests[-2:] == [
+        ("PATCH", "/v1/databases/db-id"),
+        ("GET", "/v1/databases/db-id"),
+    ]
+
+
+def test_client_without_cache(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=normal_page)
+
+    client = make_client(handler)
+    client.retrieve_page("page-id")
+    client.retrieve_page("page-id")
+
+    assert client.cache is None
+    assert len(requests) == 2
+
+
+def test_query_cache():
+
+    cache = QueryCache(QueryCachePolicy(max_bytes=10))
+    query = {"filter": {"property": "Done", "checkbox": {"equals": True}}}
+    cache.set("db-id", query, b"12345")
+    cache.set("other-db", None, b"123")
+
+    assert cache.get("db-id", {**query, "sorts": []}) == b"12345"
+    assert cache.get("db-id", None) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    # Going over the byte budget evicts the least recently used results.
+    cache.set("db-id", None, b"1234")
+    assert cache.get("other-db", None) is None
+    assert cache.size == 9
+
+    cache.invalidate("db-id")
+    assert len(cache) == 0
+
+
+def test_client_query_cache(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.method == "PATCH":
+            parent = {"type": "database_id", "database_id": "db-id"}
+            return httpx.Response(200, json={**normal_page, "parent": parent})
+
+        has_more = request.content.count(b"start_cursor") == 0
+        body = {
+            "results": [{**normal_page, "id": f"page-{len(requests)}"}],
+            "has_more": has_more,
+            "next_cursor": "cursor" if has_more else None,
+        }
+        return httpx.Response(200, content=json.dumps(body))
+
+    client = make_client(handler, query_cache=QueryCachePolicy())
+    query = {"filter": {"property": "Done", "checkbox": {"equals": True}}}
+
+    # Results that weren't all fetched aren't cached.
+    pages = client.query_db("db-id", query)
+    next(pages)
+    pages.close()
+    first = list(client.query_db("db-id", query))
+    second = list(client.query_db("db-id", query))
+
+    assert len(requests) == 3
+    assert [page.id for page in second] == [page.id for page in first]
+    assert second[0] is not first[0]
+    assert second[0]._client is client
+    assert client.query_cache is not None
+    assert client.query_cache.stats.hits == 1
+
+    # Updating a page of the database invalidates its queries.
+    client.update_page("page-id", {"properties": {}})
+    list(client.query_db("db-id", query))
+
+    assert len(requests) == 6
@@ -1,9 +1,34 @@
+import copy
+import io
+import json
 import os
+from datetime import datetime
+from datetime import timezone
+from functools import partial
+from typing import Any
+from typing import Callable
 
+import httpx
 import pytest
 
+from nopy import client as client_module
+from nopy.client import ClientConfig
 from nopy.client import NotionClient
+from nopy.errors import APIResponseError
 from nopy.errors import TokenNotFoundError
+from nopy.objects.database import Database
+from nopy.objects.page import Page
+from nopy.props.common import Option
+from nopy.props.common import Text
+from nopy.retry import RetryPolicy
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    return sleeps
 
 
 def test_client_without_token():
@@ -12,3 +37,491 @@ def test_client_without_token():
     with pytest.raises(TokenNotFoundError):
 
         NotionClient()
+
+
+def test_retries_failing_status_codes(
+    normal_page: dict[str, Any],
+    sleeps: list[float],
+    make_client: Callable[..., NotionClient],
+):
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}, json={}),
+        httpx.Response(502, text="Bad Gateway"),
+        httpx.Response(200, json=normal_page),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    policy = RetryPolicy(backoff_factor=1, jitter=False)
+    client = make_client(handler, retry_policy=policy)
+    page = client.retrieve_page("page-id")
+
+    assert page.id == "page-id"
+    assert sleeps == [2, 2]
+    assert client.retry_stats.retries == 2
+    assert client.retry_stats.retries_by_status == {429: 1, 502: 1}
+    assert client.retry_stats.total_delay == 4
+
+
+def test_retries_exhausted(
+    sleeps: list[float], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429, json={"code": "rate_limited", "message": "slow down"}
+        )
+
+    client = make_client(handler, retry_policy=RetryPolicy(max_retries=2))
+
+    with pytest.raises(APIResponseError):
+        client.retrieve_page("page-id")
+    assert len(sleeps) == 2
+    assert client.retry_stats.exhausted == 1
+
+
+def test_retries_exhausted_without_retries(
+    sleeps: list[float], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, json={"code": "unavailable", "message": "down"})
+
+    client = make_client(handler, retry_policy=RetryPolicy(max_retries=0))
+
+    with pytest.raises(APIResponseError):
+        client.retrieve_page("page-id")
+    assert sleeps == []
+    assert client.retry_stats.exhausted == 1
+
+
+def test_no_retry_policy(sleeps: list[float], make_client: Callable[..., NotionClient]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429, json={"code": "rate_limited", "message": "slow down"}
+        )
+
+    client = make_client(handler)
+
+    with pytest.raises(APIResponseError):
+        client.retrieve_page("page-id")
+    assert sleeps == []
+
+
+def test_client_errors_are_not_retried(
+    sleeps: list[float], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400, json={"code": "validation_error", "message": "invalid"}
+        )
+
+    client = make_client(handler, retry_policy=RetryPolicy())
+
+    with pytest.raises(APIResponseError):
+        client.retrieve_page("page-id")
+    assert sleeps == []
+    assert client.retry_stats.retries == 0
+
+
+def test_backoff_is_exponential_and_capped():
+
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    response = httpx.Response(503)
+
+    delays = [policy.get_delay(response, attempt) for attempt in range(4)]
+
+    assert delays == [1, 2, 4, 5]
+
+
+def test_retry_after_is_not_capped_by_max_backoff():
+
+    policy = RetryPolicy(max_backoff=5, max_retry_after=60)
+
+    assert policy.get_delay(httpx.Response(429, headers={"Retry-After": "30"}), 0) == 30
+    assert policy.get_delay(httpx.Response(429, headers={"Retry-After": "90"}), 0) == 60
+
+
+def test_backoff_jitter():
+
+    policy = RetryPolicy(backoff_factor=1)
+    response = httpx.Response(503)
+
+    assert all(0 <= policy.get_delay(response, 3) <= 8 for _ in range(20))
+
+
+def test_connection_pool_options():
+
+    config = ClientConfig(
+        http2=False,
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=60,
+    )
+    options = NotionClient("token", config)._transport_options()
+
+    assert options["http2"] is False
+    assert options["limits"] == httpx.Limits(
+        max_connections=10, max_keepalive_connections=5, keepalive_expiry=60
+    )
+
+
+def test_http2_defaults_to_h2_availability(monkeypatch: pytest.MonkeyPatch):
+
+    monkeypatch.setattr(client_module, "find_spec", lambda name: None)
+    options = NotionClient("token")._transport_options()
+
+    assert options["http2"] is False
+
+
+def test_scan_db(normal_page: dict[str, Any], make_client: Callable[..., NotionClient]):
+
+    filters: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        filters.append(body["filter"])
+        # Every partition returns its own page and a page shared by all.
+        results = []
+        for page_id in (f"page-{len(filters)}", "shared"):
+            results.append({**normal_page, "id": page_id})
+        return httpx.Response(
+            200, json={"results": results, "has_more": False, "next_cursor": None}
+        )
+
+    client = make_client(handler)
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    pages = list(client.scan_db("db-id", partitions=3, start=start))
+
+    assert len(filters) == 3
+    assert sorted(page.id for page in pages) == ["page-1", "page-2", "page-3", "shared"]
+    assert all(page._client is client for page in pages)
+
+
+def test_query_db_stream(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    cursors: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursors.append(json.loads(request.content).get("start_cursor"))
+        has_more = len(cursors) < 2
+        body = {
+            "results": [
+                {**normal_page, "id": f"page-{len(cursors)}-{i}"} for i in range(3)
+            ],
+            "has_more": has_more,
+            "next_cursor": "cursor" if has_more else None,
+        }
+        raw = json.dumps(body).encode()
+        # Sending the body in small chunks like a slow connection would.
+        return httpx.Response(
+            200, content=iter(partial(io.BytesIO(raw).read, 100), b"")
+        )
+
+    client = make_client(handler)
+    pages = list(client.query_db("db-id", stream=True))
+
+    assert cursors == [None, "cursor"]
+    assert [page.id for page in pages] == [
+        f"page-{j}-{i}" for j in (1, 2) for i in range(3)
+    ]
+    assert all(isinstance(page, Page) and page._client is client for page in pages)
+
+
+def test_query_db_raw(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [normal_page], "has_more": False})
+
+    client = make_client(handler)
+
+    assert list(client.query_db("db-id", raw=True)) == [normal_page]
+    assert list(client.query_db("db-id", raw=True, stream=True)) == [normal_page]
+
+
+def test_query_db_stream_error(make_client: Callable[..., NotionClient]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400, json={"code": "validation_error", "message": "Bad filter"}
+        )
+
+    client = make_client(handler)
+
+    with pytest.raises(APIResponseError):
+        list(client.query_db("db-id", stream=True))
+
+
+def test_query_db_use_schema(
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+    make_client: Callable[..., NotionClient],
+):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json=full_db)
+        return httpx.Response(200, json={"results": [normal_page], "has_more": False})
+
+    client = make_client(handler)
+    query = {"filter": {"property": "Number", "number": {"equals": 1}}}
+    for _ in range(2):
+        pages = list(client.query_db("db-id", query, use_schema=True))
+        assert [page.id for page in pages] == ["page-id"]
+
+    assert [request.method for request in requests] == ["GET", "POST", "POST"]
+    assert json.loads(requests[-1].content)["filter"] == {
+        "property": "TqZn",
+        "number": {"equals": 1},
+    }
+
+    client.get_schema("db-id", refresh=True)
+    assert [request.method for request in requests][-1] == "GET"
+    assert client.schemas.stats.hits == 1
+
+
+def test_db_query_resolves_filters_only_with_use_schema(
+    full_db: dict[str, Any],
+    normal_page: dict[str, Any],
+    make_client: Callable[..., NotionClient],
+):
+
+    filters: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        filters.append(json.loads(request.content)["filter"])
+        return httpx.Response(200, json={"results": [normal_page], "has_more": False})
+
+    db = Database.from_dict(full_db)
+    db.set_client(make_client(handler))
+    query = {"filter": {"property": "Name", "rich_text": {"contains": "a"}}}
+    list(db.query(query))
+    list(db.query(query, use_schema=True))
+
+    assert filters == [
+        {"property": "Name", "rich_text": {"contains": "a"}},
+        {"property": "title", "title": {"contains": "a"}},
+    ]
+
+
+def test_schema_not_shared_with_retrieve_db(
+    full_db: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=full_db)
+
+    client = make_client(handler)
+    db = client.retrieve_db("db-id")
+    assert len(client.schemas) == 0
+
+    schema = client.get_schema("db-id")
+    assert client.get_schema("db-id") is schema
+    assert schema.database is not db
+    assert len(requests) == 2
+
+    db.properties.pop("Number")
+    assert "Number" in schema.database.properties
+
+
+def test_create_pages(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        title = body["properties"]["title"]["title"][0]["text"]["content"].strip()
+        if title == "fail":
+            return httpx.Response(
+                400, json={"code": "validation_error", "message": "invalid"}
+            )
+        return httpx.Response(200, json={**normal_page, "id": title})
+
+    client = make_client(handler)
+    db = Database(id="db-id")
+    db.set_client(client)
+
+    titles = [f"page-{i}" for i in range(10)]
+    titles[4] = "fail"
+    pages = []
+    for title in titles:
+        page = Page()
+        page.title = title
+        pages.append(page)
+
+    results = db.create_pages(pages, concurrency=4)
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.ok for result in results].count(False) == 1
+    assert isinstance(results[4].error, APIResponseError)
+    for title, result in zip(titles, results):
+        if result.ok:
+            assert result.value is not None
+            assert result.value.id == title
+
+
+def test_update_pages_coalesces_per_page(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page_id = request.url.path.split("/")[-1]
+        assert page_id not in requests
+        requests[page_id] = json.loads(request.content)
+        return httpx.Response(200, json={**normal_page, "id": page_id})
+
+    client = make_client(handler)
+    updates = [
+        ("page-1", {"Estimate": {"number": 1}}),
+        ("page-2", {"Estimate": {"number": 2}}),
+        ("page-1", {"Estimate": {"number": 3}, "Done": {"checkbox": True}}),
+    ]
+
+    results = client.update_pages(updates)
+
+    assert list(results) == ["page-1", "page-2"]
+    assert all(result.ok for result in results.values())
+    assert requests["page-1"] == {
+        "properties": {"Estimate": {"number": 3}, "Done": {"checkbox": True}}
+    }
+    assert requests["page-2"] == {"properties": {"Estimate": {"number": 2}}}
+
+
+def test_update_page_sends_only_modified(
+    full_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json=full_page)
+
+    client = make_client(handler)
+    page = Page.from_dict(copy.deepcopy(full_page))
+    page.set_client(client)
+
+    assert not any(prop.modified for prop in page.properties)
+    assert page.update() is page
+    assert requests == []
+
+    number = page.properties["Created number"]
+    number.number = 42
+    page.archived = True
+    page.update()
+
+    assert requests == [{"properties": {number.id: {"number": 42}}, "archived": True}]
+
+
+def test_update_page_title(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json=normal_page)
+
+    client = make_client(handler)
+    page = Page.from_dict(normal_page)
+    page.set_client(client)
+
+    page.title = "New title"
+    page.update()
+
+    assert list(requests[0]) == ["properties"]
+    assert list(requests[0]["properties"]) == ["title"]
+
+
+def test_update_sends_changes_made_in_place(
+    normal_page: dict[str, Any],
+    full_db: dict[str, Any],
+    make_client: Callable[..., NotionClient],
+):
+
+    requests: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            requests.append(json.loads(request.content))
+        if "databases" in request.url.path:
+            return httpx.Response(200, json=full_db)
+        return httpx.Response(200, json=normal_page)
+
+    client = make_client(handler, track_in_place_changes=True)
+    page = client.retrieve_page(normal_page["id"])
+    page.rich_title.append(Text("Appended"))
+    page.update()
+
+    db = client.retrieve_db(full_db["id"])
+    select = db.properties["Select"]
+    select.options.append(Option("New option"))
+    db.update()
+
+    assert len(requests) == 2
+    title = requests[0]["properties"]["title"]["title"]
+    assert title[-1]["text"]["content"].strip() == "Appended"
+    assert list(requests[1]["properties"]) == [select.id]
+    options = requests[1]["properties"][select.id]["select"]["options"]
+    assert options[-1]["name"] == "New option"
+
+
+def test_update_changes_made_in_place_untracked(
+    full_db: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            requests.append(json.loads(request.content))
+        return httpx.Response(200, json=full_db)
+
+    client = make_client(handler)
+    db = client.retrieve_db(full_db["id"])
+    select = db.properties["Select"]
+    select.options.append(Option("New option"))
+    db.update()
+    assert requests == []
+    assert select._raw is None
+
+    select.mark_modified()
+    db.update()
+    assert list(requests[0]["properties"]) == [select.id]
+
+
+def test_update_db_sends_only_modified(
+    full_db: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    requests: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json=full_db)
+
+    client = make_client(handler)
+    db = Database.from_dict(copy.deepcopy(full_db))
+    db.set_client(client)
+
+    assert db.update() is db
+    assert requests == []
+
+    prop = next(iter(db.properties))
+    db.properties.pop(prop)
+    db.title = "New title"
+    db.update()
+
+    assert len(requests) == 2
+    assert list(requests[0]) == ["title"]
+    assert requests[1] == {"properties": {prop.id: None}}
@@ -0,0 +1,126 @@
+import asyncio
+import copy
+import json
+from array import array
+from datetime import datetime
+from datetime import timezone
+from math import isnan
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+
+import httpx
+
+from nopy.async_client import AsyncNotionClient
+from nopy.client import NotionClient
+from nopy.columnar import QueryResult
+
+
+def make_pages(full_page: dict[str, Any]) -> list[dict[str, Any]]:
+
+    empty = copy.deepcopy(full_page)
+    empty["id"] = "empty-page"
+    props = empty["properties"]
+    props["Created number"]["number"] = None
+    props["Created select"]["select"] = None
+    props["Date"]["date"] = None
+    del props["Status"]
+
+    other = copy.deepcopy(full_page)
+    other["id"] = "other-page"
+    other["properties"]["Created select"]["select"]["name"] = "Option Two"
+    other["properties"]["Checkbox"]["checkbox"] = True
+
+    return [full_page, empty, other]
+
+
+def test_from_pages(full_page: dict[str, Any]):
+
+    result = QueryResult.from_pages(make_pages(full_page), use_numpy=False)
+
+    assert len(result) == 3
+    assert result.ids == [full_page["id"], "empty-page", "other-page"]
+    assert "Created number" in result
+
+    number = result["Created number"]
+    assert isinstance(number.values, array)
+    assert number.values[0] == 123 and isnan(number.values[1])
+    assert number.to_list() == [123, None, 123]
+
+    select = result["Created select"]
+    assert list(select.values) == [0, -1, 1]
+    assert select.categories == ["Option One", "Option Two"]
+    assert select.to_list() == ["Option One", None, "Option Two"]
+
+    assert result["Status"].to_list() == ["Not started", None, "Not started"]
+    assert result["Checkbox"].to_list() == [False, False, True]
+
+    created = datetime(2022, 12, 23, 8, 50, tzinfo=timezone.utc)
+    assert list(result["Created time"].values) == [created.timestamp()] * 3
+    assert result["Created time"].to_list() == [created] * 3
+    assert result["Date"].to_list()[1] is None
+
+    assert result["Created text"].values == ["some text"] * 3
+
+
+def test_fields(full_page: dict[str, Any]):
+
+    result = QueryResult.from_pages(
+        make_pages(full_page), fields=["Created number", "Missing"], use_numpy=False
+    )
+
+    assert list(result) == ["Created number", "Missing"]
+    assert result.to_dict()["Missing"] == [None, None, None]
+
+
+def test_afrom_pages_adds_each_page_when_received(full_page: dict[str, Any]):
+
+    pages = make_pages(full_page)
+    expected = QueryResult.from_pages(copy.deepcopy(pages), use_numpy=False)
+
+    async def receive() -> AsyncIterator[dict[str, Any]]:
+        for page in pages:
+            yield page
+            # The page was already added, so it's no longer needed.
+            page.clear()
+
+    result = asyncio.run(QueryResult.afrom_pages(receive(), use_numpy=False))
+
+    assert result.ids == expected.ids
+    assert result.to_dict() == expected.to_dict()
+
+
+def test_no_pages():
+
+    result = QueryResult.from_pages([])
+
+    assert len(result) == 0
+    assert result.columns == {}
+
+
+def test_query_db_columns(
+    full_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {"results": make_pages(full_page), "has_more": False}
+        return httpx.Response(200, content=json.dumps(body))
+
+    client = make_client(handler)
+
+    result = client.query_db_columns("db-id", fields=["Checkbox"], use_numpy=False)
+
+    assert result.to_dict() == {"Checkbox": [False, False, True]}
+
+
+def test_async_query_db_columns(
+    full_page: dict[str, Any], make_async_client: Callable[..., AsyncNotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {"results": make_pages(full_page), "has_more": False}
+        return httpx.Response(200, content=json.dumps(body))
+
+    async def run() -> QueryResult:
+        async with make_async_client(handler) as client:
+            return await client.query_db_columns("db-id", fields=["Checkbox"])
+
+    assert asyncio.run(run()).to_dict() == {"Checkbox": [False, False, True]}
@@ -0,0 +1,207 @@
+import json
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from nopy.client import NotionClient
+from nopy.directory import UserDirectory
+from nopy.errors import NopyError
+from nopy.identity import IdentityMap
+from nopy.objects.user import Bot
+from nopy.objects.user import Person
+from nopy.objects.user import User
+from nopy.props.page_props import PPeople
+from tests.conftest import FakeClock
+
+PERSON = {
+    "object": "user",
+    "id": "user-id",
+    "type": "person",
+    "name": "Person",
+    "person": {"email": "person@email.com"},
+}
+
+
+def test_from_dict_resolves_partial_users():
+
+    directory = UserDirectory(ttl=10)
+    directory.update([Person.from_dict(PERSON)])
+
+    user = User.from_dict({"object": "user", "id": "user-id"}, directory)
+    unknown = User.from_dict({"object": "user", "id": "other-id"}, directory)
+
+    assert isinstance(user, Person)
+    assert user.email == "person@email.com"
+    assert unknown.partial
+    assert "user-id" in directory
+
+
+def test_reloaded_once_stale(clock: FakeClock):
+
+    loads: list[float] = []
+
+    def loader():
+        loads.append(clock.now)
+        return [Person.from_dict(PERSON)]
+
+    directory = UserDirectory(loader, ttl=10, clock=clock)
+
+    assert directory.get("user-id") is not None
+    assert directory.get("user-id") is not None
+    clock.now = 10
+    assert directory.get("user-id") is not None
+    assert loads == [0, 10]
+
+
+def test_failed_load_keeps_users(clock: FakeClock):
+
+    users = [Person.from_dict(PERSON)]
+
+    def loader():
+        if not users:
+            raise RuntimeError("failed")
+        return users
+
+    directory = UserDirectory(loader, ttl=10, clock=clock)
+    directory.refresh()
+    users.clear()
+    clock.now = 10
+
+    assert isinstance(directory.get("user-id"), Person)
+    assert not directory.stale
+    with pytest.raises(RuntimeError):
+        directory.refresh()
+
+
+def test_failed_load_retried_with_backoff(clock: FakeClock):
+
+    loads: list[float] = []
+
+    def loader():
+        loads.append(clock.now)
+        if len(loads) < 4:
+            raise RuntimeError("failed")
+        return [Person.from_dict(PERSON)]
+
+    directory = UserDirectory(loader, ttl=10, retry_delay=2, clock=clock)
+
+    for now in (0, 1, 2, 5, 6, 13, 14):
+        clock.now = now
+        directory.get("user-id")
+
+    assert loads == [0, 2, 6, 14]
+    assert isinstance(directory.get("user-id"), Person)
+    assert not directory.stale
+
+
+def test_loaded_once_across_threads():
+
+    loads: list[int] = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.01)
+        return [Person.from_dict(PERSON)]
+
+    directory = UserDirectory(loader)
+    found: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: found.append(directory.get("user-id")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(isinstance(user, Person) for user in found)
+
+
+def test_stale_directory_not_waited_for(clock: FakeClock):
+
+    loading = threading.Event()
+    release = threading.Event()
+    loads: list[float] = []
+
+    def loader():
+        loads.append(clock.now)
+        if loads[1:]:
+            loading.set()
+            release.wait(5)
+        return [Person.from_dict(PERSON)]
+
+    directory = UserDirectory(loader, ttl=10, clock=clock)
+    first = directory.get("user-id")
+    clock.now = 10
+
+    found: list[Any] = []
+    reloading = threading.Thread(target=lambda: found.append(directory.get("user-id")))
+    reloading.start()
+    assert loading.wait(5)
+
+    # The directory is being reloaded, so the users loaded before are used.
+    assert directory.get("user-id") is first
+    assert directory.stale
+
+    release.set()
+    reloading.join()
+    assert loads == [0, 10]
+    assert isinstance(found[0], Person) and found[0] is not first
+    assert not directory.stale
+
+
+def test_identity_map_resolves_people():
+
+    directory = UserDirectory(ttl=10)
+    directory.update([Person.from_dict(PERSON)])
+    identity_map = IdentityMap(directory=directory)
+
+    partial = identity_map.user({"object": "user", "id": "user-id"})
+    people = identity_map.users_of(PPeople(people=[User("user-id"), User("other")]))
+
+    assert isinstance(partial, Person)
+    assert people.people[0] is partial
+    assert people.people[1].partial
+    assert identity_map.user({"object": "user", "id": "other"}) is people.people[1]
+
+
+def test_query_db_resolves_users(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    paths: list[str] = []
+    bot = {"object": "user", "id": "bot-id", "type": "bot", "bot": {}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/v1/users/":
+            body = {"results": [PERSON, bot], "has_more": False}
+        else:
+            pages = [{**normal_page, "id": f"page-{i}"} for i in range(3)]
+            body = {"results": pages, "has_more": False}
+        return httpx.Response(200, content=json.dumps(body))
+
+    client = make_client(handler, user_directory_ttl=60)
+    pages = list(client.query_db("db-id"))
+
+    assert paths == ["/v1/databases/db-id/query", "/v1/users/"]
+    assert all(isinstance(page.created_by, Person) for page in pages)
+    assert pages[0].created_by is pages[2].last_edited_by
+    assert isinstance(client.users.get("bot-id"), Bot)  # type: ignore
+
+    client.refresh_users()
+    assert paths[-1] == "/v1/users/"
+
+
+def test_directory_not_enabled(make_client: Callable[..., NotionClient]):
+
+    client = make_client(lambda request: httpx.Response(200))
+
+    assert client.users is None
+    with pytest.raises(NopyError):
+        client.refresh_users()
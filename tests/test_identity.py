@@ -0,0 +1,125 @@
+import copy
+import json
+import pickle
+from dataclasses import FrozenInstanceError
+from dataclasses import replace
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from nopy.client import NotionClient
+from nopy.identity import IdentityMap
+from nopy.objects.page import Page
+from nopy.objects.user import Person
+from nopy.objects.user import User
+from nopy.props.common import DatabaseParent
+from nopy.props.common import PageParent
+
+
+def test_users_and_parents_are_shared(normal_page: dict[str, Any]):
+
+    identity_map = IdentityMap()
+    first = Page.from_dict(copy.deepcopy(normal_page), identity_map=identity_map)
+    second = Page.from_dict(copy.deepcopy(normal_page), identity_map=identity_map)
+
+    assert first.created_by is second.created_by
+    assert first.last_edited_by is second.last_edited_by
+    assert first.parent is second.parent
+
+    unshared = Page.from_dict(copy.deepcopy(normal_page))
+    assert unshared.created_by is not first.created_by
+    assert unshared.created_by == first.created_by
+
+
+def test_interned_instances_are_read_only(normal_page: dict[str, Any]):
+
+    identity_map = IdentityMap()
+    page = Page.from_dict(copy.deepcopy(normal_page), identity_map=identity_map)
+    user = identity_map.user(
+        {"object": "user", "id": "other-id", "type": "person", "person": {}}
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        page.created_by.name = "Changed"  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        page.parent.id = "changed"  # type: ignore
+
+    assert isinstance(user, Person)
+    assert user == Person(id="other-id")
+    assert Person(id="other-id") == user
+    assert copy.deepcopy(page).created_by is page.created_by
+    assert pickle.loads(pickle.dumps(user)) == user
+
+    # Reassigning the attribute of the page is safe.
+    page.parent = DatabaseParent("db-id")
+    assert page.parent.id == "db-id"
+
+
+def test_interned_instances_replaced(normal_page: dict[str, Any]):
+
+    identity_map = IdentityMap()
+    page = Page.from_dict(copy.deepcopy(normal_page), identity_map=identity_map)
+    parent = page.parent
+
+    page.parent = replace(parent, id="db-id")  # type: ignore
+    user = replace(page.created_by, name="Changed")  # type: ignore
+
+    # The copies are new read only instances of the same frozen variants.
+    assert type(page.parent) is type(parent)
+    assert isinstance(page.parent, PageParent)
+    assert page.parent.id == "db-id"
+    assert parent.id != "db-id"
+    assert isinstance(user, User) and user.name == "Changed"
+    assert page.created_by.name != user.name
+    with pytest.raises(FrozenInstanceError):
+        user.name = "Changed again"
+
+
+def test_partial_user_replaced_by_full_user():
+
+    identity_map = IdentityMap()
+    partial = identity_map.user({"object": "user", "id": "user-id"})
+    full = identity_map.user(
+        {
+            "object": "user",
+            "id": "user-id",
+            "type": "person",
+            "name": "Person",
+            "person": {"email": "person@email.com"},
+        }
+    )
+
+    assert partial.partial
+    assert isinstance(full, Person)
+    assert identity_map.user({"object": "user", "id": "user-id"}) is full
+
+
+def test_max_size():
+
+    identity_map = IdentityMap(max_size=2)
+    parents = [
+        identity_map.parent({"type": "database_id", "database_id": str(i)})
+        for i in range(3)
+    ]
+
+    assert all(isinstance(parent, DatabaseParent) for parent in parents)
+    assert len(identity_map) == 1
+
+
+def test_query_db_shares_users(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        pages = [{**normal_page, "id": f"page-{i}"} for i in range(3)]
+        body = {"results": pages, "has_more": False, "next_cursor": None}
+        return httpx.Response(200, content=json.dumps(body))
+
+    client = make_client(handler)
+
+    pages = list(client.query_db("db-id"))
+
+    assert len(pages) == 3
+    assert len({id(page.created_by) for page in pages}) == 1
+    assert len({id(page.parent) for page in pages}) == 1
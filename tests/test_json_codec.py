@@ -0,0 +1,105 @@
+import json
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from nopy import json_codec
+from nopy.client import NotionClient
+from nopy.errors import HTTPError
+from nopy.json_codec import JSONCodec
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_codec_round_trip(name: str):
+
+    pytest.importorskip(name)
+    codec = JSONCodec.get(name)
+    obj = {"title": "ünïcödé", "number": 1.5, "list": [None, True]}
+
+    encoded = codec.dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == obj
+    assert codec.loads(encoded) == obj
+    with pytest.raises(codec.errors):
+        codec.loads(b"{not json")
+
+
+def test_codec_auto_detection(monkeypatch: pytest.MonkeyPatch):
+
+    monkeypatch.setattr(json_codec, "find_spec", lambda name: None)
+    assert JSONCodec.get().name == "json"
+
+    monkeypatch.setattr(json_codec, "find_spec", lambda name: name == "ujson")
+    monkeypatch.setitem(json_codec._FACTORIES, "ujson", lambda: JSONCodec("ujson", None, None))  # type: ignore
+    assert JSONCodec.get().name == "ujson"
+
+
+def test_unsupported_codec():
+
+    with pytest.raises(ValueError):
+        JSONCodec.get("simplejson")
+
+
+def test_client_uses_codec(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    calls: list[str] = []
+
+    def dumps(obj: Any) -> bytes:
+        calls.append("dumps")
+        return json.dumps(obj).encode()
+
+    def loads(data: Any) -> Any:
+        calls.append("loads")
+        return json.loads(data)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"page_size": 100}
+        body = {"results": [normal_page], "has_more": False, "next_cursor": None}
+        return httpx.Response(200, json=body)
+
+    client = make_client(handler, json_codec=JSONCodec("custom", dumps, loads))
+    pages = list(client.query_db("db-id"))
+
+    assert len(pages) == 1
+    assert calls == ["dumps", "loads"]
+
+
+def test_streamed_query_uses_codec(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    decoded: list[Any] = []
+
+    def loads(data: Any) -> Any:
+        decoded.append(json.loads(data))
+        return decoded[-1]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = [normal_page, normal_page]
+        body = {"results": results, "has_more": False, "next_cursor": None}
+        return httpx.Response(200, json=body)
+
+    codec = JSONCodec("custom", JSONCodec.get("json").dumps, loads)
+    client = make_client(handler, json_codec=codec)
+    pages = list(client.query_db("db-id", stream=True))
+
+    assert len(pages) == 2
+    # Each page and then the rest of the response.
+    assert decoded[:2] == [normal_page, normal_page]
+    assert decoded[2]["has_more"] is False
+
+
+def test_invalid_error_body(make_client: Callable[..., NotionClient]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, text="Bad Gateway")
+
+    client = make_client(handler, json_codec="json")
+
+    with pytest.raises(HTTPError):
+        client.retrieve_page("page-id")
@@ -0,0 +1,133 @@
+import json
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import httpx
+import pytest
+
+from nopy.cache import QueryCachePolicy
+from nopy.client import NotionClient
+from nopy.errors import APIResponseError
+from nopy.mirror import DatabaseMirror
+from nopy.objects.page import Page
+
+
+def make_page(normal_page: dict[str, Any], page_id: str, edited: str) -> dict[str, Any]:
+
+    return {**normal_page, "id": page_id, "last_edited_time": edited}
+
+
+def test_sync(
+    normal_page: dict[str, Any],
+    tmp_path: Path,
+    make_client: Callable[..., NotionClient],
+):
+
+    pages = {
+        "a": make_page(normal_page, "a", "2022-12-20T03:01:00.000Z"),
+        "b": make_page(normal_page, "b", "2022-12-21T05:30:00.000Z"),
+    }
+    queries: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)
+        queries.append(query)
+        results = list(pages.values())
+        if "filter" in query:
+            after = query["filter"]["and"][0]["last_edited_time"]["on_or_after"]
+            results = [
+                page for page in results if page["last_edited_time"] >= after[:16]
+            ]
+        body = {"results": results, "has_more": False, "next_cursor": None}
+        return httpx.Response(200, json=body)
+
+    client = make_client(handler)
+    path = tmp_path / "mirror.db"
+
+    with DatabaseMirror(client, "db-id", path) as mirror:
+        result = mirror.sync()
+
+        assert result.full
+        assert result.fetched == 2
+        assert "filter" not in queries[0]
+        assert queries[0]["sorts"] == [
+            {"timestamp": "last_edited_time", "direction": "ascending"}
+        ]
+        assert len(mirror) == 2
+
+    # Only the edited pages are fetched by the following syncs.
+    pages["a"] = make_page(normal_page, "a", "2022-12-22T10:00:00.000Z")
+    with DatabaseMirror(client, "db-id", path) as mirror:
+        result = mirror.sync()
+
+        assert not result.full
+        assert result.fetched == 2
+        assert queries[1]["filter"]["and"][0] == {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": "2022-12-21T05:30:00+00:00"},
+        }
+        assert str(result.watermark) == "2022-12-22 10:00:00+00:00"
+
+        page = mirror.get("a")
+        assert isinstance(page, Page)
+        assert page.last_edited_time.day == 22
+        assert (
+            list(mirror.rows(["title"], as_tuples=True)) == [("Trial Root Page",)] * 2
+        )
+        assert [page.id for page in mirror.pages()] == ["a", "b"]
+
+        # Deleted pages are only removed by a full sync.
+        del pages["b"]
+        assert mirror.sync().deleted == 0
+        result = mirror.sync(full=True)
+
+        assert result.deleted == 1
+        assert [page.id for page in mirror.pages()] == ["a"]
+
+
+def test_failed_sync_leaves_mirror_unchanged(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) > 1:
+            return httpx.Response(400, json={"code": "error", "message": "Failed"})
+        body = {"results": [normal_page], "has_more": True, "next_cursor": "cursor"}
+        return httpx.Response(200, json=body)
+
+    mirror = DatabaseMirror(make_client(handler), "db-id")
+    with pytest.raises(APIResponseError):
+        mirror.sync()
+
+    assert len(mirror) == 0
+    assert mirror.watermark is None
+
+
+def test_sync_bypasses_query_cache(
+    normal_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+
+    pages = [make_page(normal_page, "a", "2022-12-20T03:01:00.000Z")]
+    queries: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(json.loads(request.content))
+        body = {"results": list(pages), "has_more": False, "next_cursor": None}
+        return httpx.Response(200, json=body)
+
+    client = make_client(handler, query_cache=QueryCachePolicy(ttl=60))
+    # Caching the results of the same query the first sync makes.
+    sorts = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+    assert [page.id for page in client.query_db("db-id", {"sorts": sorts})] == ["a"]
+
+    pages.append(make_page(normal_page, "b", "2022-12-21T05:30:00.000Z"))
+    with DatabaseMirror(client, "db-id") as mirror:
+        result = mirror.sync()
+
+    assert len(queries) == 2
+    assert queries[1]["sorts"] == sorts
+    assert result.fetched == 2
@@ -1,13 +1,19 @@
+import copy
+from dataclasses import asdict
 from typing import Any
 
+import pytest
 from dateutil.parser import parse
 
 from nopy.enums import ObjectTypes
+from nopy.errors import PropertyExistsError
 from nopy.objects.page import Page
 from nopy.objects.user import User
+from nopy.properties import LazyProperties
 from nopy.props.common import Emoji
 from nopy.props.common import File
 from nopy.props.common import PageParent
+from nopy.props.page_props import PNumber
 
 
 def test_normal_page(normal_page: dict[str, Any]):
@@ -65,3 +71,71 @@ def test_no_icon(normal_page: dict[str, Any]):
     page = Page.from_dict(normal_page)
 
     assert page.icon is None
+
+
+def test_lazy_page_properties(full_page: dict[str, Any]):
+
+    page = Page.from_dict(full_page, lazy=True)
+    page_props = full_page["properties"]
+    properties = page.properties
+    assert isinstance(properties, LazyProperties)
+
+    assert len(page_props) - 1 == len(properties)
+    assert len(properties._props) == 0
+
+    number = properties["Created number"]
+    assert isinstance(number, PNumber)
+    assert number.name == "Created number"
+    assert number.modified is False
+    assert properties[number.id] is number
+    assert len(properties._props) == 1
+    assert "name" not in page_props["Created number"]
+
+    assert properties.serialize(only_modified=True) == {}
+    assert len(properties._props) == 1
+
+    eager = Page.from_dict(full_page)
+    for prop in properties:
+        assert asdict(prop) == asdict(eager.properties[prop.id])
+    assert len(properties._props) == len(properties)
+
+
+def test_lazy_page_add_existing(full_page: dict[str, Any]):
+
+    page = Page.from_dict(full_page, lazy=True)
+
+    assert "Created number" in page.properties
+    with pytest.raises(PropertyExistsError):
+        page.properties.add(PNumber(name="Created number"))
+
+
+def test_from_dict_leaves_input_untouched(full_page: dict[str, Any]):
+
+    original = copy.deepcopy(full_page)
+
+    eager = Page.from_dict(full_page)
+    lazy = Page.from_dict(full_page, lazy=True)
+    for prop in lazy.properties:
+        assert asdict(prop) == asdict(eager.properties[prop.id])
+
+    assert full_page == original
+
+
+def test_reading_properties_doesnt_serialize(
+    full_page: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+):
+
+    page = Page.from_dict(full_page)
+
+    def fail(self: Any):
+        raise AssertionError("serialized while reading")
+
+    monkeypatch.setattr(PNumber, "serialize", fail)
+    for prop in page.properties:
+        assert prop is page.properties[prop.id]
+
+    monkeypatch.undo()
+    page.properties["Created number"].number = 12
+    assert [prop.name for prop in page.properties if prop.modified] == [
+        "Created number"
+    ]
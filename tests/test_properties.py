@@ -1,5 +1,7 @@
 # pyright: reportPrivateUsage=false
 
+import copy
+
 import pytest
 
 from nopy import Properties
@@ -114,3 +116,53 @@ def test_pop_invalid_prop(props: Properties, prop: DBText):
 
     with pytest.raises(PropertyNotFoundError):
         props.pop(prop)
+
+
+def test_insertion_order(props: Properties):
+
+    names = [f"prop-{i}" for i in range(20)]
+    for i, name in enumerate(names):
+        props.add(DBText(id=str(i), name=name))
+
+    assert [prop.name for prop in props] == names
+    assert list(props.serialize()) == [str(i) for i in range(20)]
+
+    # Popping most of the properties compacts the store.
+    for name in names[:15]:
+        props.pop(name)
+
+    assert len(props) == 5
+    assert len(props._props) < 20
+    assert [prop.name for prop in props] == names[15:]
+    assert props["19"].name == "prop-19"
+    assert "prop-0" not in props
+
+
+def test_pop_renamed_prop(props: Properties, prop: DBText):
+
+    renamed = DBText(id="2", name="old name")
+    props.add(prop)
+    props.add(renamed)
+    renamed.name = "new name"
+
+    assert renamed in props
+    assert props.pop(renamed) is renamed
+    assert renamed not in props
+    assert "old name" not in props
+    assert list(props) == [prop]
+
+
+def test_copied_props_found(props: Properties):
+
+    for i in range(3):
+        props.add(DBText(id=str(i), name=f"prop-{i}"))
+
+    copied = copy.deepcopy(props)
+    prop = copied["1"]
+    prop.name = "renamed"
+
+    assert prop in copied
+    assert props["1"] not in copied
+    assert copied.pop(prop) is prop
+    assert [prop.id for prop in copied] == ["0", "2"]
+    assert len(props) == 3
@@ -1,12 +1,21 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from dataclasses import replace
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import pytest
 from dateutil.parser import parse
 
+from nopy.enums import COLORS
+from nopy.enums import ROLLUP_FUNCTIONS
 from nopy.enums import Colors
 from nopy.enums import FileTypes
 from nopy.enums import MentionTypes
 from nopy.enums import RichTextTypes
+from nopy.enums import RollupFunctions
+from nopy.props.common import DEFAULT_ANNOTATIONS
 from nopy.props.common import Annotations
 from nopy.props.common import Date
 from nopy.props.common import Emoji
@@ -39,6 +48,46 @@ def test_annotations_fd():
     assert annot.underline is False
     assert annot.code is False
     assert annot.color == Colors.DEFAULT
+    # Unstyled text shares the default annotations.
+    assert annot is DEFAULT_ANNOTATIONS
+    assert annot == Annotations()
+    with pytest.raises(FrozenInstanceError):
+        annot.bold = True
+
+    args["bold"] = True
+    args["color"] = "red_background"
+    annot = Annotations.from_dict(args)
+
+    assert annot is not DEFAULT_ANNOTATIONS
+    assert annot.bold is True
+    assert annot.color == Colors.RED_BACKGROUND
+
+
+def test_default_annotations_copies():
+
+    assert copy.copy(DEFAULT_ANNOTATIONS) is DEFAULT_ANNOTATIONS
+    assert copy.deepcopy(DEFAULT_ANNOTATIONS) is DEFAULT_ANNOTATIONS
+
+    unpickled = pickle.loads(pickle.dumps(DEFAULT_ANNOTATIONS))
+    assert unpickled == DEFAULT_ANNOTATIONS
+    with pytest.raises(FrozenInstanceError):
+        unpickled.bold = True
+
+    bold = replace(DEFAULT_ANNOTATIONS, bold=True)
+    assert isinstance(bold, Annotations)
+    assert bold == Annotations(bold=True)
+    assert Annotations(bold=True) == bold
+    assert DEFAULT_ANNOTATIONS == Annotations()
+    assert DEFAULT_ANNOTATIONS != bold
+    with pytest.raises(FrozenInstanceError):
+        bold.italic = True
+
+
+def test_decode_tables():
+
+    for enum, table in [(Colors, COLORS), (RollupFunctions, ROLLUP_FUNCTIONS)]:
+        for member in enum:
+            assert table[member.value] is member
 
 
 def test_date_fd():
@@ -211,3 +260,25 @@ def test_emoji_fd():
     emoji = Emoji.from_dict(args)
 
     assert emoji.emoji == "\ud83c\udf8a"
+
+
+def test_slotted():
+
+    mention = Mention(plain_text=" mention ")
+    text = Text("text")
+
+    assert not hasattr(mention, "__dict__")
+    assert not hasattr(text, "__dict__")
+    assert not hasattr(text.annotations, "__dict__")
+    # `super()` still resolves to the recreated class.
+    assert mention.type == RichTextTypes.MENTION
+    assert mention.plain_text == "mention"
+    assert text.annotations.serialize() == {
+        "bold": False,
+        "italic": False,
+        "strikethrough": False,
+        "underline": False,
+        "code": False,
+        "color": "default",
+    }
+    assert isinstance(text, RichText)
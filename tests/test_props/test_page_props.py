@@ -451,3 +451,14 @@ def test_url_empty_fd():
     url: pgp.PUrl = pgp.PUrl.from_dict(url_args)
 
     assert url.url is None
+
+
+def test_slotted():
+
+    number = pgp.PNumber(id="id", name="name", number=1)
+
+    assert not hasattr(number, "__dict__")
+    assert number.modified is True
+    number._modified = False
+    number.number = 2
+    assert number.modified is True
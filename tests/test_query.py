@@ -0,0 +1,177 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+import nopy.props.db_props as dbp
+from nopy.filters import DateFilter
+from nopy.filters import TimestampFilter
+from nopy.query import Query
+from nopy.query import and_filters
+from nopy.query import fingerprint
+from nopy.query import partition_by_created_time
+from nopy.query import resolve_filters
+
+START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+END = datetime(2022, 1, 1, 4, 0, 30, tzinfo=timezone.utc)
+
+
+def test_date_filter_serialize():
+
+    date_filter = DateFilter(on_or_after=START, past_week=True)
+
+    assert date_filter.serialize() == {
+        "date": {"on_or_after": "2022-01-01T00:00:00+00:00", "past_week": {}}
+    }
+
+
+def test_timestamp_filter_serialize():
+
+    ts_filter = TimestampFilter("created_time", DateFilter(before=START))
+
+    assert ts_filter.serialize() == {
+        "timestamp": "created_time",
+        "created_time": {"before": "2022-01-01T00:00:00+00:00"},
+    }
+
+
+def test_timestamp_filter_in_query():
+
+    ts_filter = TimestampFilter("last_edited_time", DateFilter(after=START))
+    query = Query(and_filters=[ts_filter])
+
+    assert query.serialize()["filter"]["and"] == [ts_filter.serialize()]
+
+
+def test_and_filters():
+
+    status = {"property": "Status", "status": {"equals": "Done"}}
+    extra = {"property": "Done", "checkbox": {"equals": True}}
+
+    assert and_filters({}, [extra]) == {"filter": extra}
+    assert and_filters({"filter": status, "page_size": 10}, [extra]) == {
+        "filter": {"and": [status, extra]}
+    }
+    assert and_filters({"filter": {"and": [status]}}, [extra]) == {
+        "filter": {"and": [status, extra]}
+    }
+    assert and_filters({"filter": {"or": [status]}}, [extra]) == {
+        "filter": {"and": [{"or": [status]}, extra]}
+    }
+
+
+def test_and_filters_too_deep():
+
+    status = {"property": "Status", "status": {"equals": "Done"}}
+    extra = {"property": "Done", "checkbox": {"equals": True}}
+    nested = {"or": [status, {"and": [status, extra]}]}
+
+    with pytest.raises(ValueError):
+        and_filters({"filter": nested}, [extra])
+    assert and_filters({"filter": {"or": [status, extra]}}, [extra]) == {
+        "filter": {"and": [{"or": [status, extra]}, extra]}
+    }
+
+    # Such queries aren't partitioned, but queried as a whole.
+    partitions = partition_by_created_time({"filter": nested}, 4, START, END)
+    assert partitions == [{"query": {"filter": nested}}]
+
+
+def test_partition_by_created_time():
+
+    partitions = partition_by_created_time({}, 4, START, END)
+    filters = [partition["query"]["filter"] for partition in partitions]
+
+    assert len(partitions) == 4
+    # The first and last partitions are open ended.
+    assert filters[0]["created_time"] == {"before": "2022-01-01T01:00:00+00:00"}
+    assert filters[-1]["created_time"] == {"on_or_after": "2022-01-01T03:00:00+00:00"}
+    assert filters[1]["and"] == [
+        {
+            "timestamp": "created_time",
+            "created_time": {"on_or_after": "2022-01-01T01:00:00+00:00"},
+        },
+        {
+            "timestamp": "created_time",
+            "created_time": {"before": "2022-01-01T02:00:00+00:00"},
+        },
+    ]
+
+
+def test_single_partition():
+
+    query = {"sorts": [{"timestamp": "created_time", "direction": "ascending"}]}
+
+    assert partition_by_created_time(query, 1, START, END) == [{"query": query}]
+
+
+def test_resolve_filters():
+
+    props = [
+        dbp.DBText(name="Notes", id="nts"),
+        dbp.DBUrl(name="Link", id="abc"),
+        dbp.DBCreatedTime(name="Created", id="xyz"),
+    ]
+    query = {
+        "filter": {
+            "or": [
+                {"property": "Notes", "rich_text": {"contains": "a"}},
+                {
+                    "and": [
+                        {"property": "Link", "rich_text": {"is_not_empty": True}},
+                        {"property": "Created", "date": {"past_week": {}}},
+                        {"property": "Unknown", "number": {"equals": 1}},
+                    ]
+                },
+            ]
+        },
+        "sorts": [],
+    }
+
+    resolved = resolve_filters(query, props)
+
+    assert resolved == {
+        "filter": {
+            "or": [
+                {"property": "nts", "rich_text": {"contains": "a"}},
+                {
+                    "and": [
+                        {"property": "abc", "url": {"is_not_empty": True}},
+                        {"property": "xyz", "created_time": {"past_week": {}}},
+                        {"property": "Unknown", "number": {"equals": 1}},
+                    ]
+                },
+            ]
+        },
+        "sorts": [],
+    }
+    # The query given isn't modified.
+    assert query["filter"]["or"][0]["property"] == "Notes"
+    assert resolve_filters(None, props) == {}
+
+
+def test_resolve_filters_on_title():
+
+    query = {"filter": {"property": "Name", "rich_text": {"contains": "a"}}}
+
+    assert resolve_filters(query, [], ("Name", "title")) == {
+        "filter": {"property": "title", "title": {"contains": "a"}}
+    }
+    assert resolve_filters(query, []) == query
+
+
+def test_fingerprint():
+
+    ts_filter = TimestampFilter("created_time", DateFilter(before=START))
+    query = Query(and_filters=[ts_filter])
+    serialized = query.serialize()
+    reordered = {"sorts": [], "filter": dict(reversed(serialized["filter"].items()))}
+
+    assert query.fingerprint("db-id") == fingerprint(serialized, "dbid")
+    assert fingerprint(reordered, "db-id") == query.fingerprint("db-id")
+    assert fingerprint({**serialized, "page_size": 10}, "db-id") == (
+        query.fingerprint("db-id")
+    )
+    assert query.fingerprint("other-db") != query.fingerprint("db-id")
+    assert fingerprint(None, "db-id") == Query().fingerprint("db-id")
+    assert fingerprint(None, "db-id") != query.fingerprint("db-id")
@@ -0,0 +1,60 @@
+import pytest
+
+from nopy import ratelimit
+from nopy.client import NotionClient
+from nopy.ratelimit import RateLimiter
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def clock(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+
+    clock.now = 100.0
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_is_not_delayed(clock: FakeClock):
+
+    limiter = RateLimiter(3, burst=3)
+
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+
+
+def test_requests_are_spaced_out(clock: FakeClock):
+
+    limiter = RateLimiter(2)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills(clock: FakeClock):
+
+    limiter = RateLimiter(2, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    clock.now += 1
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_limits(rate: float, burst: int):
+
+    with pytest.raises(ValueError):
+        RateLimiter(rate, burst)
+
+
+def test_client_rate_limiter():
+
+    client = NotionClient("token", {"rate_limit": 3, "rate_limit_burst": 2})
+
+    assert client._rate_limiter is not None
+    assert client._rate_limiter.rate == 3
+    assert client._rate_limiter.burst == 2
+    assert NotionClient("token")._rate_limiter is None
@@ -0,0 +1,102 @@
+import io
+import json
+from functools import partial
+from typing import Any
+
+import pytest
+
+from nopy.streaming import ResultsDecoder
+from nopy.streaming import StreamedResponse
+
+
+def make_body(normal_page: dict[str, Any]) -> dict[str, Any]:
+
+    results = [{**normal_page, "id": f"page-{i}"} for i in range(5)]
+    # Brackets, braces and escaped quotes within strings mustn't confuse
+    # the decoder, nor should the key of the results nested elsewhere.
+    results[0]["tricky"] = 'a "quoted" ]}[{ \\ string with ünïcödé'
+    return {
+        "object": "list",
+        "meta": {"results": [1, 2]},
+        "results": results,
+        "next_cursor": "cursor",
+        "has_more": True,
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 256, 1_000_000])
+def test_streamed_response(normal_page: dict[str, Any], chunk_size: int):
+
+    body = make_body(normal_page)
+    raw = json.dumps(body, ensure_ascii=False).encode()
+    chunks = iter(partial(io.BytesIO(raw).read, chunk_size), b"")
+    closed: list[bool] = []
+
+    resp = StreamedResponse(chunks, lambda: closed.append(True))
+    results = list(resp["results"])
+
+    assert results == body["results"]
+    assert resp["has_more"] is True
+    assert resp["next_cursor"] == "cursor"
+    assert resp["meta"] == {"results": [1, 2]}
+    assert closed == [True]
+
+
+def test_results_are_yielded_as_they_arrive(normal_page: dict[str, Any]):
+
+    body = make_body(normal_page)
+    raw = json.dumps(body)
+    decoder = ResultsDecoder()
+
+    first_end = raw.index(', {"object"', raw.index('"results": [{'))
+    assert decoder.feed(raw[:first_end]) == [body["results"][0]]
+    assert decoder.feed(raw[first_end:]) == body["results"][1:]
+    assert decoder.close()["has_more"] is True
+
+
+def test_has_more_drains_the_results(normal_page: dict[str, Any]):
+
+    body = make_body(normal_page)
+    resp = StreamedResponse(iter([json.dumps(body).encode()]), lambda: None)
+
+    assert resp["has_more"] is True
+    assert list(resp["results"]) == []
+
+
+def test_each_result_is_decoded_once(normal_page: dict[str, Any]):
+
+    body = make_body(normal_page)
+    body["results"] += [1.5, "a ]", True, None, [{"b": "}"}]]
+    raw = json.dumps(body)
+    decoded: list[str] = []
+
+    def loads(text: str) -> Any:
+        decoded.append(text)
+        return json.loads(text)
+
+    decoder = ResultsDecoder(loads=loads)
+    results: list[Any] = []
+    for char in raw:
+        results.extend(decoder.feed(char))
+
+    assert results == body["results"]
+    assert decoder.close()["has_more"] is True
+    # The results are only decoded once they're received in full.
+    assert len(decoded) == len(body["results"]) + 1
+
+
+def test_incomplete_response():
+
+    decoder = ResultsDecoder()
+    decoder.feed('{"object": "list", "results": [{"id": "a"}, {"id": ')
+
+    with pytest.raises(json.JSONDecodeError):
+        decoder.close()
+
+
+def test_response_without_results():
+
+    decoder = ResultsDecoder()
+
+    assert decoder.feed('{"object": "error", "code": "bad"}') == []
+    assert decoder.close() == {"object": "error", "code": "bad"}
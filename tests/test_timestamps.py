@@ -0,0 +1,50 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+
+from nopy.timestamps import parse_datetime
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2022-12-03", datetime(2022, 12, 3)),
+        (
+            "2022-12-03T04:10:00.000Z",
+            datetime(2022, 12, 3, 4, 10, tzinfo=timezone.utc),
+        ),
+        ("2022-12-03T04:10:00Z", datetime(2022, 12, 3, 4, 10, tzinfo=timezone.utc)),
+        (
+            "2022-12-03T04:10:00.000+05:30",
+            datetime(
+                2022, 12, 3, 4, 10, tzinfo=timezone(timedelta(hours=5, minutes=30))
+            ),
+        ),
+    ],
+)
+def test_parse_iso(value: str, expected: datetime):
+
+    parsed = parse_datetime(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_fallback():
+
+    assert parse_datetime("Dec 3 2022 4:10 PM") == datetime(2022, 12, 3, 16, 10)
+
+
+def test_parse_invalid():
+
+    with pytest.raises(ValueError):
+        parse_datetime("not a date")
+
+
+def test_parse_is_cached():
+
+    value = "2021-01-01T00:00:00.000Z"
+
+    assert parse_datetime(value) is parse_datetime(value)
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from typing import Any
+from typing import Optional
+
+import pytest
+
+from nopy.utils import apaginate
+from nopy.utils import paginate
+from nopy.utils import paginate_partitions
+
+
+class FakeAPI:
+    """Returns `batches` batches of `size` results each."""
+
+    def __init__(self, batches: int, size: int = 2, fail_at: int = -1):
+
+        self.batches = batches
+        self.size = size
+        self.fail_at = fail_at
+        self.calls = 0
+        self.threads: set[str] = set()
+
+    def results(self, start_cursor: Optional[str]) -> dict[str, Any]:
+
+        self.threads.add(threading.current_thread().name)
+        batch = int(start_cursor) if start_cursor else 0
+        if batch == self.fail_at:
+            raise RuntimeError("failed")
+        self.calls += 1
+        has_more = batch + 1 < self.batches
+        return {
+            "results": [batch * self.size + i for i in range(self.size)],
+            "has_more": has_more,
+            "next_cursor": str(batch + 1) if has_more else None,
+        }
+
+    def __call__(self, start_cursor: Optional[str] = None) -> dict[str, Any]:
+
+        return self.results(start_cursor)
+
+    async def acall(self, start_cursor: Optional[str] = None) -> dict[str, Any]:
+
+        return self.results(start_cursor)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_paginate(prefetch: int):
+
+    api = FakeAPI(4)
+
+    results = list(paginate(api, lambda res: res, prefetch=prefetch))
+
+    assert results == list(range(8))
+    assert api.calls == 4
+
+
+def test_paginate_prefetches_in_background():
+
+    api = FakeAPI(3)
+
+    list(paginate(api, lambda res: res, prefetch=2))
+
+    assert api.threads == {"nopy-prefetch"}
+
+
+def test_paginate_prefetch_raises_errors():
+
+    api = FakeAPI(4, fail_at=2)
+    gen = paginate(api, lambda res: res, prefetch=2)
+
+    assert [next(gen) for _ in range(4)] == [0, 1, 2, 3]
+    with pytest.raises(RuntimeError):
+        next(gen)
+
+
+def test_paginate_prefetch_stops_on_early_exit():
+
+    api = FakeAPI(100)
+
+    results = list(paginate(api, lambda res: res, max_pages=2, prefetch=2))
+
+    assert results == [0, 1, 2]
+    # The buffer is bounded so the background thread couldn't have fetched
+    # everything.
+    assert api.calls < 100
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_apaginate(prefetch: int):
+
+    api = FakeAPI(3)
+
+    async def run():
+        return [
+            res
+            async for res in apaginate(api.acall, lambda res: res, prefetch=prefetch)
+        ]
+
+    assert asyncio.run(run()) == list(range(6))
+    assert api.calls == 3
+
+
+def test_apaginate_prefetch_raises_errors():
+
+    api = FakeAPI(4, fail_at=1)
+
+    async def run():
+        return [res async for res in apaginate(api.acall, lambda res: res, prefetch=2)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_paginate_partitions_merges_and_deduplicates():
+    def api_call(part: int, start_cursor: Optional[str] = None) -> dict[str, Any]:
+        # Each partition returns two batches and overlaps with the previous
+        # partition by one result.
+        batch = int(start_cursor) if start_cursor else 0
+        ids = [part * 4 + batch * 2 + i for i in range(2)]
+        if part and not batch:
+            ids.insert(0, part * 4 - 1)
+        return {
+            "results": [{"id": str(id)} for id in ids],
+            "has_more": batch == 0,
+            "next_cursor": "1" if batch == 0 else None,
+        }
+
+    results = list(
+        paginate_partitions(
+            api_call, lambda res: res["id"], [{"part": i} for i in range(3)]
+        )
+    )
+
+    assert sorted(results, key=int) == [str(i) for i in range(12)]
+
+
+def test_paginate_partitions_raises_errors():
+    def api_call(part: int, start_cursor: Optional[str] = None) -> dict[str, Any]:
+        if part == 1:
+            raise RuntimeError("failed")
+        return {"results": [{"id": "1"}], "has_more": False, "next_cursor": None}
+
+    with pytest.raises(RuntimeError):
+        list(paginate_partitions(api_call, lambda res: res, [{"part": 0}, {"part": 1}]))
@@ -0,0 +1,91 @@
+import copy
+import json
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Callable
+
+import httpx
+
+from nopy.client import NotionClient
+from nopy.objects.page import Page
+from nopy.props.common import Date
+from nopy.values import Projection
+from nopy.values import extract_value
+
+
+def test_extract_value(full_page: dict[str, Any]):
+
+    props = full_page["properties"]
+
+    assert extract_value(props["New DB"]) == "Page title"
+    assert extract_value(props["Created text"]) == "some text"
+    assert extract_value(props["Created number"]) == 123
+    assert extract_value(props["Checkbox"]) is False
+    assert extract_value(props["Created select"]) == "Option One"
+    assert extract_value(props["Status"]) == "Not started"
+    assert extract_value(props["Multi select"]) == ["Optio Two", "Option Three"]
+    assert isinstance(extract_value(props["Date"]), Date)
+    assert extract_value(props["Created time"]) == datetime(
+        2022, 12, 23, 8, 50, tzinfo=timezone.utc
+    )
+    assert extract_value(props["Peeps"]) == ["user-id"]
+    assert extract_value(props["Created by"]) == "user-id"
+    assert extract_value(props["Relate me"]) == ["page-id"]
+    assert extract_value(props["Files & media"]) == ["some url"]
+    assert extract_value(props["calculate"]) == 3
+    assert extract_value(props["Rollup"]) == 0
+
+
+def test_extract_title_of_several_spans(normal_page: dict[str, Any]):
+
+    title = normal_page["properties"]["title"]
+    span = copy.deepcopy(title["title"][0])
+    span["text"]["content"] = span["plain_text"] = " in bold "
+    span["annotations"]["bold"] = True
+    title["title"].append(span)
+
+    page = Page.from_dict(copy.deepcopy(normal_page))
+    projected = Projection(["title"]).project(normal_page)
+
+    assert projected == {"title": page.title}
+    assert extract_value(title) == page.title == "Trial Root Page in bold"
+
+
+def test_extract_unknown_value():
+
+    prop = {"id": "id", "type": "unique_id", "unique_id": {"number": 1}}
+
+    assert extract_value(prop) == {"number": 1}
+
+
+def test_projection(full_page: dict[str, Any]):
+
+    fields = ["Created number", "Status", "sXRE", "Missing"]
+
+    assert Projection(fields).project(full_page) == {
+        "Created number": 123,
+        "Status": "Not started",
+        "sXRE": 123,
+        "Missing": None,
+    }
+    assert Projection(fields, as_tuples=True).project(full_page) == (
+        123,
+        "Not started",
+        123,
+        None,
+    )
+
+
+def test_query_db_fields(
+    full_page: dict[str, Any], make_client: Callable[..., NotionClient]
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {"results": [full_page] * 3, "has_more": False, "next_cursor": None}
+        return httpx.Response(200, content=json.dumps(body))
+
+    client = make_client(handler)
+
+    rows = list(client.query_db("db-id", fields=["Status", "Created number"]))
+
+    assert rows == [{"Status": "Not started", "Created number": 123}] * 3